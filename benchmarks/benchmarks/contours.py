@@ -0,0 +1,60 @@
+"""
+Benchmarks of the contours operation.
+"""
+import numpy as np
+
+from holoviews import Image
+from holoviews.element.util import contour_levels, marching_squares
+from holoviews.operation import contours
+
+
+class Contours(object):
+    """
+    Contour lines and filled contours of a smooth image with many
+    closed and open contours.
+    """
+
+    params = ([100, 1000], [False, True])
+    param_names = ['size', 'filled']
+
+    def setup(self, size, filled):
+        xs = np.linspace(0, 10, size)
+        ys, xs = np.meshgrid(xs, xs, indexing='ij')
+        zs = np.sin(xs)*np.cos(ys) + 0.1*np.sin(xs*ys/2.)
+        self.image = Image(zs, bounds=(0, 0, 10, 10))
+
+    def time_contours(self, size, filled):
+        contours(self.image, levels=10, filled=filled)
+
+
+class MarchingSquares(object):
+    """
+    Speed of marching_squares relative to the matplotlib contour
+    generator on the same grid and levels.
+    """
+
+    params = ([1000, 2000], [10, 50], [False, True], ['holoviews', 'matplotlib'])
+    param_names = ['size', 'levels', 'filled', 'method']
+
+    def setup(self, size, levels, filled, method):
+        xs = np.linspace(0, 10, size)
+        self.ys, self.xs = np.meshgrid(xs, xs, indexing='ij')
+        self.zs = np.sin(self.xs)*np.cos(self.ys) + 0.1*np.sin(self.xs*self.ys/2.)
+        self.levels = contour_levels(self.zs.min(), self.zs.max(), levels)
+        if method == 'matplotlib':
+            try:
+                from matplotlib._contour import QuadContourGenerator
+            except ImportError:
+                raise NotImplementedError('matplotlib is not available')
+            mask = np.zeros(self.zs.shape, dtype=bool)
+            self.generator = QuadContourGenerator(self.xs, self.ys, self.zs, mask, True, 0)
+
+    def time_marching_squares(self, size, levels, filled, method):
+        if method == 'holoviews':
+            marching_squares(self.xs, self.ys, self.zs, self.levels, filled=filled)
+        elif filled:
+            for lower, upper in zip(self.levels[:-1], self.levels[1:]):
+                self.generator.create_filled_contour(lower, upper)
+        else:
+            for level in self.levels:
+                self.generator.create_contour(level)
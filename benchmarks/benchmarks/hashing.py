@@ -0,0 +1,66 @@
+"""
+Benchmarks of the content hashing used to memoize DynamicMap callbacks.
+"""
+import numpy as np
+import pandas as pd
+
+from holoviews.core.util import config, deephash
+from holoviews.streams import Pipe
+
+
+class DeepHashArray(object):
+    """
+    Hash cost of numpy arrays as a function of payload size.
+    """
+
+    params = ([10**3, 10**5, 10**7], [None, 10**6])
+    param_names = ['size', 'fingerprint_size']
+
+    def setup(self, size, fingerprint_size):
+        self.array = np.random.rand(size)
+        self._fingerprint = config.hash_fingerprint_size
+        config.hash_fingerprint_size = fingerprint_size
+
+    def teardown(self, size, fingerprint_size):
+        config.hash_fingerprint_size = self._fingerprint
+
+    def time_deephash_array(self, size, fingerprint_size):
+        deephash(self.array)
+
+
+class DeepHashDataFrame(object):
+    """
+    Hash cost of pandas DataFrames as a function of payload size.
+    """
+
+    params = ([10**3, 10**5, 10**6], [None, 10**6])
+    param_names = ['size', 'fingerprint_size']
+
+    def setup(self, size, fingerprint_size):
+        self.df = pd.DataFrame({'x': np.arange(size), 'y': np.random.rand(size),
+                                'z': np.random.choice(list('ABC'), size)})
+        self._fingerprint = config.hash_fingerprint_size
+        config.hash_fingerprint_size = fingerprint_size
+
+    def teardown(self, size, fingerprint_size):
+        config.hash_fingerprint_size = self._fingerprint
+
+    def time_deephash_dataframe(self, size, fingerprint_size):
+        deephash(self.df)
+
+
+class PipeHashkey(object):
+    """
+    Cost of repeatedly computing the memoization key of a Pipe
+    holding a large array, which is cached between updates.
+    """
+
+    params = [10**5, 10**7]
+    param_names = ['size']
+
+    def setup(self, size):
+        self.pipe = Pipe(data=np.random.rand(size), memoize=True)
+
+    def time_pipe_hashkey(self, size):
+        for _ in range(10):
+            self.pipe.hashkey
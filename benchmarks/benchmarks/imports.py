@@ -0,0 +1,16 @@
+"""
+Benchmarks of the time taken to import holoviews in a fresh process.
+"""
+
+
+class ImportHoloViews(object):
+    """
+    Import cost of holoviews itself, which should not include
+    IPython, the plotting extensions or optional data backends.
+    """
+
+    def timeraw_import_holoviews(self):
+        return "import holoviews"
+
+    def timeraw_import_holoviews_extension(self):
+        return "import holoviews; holoviews.extension('matplotlib')"
@@ -0,0 +1,54 @@
+"""
+Benchmarks of the scipy and FFT kernel density estimates.
+"""
+import numpy as np
+
+from holoviews import Bivariate, Distribution
+from holoviews.operation.stats import bivariate_kde, univariate_kde
+
+
+class UnivariateKDE(object):
+    """
+    Speed and accuracy of the FFT KDE relative to scipy's gaussian_kde.
+    """
+
+    params = ([10**3, 10**5], ['scipy', 'fft'])
+    param_names = ['samples', 'method']
+
+    def setup(self, samples, method):
+        np.random.seed(1)
+        values = np.concatenate([np.random.randn(samples//2),
+                                 np.random.randn(samples//2)*0.3+4])
+        self.dist = Distribution(values)
+
+    def time_univariate_kde(self, samples, method):
+        univariate_kde(self.dist, method=method)
+
+    def track_max_relative_error(self, samples, method):
+        reference = univariate_kde(self.dist, method='scipy').dimension_values(1)
+        density = univariate_kde(self.dist, method=method).dimension_values(1)
+        return np.abs(density-reference).max()/reference.max()
+
+
+class BivariateKDE(object):
+    """
+    Speed and accuracy of the 2D FFT KDE relative to scipy's
+    gaussian_kde.
+    """
+
+    params = ([10**3, 10**4], ['scipy', 'fft'])
+    param_names = ['samples', 'method']
+
+    def setup(self, samples, method):
+        np.random.seed(1)
+        cov = [[1, 0.8], [0.8, 1]]
+        self.bivariate = Bivariate(np.random.multivariate_normal([0, 0], cov, samples))
+
+    def time_bivariate_kde(self, samples, method):
+        bivariate_kde(self.bivariate, contours=False, method=method)
+
+    def track_max_relative_error(self, samples, method):
+        reference = bivariate_kde(self.bivariate, contours=False, method='scipy')
+        density = bivariate_kde(self.bivariate, contours=False, method=method)
+        reference, density = reference.dimension_values(2), density.dimension_values(2)
+        return np.abs(density-reference).max()/reference.max()
@@ -0,0 +1,30 @@
+"""
+Benchmarks of streaming data into a Buffer.
+"""
+import numpy as np
+import pandas as pd
+
+from holoviews.streams import Buffer
+
+
+class BufferSend(object):
+    """
+    Cost of sending small chunks into a full Buffer with and without
+    the ring buffer.
+    """
+
+    params = (['dict', 'dataframe'], [False, True])
+    param_names = ['datatype', 'ring']
+
+    def setup(self, datatype, ring):
+        length, chunk = 10**6, 50
+        data = {'x': np.arange(length, dtype='float64'), 'y': np.random.rand(length)}
+        self.chunk = {'x': np.arange(chunk, dtype='float64'), 'y': np.random.rand(chunk)}
+        if datatype == 'dataframe':
+            data, self.chunk = pd.DataFrame(data), pd.DataFrame(self.chunk)
+        self.buffer = Buffer(data, length=length, ring=ring)
+        self.buffer.send(self.chunk)
+
+    def time_buffer_send(self, datatype, ring):
+        for _ in range(10):
+            self.buffer.send(self.chunk)
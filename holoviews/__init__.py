@@ -1,6 +1,6 @@
 
 from __future__ import print_function, absolute_import
-import os, pydoc
+import os, sys, pydoc
 
 import numpy as np # noqa (API import)
 import param
@@ -34,14 +34,24 @@ import warnings
 warnings.filterwarnings("ignore",
                         message="elementwise comparison failed; returning scalar instead")
 
-try:
-    import IPython                 # noqa (API import)
-    from .ipython import notebook_extension
-    extension = notebook_extension # noqa (name remapping)
-except ImportError:
+# The notebook extension pulls in IPython and the plotting machinery,
+# so it is only loaded eagerly when running inside an IPython session
+notebook_extension = None
+if 'IPython' in sys.modules:
+    try:
+        from .ipython import notebook_extension
+        extension = notebook_extension # noqa (name remapping)
+    except ImportError:
+        pass
+
+if notebook_extension is None:
     class notebook_extension(param.ParameterizedFunction):
         def __call__(self, *args, **opts): # noqa (dummy signature)
-            raise Exception("IPython notebook not available: use hv.extension instead.")
+            try:
+                from .ipython import notebook_extension
+            except ImportError:
+                raise Exception("IPython notebook not available: use hv.extension instead.")
+            return notebook_extension(*args, **opts)
 
 # A single holoviews.rc file may be executed if found.
 for rcfile in [os.environ.get("HOLOVIEWSRC", ''),
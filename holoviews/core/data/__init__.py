@@ -13,11 +13,12 @@ from ..dimension import redim, Dimension, process_dimensions
 from ..element import Element
 from ..ndmapping import OrderedDict
 from ..spaces import HoloMap, DynamicMap
-from .interface import Interface, iloc, ndloc
+from .interface import Interface, DataStatistics, iloc, ndloc
 from .array import ArrayInterface
 from .dictionary import DictInterface
 from .grid import GridInterface
 from .multipath import MultiInterface         # noqa (API import)
+from .ragged import RaggedInterface, RaggedData # noqa (API import)
 from .image import ImageInterface             # noqa (API import)
 
 default_datatype = 'dictionary'
@@ -52,6 +53,8 @@ if 'array' not in datatypes:
     datatypes.append('array')
 if 'multitabular' not in datatypes:
     datatypes.append('multitabular')
+if 'ragged' not in datatypes:
+    datatypes.append('ragged')
 
 
 def concat(datasets, datatype=None):
@@ -215,11 +218,15 @@ class Dataset(Element):
         kdims, vdims = kwargs.get('kdims'), kwargs.get('vdims')
 
         validate_vdims = kwargs.pop('_validate_vdims', True)
+        trusted = kwargs.pop('_interface', None)
         initialized = Interface.initialize(type(self), data, kdims, vdims,
-                                           datatype=kwargs.get('datatype'))
+                                           datatype=kwargs.get('datatype'),
+                                           trusted=trusted)
         (data, self.interface, dims, extra_kws) = initialized
         super(Dataset, self).__init__(data, **dict(kwargs, **dict(dims, **extra_kws)))
-        self.interface.validate(self, validate_vdims)
+        if self.interface is not trusted:
+            self.interface.validate(self, validate_vdims)
+            DataStatistics.invalidate(self)
 
         self.redim = redim(self, mode='dataset')
 
@@ -274,6 +281,9 @@ class Dataset(Element):
         dimension_range:
             Whether to compute the range including the Dimension range
             and soft_range
+
+        The data range is cached on the underlying data and shared by
+        all datasets wrapping the same data (see DataStatistics).
         """
         dim = self.get_dimension(dim)
 
@@ -282,7 +292,7 @@ class Dataset(Element):
         elif all(util.isfinite(v) for v in dim.range) and dimension_range:
             return dim.range
         elif dim in self.dimensions() and data_range and len(self):
-            lower, upper = self.interface.range(self, dim)
+            lower, upper = DataStatistics.range(self, dim)
         else:
             lower, upper = (np.NaN, np.NaN)
         if not dimension_range:
@@ -342,7 +352,7 @@ class Dataset(Element):
         if np.isscalar(data):
             return data
         else:
-            return self.clone(data)
+            return self.clone(data, **self.interface.trusted_kwargs(type(self)))
 
 
     def reindex(self, kdims=None, vdims=None):
@@ -481,6 +491,60 @@ class Dataset(Element):
         return self.clone(self.interface.sample(self, samples), new_type=Table)
 
 
+    def interpolate(self, samples=[], method='nearest', mask=False, **kwargs):
+        """
+        Samples a gridded Dataset at a large number of arbitrary
+        coordinates in one vectorized pass, returning a Table of the
+        supplied coordinates and the sampled values. The coordinates
+        may be supplied as a list of tuples, an (N, ndims) array or as
+        a dictionary or keyword arguments mapping from each key
+        dimension to an array of coordinates.
+
+        The method may be 'nearest' to look up the value of the
+        closest grid point, or 'linear' (or 'bilinear' for 2D grids)
+        to interpolate between the surrounding grid points. By
+        default coordinates outside the grid raise an IndexError, if
+        mask is enabled the corresponding values are set to NaN.
+        """
+        if not self.interface.gridded:
+            raise NotImplementedError("Interpolation is only supported "
+                                      "on gridded datasets.")
+        if kwargs and len(samples):
+            raise Exception('Supply explicit list of samples or kwargs, not both.')
+        elif kwargs or isinstance(samples, dict):
+            coords = dict(kwargs or samples)
+            coords = {self.get_dimension(d, strict=True).name: v
+                      for d, v in coords.items()}
+            missing = [kd.name for kd in self.kdims if kd.name not in coords]
+            if missing:
+                raise ValueError('Coordinates for the %s dimension(s) were '
+                                 'not supplied.' % ', '.join(missing))
+            columns = [coords[kd.name] for kd in self.kdims]
+        elif isinstance(samples, np.ndarray):
+            columns = list(np.atleast_2d(samples).T)
+        else:
+            columns = list(zip(*[util.wrap_tuple(s) for s in samples]))
+            if not columns:
+                columns = [[] for _ in self.kdims]
+
+        if len(columns) != self.ndims:
+            raise IndexError('Sample coordinates must match the %d key '
+                             'dimensions.' % self.ndims)
+        arrays = []
+        for column in columns:
+            column = np.asarray(column)
+            if column.dtype.kind == 'O' and len(column) and isinstance(column[0], util.datetime_types):
+                column = column.astype('datetime64[ns]')
+            arrays.append(np.atleast_1d(column))
+        if len(set(len(a) for a in arrays)) > 1:
+            raise IndexError('Sample coordinates must all be of the same length.')
+
+        from ...element import Table
+        data = OrderedDict([(kd.name, a) for kd, a in zip(self.kdims, arrays)])
+        data.update(self.interface.interpolate(self, arrays, method, mask))
+        return self.clone(data, new_type=Table, datatype=['dataframe', 'dict'])
+
+
     def reduce(self, dimensions=[], function=None, spreadfn=None, **reduce_map):
         """
         Allows reducing the values along one or more key dimension with
@@ -669,6 +733,9 @@ class Dataset(Element):
         if 'datatype' not in overrides:
             datatypes = [self.interface.datatype] + self.datatype
             overrides['datatype'] = list(util.unique_iterator(datatypes))
+        if data is None and shared_data:
+            # Shared data does not have to be initialized and validated again
+            overrides.update(self.interface.trusted_kwargs(new_type or type(self), **overrides))
         return super(Dataset, self).clone(data, shared_data, new_type, *args, **overrides)
 
 
@@ -88,6 +88,11 @@ class ArrayInterface(Interface):
         return len(np.unique(dataset.data[:, idx])) == 1
 
 
+    @classmethod
+    def column_source(cls, dataset, dimension):
+        return dataset.data, (dataset.get_dimension_index(dimension),)
+
+
     @classmethod
     def array(cls, dataset, dimensions):
         if dimensions:
@@ -148,32 +153,25 @@ class ArrayInterface(Interface):
                  if kdim not in dimensions]
         vdims = dataset.vdims
 
-        # Find unique entries along supplied dimensions
-        # by creating a view that treats the selected
-        # groupby keys as a single object.
-        indices = data[:, dim_idxs].copy()
-        group_shape = indices.dtype.itemsize * indices.shape[1]
-        view = indices.view(np.dtype((np.void, group_shape)))
-        _, idx = np.unique(view, return_index=True)
-        idx.sort()
-        unique_indices = indices[idx]
+        # Find the unique keys and sort the rows by group
+        first, index, offsets = util.group_indices([data[:, i] for i in dim_idxs])
+        unique_indices = data[first][:, dim_idxs]
 
         # Get group
         group_kwargs = {}
         if group_type != 'raw' and issubclass(group_type, Element):
             group_kwargs.update(util.get_param_values(dataset))
+            group_kwargs.update(cls.trusted_kwargs(group_type, **kwargs))
             group_kwargs['kdims'] = kdims
         group_kwargs.update(kwargs)
 
-        # Iterate over the unique entries building masks
-        # to apply the group selection
+        # Split the sorted rows into contiguous groups
         grouped_data = []
         col_idxs = [dataset.get_dimension_index(d) for d in dataset.dimensions()
                     if d not in dimensions]
-        for group in unique_indices:
-            mask = np.logical_and.reduce([data[:, d_idx] == group[i]
-                                          for i, d_idx in enumerate(dim_idxs)])
-            group_data = data[mask][:, col_idxs]
+        sorted_data = data[index][:, col_idxs]
+        for group, start, end in zip(unique_indices, offsets[:-1], offsets[1:]):
+            group_data = sorted_data[start:end]
             if not group_type == 'raw':
                 if issubclass(group_type, dict):
                     group_data = {d.name: group_data[:, i] for i, d in
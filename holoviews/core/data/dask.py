@@ -13,10 +13,17 @@ from .. import util
 from ..dimension import Dimension
 from ..element import Element
 from ..ndmapping import NdMapping, item_check, OrderedDict, sorted_context
-from .interface import Interface
+from .interface import Interface, DataStatistics
 from .pandas import PandasInterface
 
 
+def _sort_group(df, order):
+    """
+    Restores the original order of the rows in a shuffled group.
+    """
+    return df.sort_values(order).drop(order, axis=1).reset_index(drop=True)
+
+
 class DaskInterface(PandasInterface):
     """
     The DaskInterface allows a Dataset objects to wrap a dask
@@ -72,17 +79,78 @@ class DaskInterface(PandasInterface):
 
     @classmethod
     def shape(cls, dataset):
-        return (len(dataset.data), len(dataset.data.columns))
+        return (cls.length(dataset), len(dataset.data.columns))
+
+    @classmethod
+    def length(cls, dataset):
+        return DataStatistics.lookup(dataset, None, 'length',
+                                     lambda: len(dataset.data))
+
+    @classmethod
+    def _range_task(cls, column):
+        if column.dtype.kind == 'O':
+            return column.dropna().unique()
+        return column.min(), column.max()
+
+    @classmethod
+    def _range_result(cls, column, result):
+        if column.dtype.kind == 'O':
+            values = np.sort(np.asarray(result))
+            return (values[0], values[-1]) if len(values) else (None, None)
+        return tuple(result)
 
     @classmethod
     def range(cls, dataset, dimension):
         import dask.dataframe as dd
         column = dataset.data[dataset.get_dimension(dimension).name]
-        if column.dtype.kind == 'O':
-            column = np.sort(column[column.notnull()].compute())
-            return (column[0], column[-1]) if len(column) else (None, None)
-        else:
-            return dd.compute(column.min(), column.max())
+        return cls._range_result(column, dd.compute(cls._range_task(column))[0])
+
+    @classmethod
+    def prefetch(cls, dataset, dimensions=None, statistics=('range',)):
+        """
+        Computes the supplied statistics ('range', 'nan_count' and
+        'unique') for all dimensions along with the length of the
+        dataframe in a single dask graph, ensuring the data is only
+        scanned once, and caches the results (see DataStatistics).
+        """
+        import dask.dataframe as dd
+        data = dataset.data
+        dimensions = dataset.dimensions() if dimensions is None else dimensions
+        keys, tasks = [], []
+        if DataStatistics.cached(dataset, None, 'length') is None:
+            keys.append((None, 'length'))
+            tasks.append(data.index.size)
+        for dim in dimensions:
+            dim = dataset.get_dimension(dim)
+            if dim is None or dim.name not in data.columns:
+                continue
+            column = data[dim.name]
+            for stat in statistics:
+                if DataStatistics.cached(dataset, dim, stat) is not None:
+                    continue
+                elif stat == 'range':
+                    task = cls._range_task(column)
+                elif stat == 'nan_count':
+                    task = column.isnull().sum()
+                elif stat == 'unique':
+                    task = column.unique()
+                else:
+                    raise ValueError('Statistic %r cannot be prefetched.' % stat)
+                keys.append((dim, stat))
+                tasks.append(task)
+
+        if not tasks:
+            return
+        for (dim, stat), result in zip(keys, dd.compute(*tasks)):
+            if stat == 'length':
+                result = int(result)
+            elif stat == 'range':
+                result = cls._range_result(data[dim.name], result)
+            elif stat == 'nan_count':
+                result = int(result)
+            elif stat == 'unique':
+                result = np.asarray(result)
+            DataStatistics.store(dataset, dim, stat, result)
 
     @classmethod
     def sort(cls, dataset, by=[], reverse=False):
@@ -94,7 +162,8 @@ class DaskInterface(PandasInterface):
         dim = dataset.get_dimension(dim)
         data = dataset.data[dim.name]
         if not expanded:
-            data = data.unique()
+            return DataStatistics.lookup(dataset, dim, 'unique',
+                                         lambda: data.unique().compute().values)
         return data.compute().values
 
     @classmethod
@@ -162,35 +231,59 @@ class DaskInterface(PandasInterface):
         if group_type != 'raw' and issubclass(group_type, Element):
             group_kwargs = dict(util.get_param_values(dataset),
                                 kdims=element_dims)
+            group_kwargs.update(cls.trusted_kwargs(group_type, **kwargs))
         group_kwargs.update(kwargs)
 
         data = []
         group_by = [d.name for d in index_dims]
-        groupby = dataset.data.groupby(group_by)
+        keys = cls._group_keys(dataset, group_by)
+        if len(keys):
+            # Shuffle the rows of each group into a separate partition,
+            # so that each group is computed from a single partition
+            # rather than filtering the whole dataframe for every group.
+            # The original row order is restored within each group and
+            # the shuffle is persisted so it only runs once.
+            index, order = '__group_index__', '__group_order__'
+            codes = keys.assign(**{index: np.arange(len(keys))})
+            df = dataset.data.assign(**{order: 1})
+            df = df.assign(**{order: df[order].cumsum()})
+            coded = df.merge(codes, on=group_by, how='inner')
+            divisions = list(range(len(keys))) + [len(keys)-1]
+            shuffled = coded.set_index(index, divisions=divisions)
+            shuffled = shuffled.map_partitions(_sort_group, order).persist()
+            for i, coord in enumerate(keys.itertuples(index=False)):
+                coord = tuple(coord)
+                if len(coord) == 1:
+                    coord = coord[0]
+                partition = shuffled.get_partition(i)
+                data.append((coord, group_type(partition, **group_kwargs)))
+        if issubclass(container_type, NdMapping):
+            with item_check(False), sorted_context(False):
+                return container_type(data, kdims=index_dims)
+        else:
+            return container_type(data)
+
+    @classmethod
+    def _group_keys(cls, dataset, group_by):
+        """
+        Returns a pandas DataFrame of the unique non-null combinations
+        of values along the supplied columns, in order of appearance.
+        """
         if len(group_by) == 1:
             column = dataset.data[group_by[0]]
+            values = None
             if column.dtype.name == 'category':
                 try:
-                    indices = ((ind,) for ind in column.cat.categories)
+                    values = np.asarray(column.cat.categories)
                 except NotImplementedError:
-                    indices = ((ind,) for ind in column.unique().compute())
-            else:
-                indices = ((ind,) for ind in column.unique().compute())
+                    pass
+            if values is None:
+                dim = dataset.get_dimension(group_by[0])
+                values = dataset.interface.values(dataset, dim, expanded=False)
+            keys = pd.DataFrame({group_by[0]: values})
         else:
-            group_tuples = dataset.data[group_by].itertuples()
-            indices = util.unique_iterator(ind[1:] for ind in group_tuples)
-        for coord in indices:
-            if any(isinstance(c, float) and np.isnan(c) for c in coord):
-                continue
-            if len(coord) == 1:
-                coord = coord[0]
-            group = group_type(groupby.get_group(coord), **group_kwargs)
-            data.append((coord, group))
-        if issubclass(container_type, NdMapping):
-            with item_check(False), sorted_context(False):
-                return container_type(data, kdims=index_dims)
-        else:
-            return container_type(data)
+            keys = dataset.data[group_by].drop_duplicates().compute()
+        return keys.dropna().reset_index(drop=True)
 
     @classmethod
     def aggregate(cls, dataset, dimensions, function, **kwargs):
@@ -233,6 +233,12 @@ class DictInterface(Interface):
                             for d, v in dataset.data.items()])
 
 
+    @classmethod
+    def column_source(cls, dataset, dimension):
+        column = dataset.data.get(dataset.get_dimension(dimension, strict=True).name)
+        return (column, ()) if isinstance(column, np.ndarray) else None
+
+
     @classmethod
     def range(cls, dataset, dimension):
         dim = dataset.get_dimension(dimension)
@@ -276,21 +282,29 @@ class DictInterface(Interface):
         group_type = dict if group_type == 'raw' else group_type
         if issubclass(group_type, Element):
             group_kwargs.update(util.get_param_values(dataset))
+            group_kwargs.update(cls.trusted_kwargs(group_type, **kwargs))
             group_kwargs['kdims'] = kdims
         group_kwargs.update(kwargs)
 
-        # Find all the keys along supplied dimensions
-        keys = (tuple(dataset.data[d.name] if isscalar(dataset.data[d.name])
-                      else dataset.data[d.name][i] for d in dimensions)
-                for i in range(len(dataset)))
+        # Find the unique keys and sort the rows by group
+        key_columns = [dataset.data[d.name] for d in dimensions]
+        array_keys = [col for col in key_columns if not isscalar(col)]
+        first, index, offsets = util.group_indices(array_keys)
+        if not array_keys and len(dataset):
+            first, index, offsets = [0], np.arange(len(dataset)), [0, len(dataset)]
+        if key_columns:
+            keys = zip(*[[col]*len(first) if isscalar(col) else col[first]
+                         for col in key_columns])
+        else:
+            keys = [()]*len(first)
 
-        # Iterate over the unique entries applying selection masks
+        # Split the sorted columns into contiguous groups
+        columns = [(d.name, dataset.data[d.name]) for d in kdims+vdims]
+        columns = [(n, col if isscalar(col) else col[index]) for n, col in columns]
         grouped_data = []
-        for unique_key in util.unique_iterator(keys):
-            mask = cls.select_mask(dataset, dict(zip(dimensions, unique_key)))
-            group_data = OrderedDict(((d.name, dataset.data[d.name] if isscalar(dataset.data[d.name])
-                                       else dataset.data[d.name][mask])
-                                      for d in kdims+vdims))
+        for unique_key, start, end in zip(keys, offsets[:-1], offsets[1:]):
+            group_data = OrderedDict((n, col if isscalar(col) else col[start:end])
+                                     for n, col in columns)
             group_data = group_type(group_data, **group_kwargs)
             grouped_data.append((unique_key, group_data))
 
@@ -452,6 +452,76 @@ class GridInterface(DictInterface):
         return mask
 
 
+    @classmethod
+    def key_select_slice(cls, values, ind):
+        """
+        Resolves a range selection on monotonically increasing or
+        decreasing 1D coordinates to a slice of integer indices using
+        bisection, returning None if the selection cannot be expressed
+        as a slice (e.g. for sets, callables or irregular coordinates).
+        The resulting slice selects the same coordinates as the mask
+        computed by key_select_mask.
+        """
+        if ind is None:
+            return slice(None)
+        elif isinstance(ind, tuple):
+            ind = slice(*ind)
+        if (not isinstance(ind, slice) or ind.step is not None or
+            not isinstance(values, np.ndarray) or values.ndim != 1 or
+            values.dtype.kind not in 'iufM'):
+            return None
+        elif len(values) < 2:
+            return slice(None) if ind == slice(None) else None
+        diffs = np.diff(values)
+        if values.dtype.kind == 'M':
+            diffs = diffs.astype('int64')
+        ascending = (diffs > 0).all()
+        if not ascending and not (diffs < 0).all():
+            return None
+        ordered = values if ascending else values[::-1]
+        try:
+            start = 0 if ind.start is None else ordered.searchsorted(ind.start, 'left')
+            stop = len(values) if ind.stop is None else ordered.searchsorted(ind.stop, 'left')
+        except Exception:
+            return None
+        stop = max(start, stop)
+        if ascending:
+            return slice(start, stop)
+        return slice(len(values)-stop, len(values)-start)
+
+
+    @classmethod
+    def _select_slices(cls, dataset, full_selection):
+        """
+        Applies a selection consisting only of ranges along regularly
+        sampled, monotonic coordinates using basic slicing, returning
+        views of the coordinate and value arrays (or lazy slices of
+        dask arrays) rather than copies. Returns None if the selection
+        cannot be expressed as slices.
+        """
+        if dataset._binned:
+            return None
+        slices = []
+        for dim, ind in full_selection:
+            if cls.irregular(dataset, dim):
+                return None
+            slc = cls.key_select_slice(cls.coords(dataset, dim, False), ind)
+            if slc is None:
+                return None
+            slices.append(slc)
+
+        data = {dim.name: cls.coords(dataset, dim, False)[slc]
+                for (dim, _), slc in zip(full_selection, slices)}
+        index = tuple(slices[::-1])
+        da = dask_array_module()
+        for vdim in dataset.vdims:
+            arr = dataset.data[vdim.name]
+            if not (isinstance(arr, np.ndarray) or (da and isinstance(arr, da.Array))):
+                arr = np.asarray(arr)
+            data[vdim.name] = arr[index]
+        return data
+
+
     @classmethod
     def select(cls, dataset, selection_mask=None, **selection):
         dimensions = dataset.kdims
@@ -463,6 +533,12 @@ class GridInterface(DictInterface):
         indexed = cls.indexed(dataset, selection)
         full_selection = [(d, selection.get(d.name, selection.get(d.label)))
                           for d in dimensions]
+        if not indexed:
+            # Contiguous ranges on sorted coordinates select views of the data
+            data = cls._select_slices(dataset, full_selection)
+            if data is not None:
+                return data
+
         data = {}
         value_select = []
         for i, (dim, ind) in enumerate(full_selection):
@@ -541,6 +617,10 @@ class GridInterface(DictInterface):
         ndims = dataset.ndims
         dimensions = dataset.dimensions(label='name')
         arrays = [dataset.data[vdim.name] for vdim in dataset.vdims]
+        sampled = cls._sample_points(dataset, samples)
+        if sampled is not None:
+            return sampled
+
         data = defaultdict(list)
 
         for sample in samples:
@@ -568,6 +648,149 @@ class GridInterface(DictInterface):
         return concatenated
 
 
+    @classmethod
+    def _sample_points(cls, dataset, samples):
+        """
+        Vectorized implementation of sample for the common case of
+        scalar coordinates along all key dimensions of a regular,
+        unbinned grid, looking up all samples with one bisection
+        per axis. Returns None if the samples cannot be handled.
+        """
+        ndims = dataset.ndims
+        if (not samples or dataset._binned or
+            any(cls.irregular(dataset, kd) for kd in dataset.kdims)):
+            return None
+        for s in samples:
+            if (np.isscalar(s) or len(s) != ndims or
+                not all(np.isscalar(v) or isinstance(v, util.datetime_types) for v in s)):
+                return None
+
+        indices, found = [], True
+        for kd, values in zip(dataset.kdims, zip(*samples)):
+            cdata = dataset.data[kd.name]
+            values = np.asarray(values)
+            kinds = (cdata.dtype.kind, values.dtype.kind)
+            if not len(cdata) or not (kinds[0] == kinds[1] or set(kinds) <= set('iuf')):
+                return None
+            order = np.argsort(cdata, kind='mergesort')
+            ordered = cdata[order]
+            index = np.clip(np.searchsorted(ordered, values), 0, len(ordered)-1)
+            if ndims == 1:
+                lower = np.clip(index-1, 0, len(ordered)-1)
+                closer = np.abs(ordered[lower]-values) <= np.abs(ordered[index]-values)
+                index = np.where(closer & (ordered[index] != values), lower, index)
+            else:
+                found = found & (ordered[index] == values)
+            indices.append(order[index])
+
+        if found is not True:
+            indices = [index[found] for index in indices]
+        data = OrderedDict()
+        for kd, index in zip(dataset.kdims, indices):
+            data[kd.name] = dataset.data[kd.name][index]
+        da = dask_array_module()
+        for vd in dataset.vdims:
+            array = dataset.data[vd.name]
+            if da and isinstance(array, da.Array):
+                flat_index = np.ravel_multi_index(tuple(indices)[::-1], array.shape)
+                data[vd.name] = array.flatten().vindex[flat_index]
+            else:
+                data[vd.name] = array[tuple(indices)[::-1]]
+        return data
+
+
+    @classmethod
+    def _sample_axis(cls, coords, values, method):
+        """
+        Maps an array of values onto a 1D array of ascending
+        coordinates in a single bisection pass, returning the lower
+        index for each value, the interpolation weight of the next
+        coordinate (None for nearest neighbor lookup) and a mask of
+        the values which lie outside the coordinates.
+        """
+        if coords.dtype.kind == 'M' or values.dtype.kind == 'M':
+            coords = coords.astype('datetime64[ns]').astype('int64')
+            values = values.astype('datetime64[ns]').astype('int64')
+        coords = coords.astype('float64')
+        values = values.astype('float64')
+        n = len(coords)
+        if n < 2:
+            index = np.zeros(len(values), dtype=int)
+            weights = None if method == 'nearest' else np.zeros(len(values))
+            return index, weights, ~(values == coords[0])
+
+        if method == 'nearest':
+            upper = np.clip(np.searchsorted(coords, values), 1, n-1)
+            lower = upper - 1
+            nearest = np.where(values-coords[lower] <= coords[upper]-values, lower, upper)
+            low = coords[0] - (coords[1]-coords[0])/2.
+            high = coords[-1] + (coords[-1]-coords[-2])/2.
+            outside = ~((values >= low) & (values <= high))
+            return nearest, None, outside
+
+        lower = np.clip(np.searchsorted(coords, values, 'right')-1, 0, n-2)
+        weights = (values-coords[lower]) / (coords[lower+1]-coords[lower])
+        outside = ~((values >= coords[0]) & (values <= coords[-1]))
+        return lower, weights, outside
+
+
+    @classmethod
+    def interpolate(cls, dataset, samples, method='nearest', mask=False):
+        """
+        Samples the value dimensions of a regular grid at the supplied
+        coordinates, which should be a list of arrays, one for each
+        key dimension. Each coordinate is mapped to the grid using a
+        single bisection pass per axis and the values are looked up
+        using the nearest neighbor or (multi-)linearly interpolated
+        between the surrounding grid points. Coordinates outside the
+        grid raise an IndexError unless mask is enabled, in which case
+        the corresponding values are set to NaN.
+        """
+        if any(cls.irregular(dataset, kd) for kd in dataset.kdims):
+            raise DataError('Interpolation is only supported on regularly '
+                            'sampled grids.', cls)
+        elif method not in ('nearest', 'linear', 'bilinear'):
+            raise ValueError('Interpolation method must be one of '
+                             "'nearest', 'linear' or 'bilinear', got %r." % method)
+        elif method == 'bilinear' and dataset.ndims != 2:
+            raise ValueError('Bilinear interpolation requires two key '
+                             'dimensions, %s has %d.' % (type(dataset).__name__,
+                                                          dataset.ndims))
+
+        indices, weights, outside = [], [], False
+        for kd, values in zip(dataset.kdims, samples):
+            coords = np.asarray(cls.coords(dataset, kd, ordered=True))
+            index, weight, oob = cls._sample_axis(coords, values, method)
+            indices.append(index)
+            weights.append(weight)
+            outside = outside | oob
+
+        if np.any(outside) and not mask:
+            oob = np.where(outside)[0]
+            coords = [tuple(s[i] for s in samples) for i in oob[:5]]
+            raise IndexError('%d coordinate(s) out of bounds for %s, e.g. %s' %
+                             (len(oob), type(dataset).__name__, coords))
+
+        data = OrderedDict()
+        for vd in dataset.vdims:
+            array = np.asarray(cls.values(dataset, vd, flat=False))
+            if method == 'nearest':
+                values = array[tuple(indices[::-1])]
+            else:
+                values = 0
+                for corner in np.ndindex(*((2,)*len(indices))):
+                    index, weight = [], 1
+                    for offset, ind, w in zip(corner, indices, weights):
+                        index.append(ind+offset)
+                        weight = weight * (w if offset else 1-w)
+                    values = values + weight * array[tuple(index[::-1])]
+            if np.any(outside):
+                values = values.astype('float64') if values.dtype.kind in 'iub' else values
+                values[outside] = np.NaN
+            data[vd.name] = values
+        return data
+
+
     @classmethod
     def aggregate(cls, dataset, kdims, function, **kwargs):
         kdims = [dimension_name(kd) for kd in kdims]
@@ -656,6 +879,11 @@ class GridInterface(DictInterface):
             return new_data[0][0]
         return tuple(new_data)
 
+    @classmethod
+    def column_source(cls, dataset, dimension):
+        # Ranges on gridded data may depend on bounds and binning
+        return None
+
     @classmethod
     def range(cls, dataset, dimension):
         if dataset._binned and dimension in dataset.kdims:
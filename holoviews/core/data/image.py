@@ -227,7 +227,16 @@ class ImageInterface(GridInterface):
         if len(samples[0]) == 1:
             select = {dataset.kdims[0].name: [s[0] for s in samples]}
             return tuple(dataset.select(**select).columns().values())
-        return [c+(dataset.data[dataset._coord2matrix(c)],) for c in samples]
+        xs, ys = (np.array(c) for c in zip(*samples))
+        if len(xs) and isinstance(xs[0], util.datetime_types):
+            xs = xs.astype(np.datetime64)
+        if len(ys) and isinstance(ys[0], util.datetime_types):
+            ys = ys.astype(np.datetime64)
+        rows, cols = dataset._coord2matrix((xs, ys))
+        values = dataset.data[rows, cols]
+        if values.ndim > 1:
+            return (xs, ys) + tuple(values.T)
+        return xs, ys, values
 
 
     @classmethod
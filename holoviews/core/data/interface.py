@@ -2,6 +2,9 @@ from __future__ import absolute_import
 
 import sys
 import warnings
+import weakref
+from collections import defaultdict
+from functools import partial
 
 import param
 import numpy as np
@@ -116,10 +119,218 @@ class ndloc(object):
         return self.dataset.clone(selected, datatype=[ds.interface.datatype]+ds.datatype, **params)
 
 
+def null_count(values):
+    """
+    Counts the number of null (NaN, NaT or None) values in an array.
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in 'fc':
+        return int(np.isnan(values).sum())
+    elif values.dtype.kind == 'M':
+        return int(util.isnat(values).sum())
+    elif values.dtype.kind == 'O':
+        return sum(1 for v in values if v is None or (isinstance(v, float) and np.isnan(v)))
+    return 0
+
+
+class DataStatistics(object):
+    """
+    Cache of statistics computed on the columns of a dataset, such as
+    the range, the number of null values and the number of unique
+    values. Statistics are keyed on the identity of the object holding
+    the column values (as returned by Interface.column_source), so
+    they are shared by all datasets wrapping the same data, e.g. when
+    cloning an element, and are discarded once the data is garbage
+    collected. Since data supplied by the user may be modified in
+    place, statistics on it are invalidated whenever a new dataset is
+    constructed from it or it is sent through a stream, while data
+    produced internally, e.g. by a Buffer stream, is owned by the
+    cache and keeps its statistics. Modifying data in place after an
+    element has been constructed from it must be followed by a call
+    to clear.
+
+    Statistics of the data as a whole, such as its length, may be
+    cached by supplying None as the dimension.
+    """
+
+    _cache = {}
+
+    # Identities of the sources produced internally, which cannot
+    # have been modified in place since their statistics were cached
+    _owned = set()
+
+    @classmethod
+    def _stats(cls, source, create=False):
+        key = id(source)
+        entry = cls._cache.get(key)
+        if entry is not None and entry[0]() is source:
+            return entry[1]
+        elif not create:
+            return None
+        try:
+            ref = weakref.ref(source, partial(cls._discard, key))
+        except TypeError:
+            return None
+        stats = {}
+        cls._cache[key] = (ref, stats)
+        cls._owned.discard(key)
+        return stats
+
+    @classmethod
+    def _discard(cls, key, ref):
+        entry = cls._cache.get(key)
+        if entry is not None and entry[0] is ref:
+            del cls._cache[key]
+            cls._owned.discard(key)
+
+    @classmethod
+    def _source(cls, dataset, dimension):
+        if dimension is None:
+            return dataset.data, ()
+        return dataset.interface.column_source(dataset, dimension)
+
+    @classmethod
+    def cached(cls, dataset, dimension, stat):
+        """
+        Returns the named statistic for the supplied dimension of the
+        dataset if it has been cached and None otherwise.
+        """
+        source = cls._source(dataset, dimension)
+        stats = None if source is None else cls._stats(source[0])
+        return None if stats is None else stats.get(source[1] + (stat,))
+
+    @classmethod
+    def lookup(cls, dataset, dimension, stat, compute):
+        """
+        Returns the named statistic for the supplied dimension of the
+        dataset, calling compute to compute it if it is not cached.
+        """
+        source = cls._source(dataset, dimension)
+        stats = None if source is None else cls._stats(source[0], create=True)
+        if stats is None:
+            return compute()
+        key = source[1] + (stat,)
+        if key not in stats:
+            stats[key] = compute()
+        return stats[key]
+
+    @classmethod
+    def store(cls, dataset, dimension, stat, value):
+        """
+        Caches a precomputed statistic for the supplied dimension of
+        the dataset, e.g. when computing multiple statistics at once.
+        """
+        source = cls._source(dataset, dimension)
+        stats = None if source is None else cls._stats(source[0], create=True)
+        if stats is not None:
+            stats[source[1] + (stat,)] = value
+
+    @classmethod
+    def range(cls, dataset, dimension):
+        "Returns the (cached) range of the dimension."
+        return cls.lookup(dataset, dimension, 'range',
+                          lambda: dataset.interface.range(dataset, dimension))
+
+    @classmethod
+    def nan_count(cls, dataset, dimension):
+        "Returns the (cached) number of null values along the dimension."
+        return cls.lookup(dataset, dimension, 'nan_count',
+                          lambda: null_count(dataset.dimension_values(dimension)))
+
+    @classmethod
+    def unique_count(cls, dataset, dimension):
+        "Returns the (cached) number of unique values along the dimension."
+        return cls.lookup(dataset, dimension, 'unique_count',
+                          lambda: len(dataset.dimension_values(dimension, expanded=False)))
+
+    @classmethod
+    def extend(cls, source, new_source, column, values):
+        """
+        Extends the statistics cached for a column on the source with
+        the supplied values appended to it, caching the results on the
+        new source. Only the range of numeric columns and null counts
+        can be extended, all other statistics are computed on demand.
+        """
+        stats = cls._stats(source)
+        if stats is None:
+            return
+        values = np.asarray(values)
+        new_stats = None
+        for key, value in list(stats.items()):
+            if key[:-1] != column:
+                continue
+            stat = key[-1]
+            if stat == 'range' and values.dtype.kind in 'iuf':
+                if len(values):
+                    value = util.max_range([value, util.find_range(values)])
+            elif stat == 'nan_count':
+                value = value + null_count(values)
+            else:
+                continue
+            if new_stats is None:
+                new_stats = cls._stats(new_source, create=True)
+                if new_stats is None:
+                    return
+                cls._owned.add(id(new_source))
+            new_stats[key] = value
+
+    @classmethod
+    def invalidate(cls, data):
+        """
+        Clears the statistics cached on data supplied by the user,
+        either directly or wrapped in a dataset, since it may have
+        been modified in place since the statistics were computed.
+        Statistics on data owned by the cache are retained.
+        """
+        if not cls._cache:
+            return
+        if isinstance(data, Element):
+            sources = [data.data]
+            for dim in data.dimensions():
+                source = data.interface.column_source(data, dim)
+                if source is not None:
+                    sources.append(source[0])
+        elif isinstance(data, dict):
+            sources = [data]+list(data.values())
+        else:
+            sources = [data]
+        for source in sources:
+            if id(source) not in cls._owned and cls._stats(source) is not None:
+                del cls._cache[id(source)]
+
+    @classmethod
+    def clear(cls, source=None):
+        """
+        Clears the statistics cached for the supplied data (or all
+        cached statistics if no data is supplied). The statistics on
+        the columns of a dictionary are cleared along with it.
+        """
+        if source is None:
+            cls._cache.clear()
+            cls._owned.clear()
+            return
+        if isinstance(source, dict):
+            for column in source.values():
+                cls.clear(column)
+        if cls._stats(source) is not None:
+            del cls._cache[id(source)]
+            cls._owned.discard(id(source))
+
+
+
 class Interface(param.Parameterized):
 
     interfaces = {}
 
+    # Prioritized interfaces keyed on the element type, the type of
+    # the supplied data and the requested datatypes
+    _dispatch_cache = {}
+
+    # Counts of the dispatch outcomes in initialize, where 'trusted'
+    # and 'cached' count the fast paths and 'init' and 'errors' count
+    # the attempts to initialize the data with an interface
+    dispatch_counts = defaultdict(int)
+
     datatype = None
 
     types = ()
@@ -151,6 +362,21 @@ class Interface(param.Parameterized):
     @classmethod
     def register(cls, interface):
         cls.interfaces[interface.datatype] = interface
+        cls._dispatch_cache.clear()
+
+    @classmethod
+    def trusted_kwargs(cls, eltype, **kwargs):
+        """
+        Returns the keywords allowing an element of the supplied type
+        to skip dispatch and validation when constructed from data
+        produced by this interface, e.g. when grouping. Explicit
+        dimensions in the supplied kwargs may not match the data so
+        disable the fast path.
+        """
+        if ('kdims' in kwargs or 'vdims' in kwargs or
+            'datatype' not in eltype.params()):
+            return {}
+        return {'_interface': cls}
 
     @classmethod
     def cast(cls, datasets, datatype=None, cast_type=None):
@@ -186,7 +412,17 @@ class Interface(param.Parameterized):
 
 
     @classmethod
-    def initialize(cls, eltype, data, kdims, vdims, datatype=None):
+    def initialize(cls, eltype, data, kdims, vdims, datatype=None, trusted=None):
+        """
+        Finds the interface able to interpret the supplied data in the
+        order of the requested datatypes, returning the initialized
+        data, the interface, the dimensions and any extra parameters.
+
+        A trusted interface may be supplied for data produced
+        internally, if the data is already of the type native to the
+        interface and the dimensions are declared the data is returned
+        without dispatching to and initializing any interface.
+        """
         # Process params and dimensions
         if isinstance(data, Element):
             pvals = util.get_param_values(data)
@@ -218,13 +454,26 @@ class Interface(param.Parameterized):
         if datatype is None:
             datatype = eltype.datatype
 
-        # Set interface priority order
-        prioritized = [cls.interfaces[p] for p in datatype
-                       if p in cls.interfaces]
-        head = [intfc for intfc in prioritized if intfc.applies(data)]
-        if head:
-            # Prioritize interfaces which have matching types
-            prioritized = head + [el for el in prioritized if el != head[0]]
+        if (trusted is not None and kdims is not None and vdims is not None
+            and trusted.datatype in datatype and trusted.applies(data)):
+            cls.dispatch_counts['trusted'] += 1
+            return data, trusted, {'kdims': kdims, 'vdims': vdims}, {}
+
+        # Set interface priority order, which only depends on the type
+        # of the data since Interface.applies is type based
+        key = (eltype, type(data), tuple(datatype))
+        cached = cls._dispatch_cache.get(key)
+        if cached is None:
+            prioritized = [cls.interfaces[p] for p in datatype
+                           if p in cls.interfaces]
+            head = [intfc for intfc in prioritized if intfc.applies(data)]
+            if head:
+                # Prioritize interfaces which have matching types
+                prioritized = head + [el for el in prioritized if el != head[0]]
+            cls._dispatch_cache[key] = (prioritized, head)
+        else:
+            prioritized, head = cached
+            cls.dispatch_counts['cached'] += 1
 
         # Iterate over interfaces until one can interpret the input
         priority_errors = []
@@ -232,12 +481,15 @@ class Interface(param.Parameterized):
             if not interface.loaded() and len(datatype) != 1:
                 # Skip interface if it is not loaded and was not explicitly requested
                 continue
+            cls.dispatch_counts['init'] += 1
             try:
                 (data, dims, extra_kws) = interface.init(eltype, data, kdims, vdims)
                 break
             except DataError:
+                cls.dispatch_counts['errors'] += 1
                 raise
             except Exception as e:
+                cls.dispatch_counts['errors'] += 1
                 if interface in head:
                     priority_errors.append((interface, e))
         else:
@@ -327,6 +579,17 @@ class Interface(param.Parameterized):
         return all_scalar and all_kdims
 
 
+    @classmethod
+    def column_source(cls, dataset, dimension):
+        """
+        Returns a tuple of the object holding the values along the
+        supplied dimension and a tuple identifying the column within
+        that object, used to cache statistics computed on the column
+        (see DataStatistics). Returns None if statistics on the data
+        cannot be cached, e.g. because they depend on other state.
+        """
+        return None
+
     @classmethod
     def range(cls, dataset, dimension):
         column = dataset.dimension_values(dimension)
@@ -401,6 +664,15 @@ class Interface(param.Parameterized):
     def columns(cls, dataset, dimensions):
         return Element.columns(dataset, dimensions)
 
+    @classmethod
+    def prefetch(cls, dataset, dimensions=None, statistics=('range',)):
+        """
+        Allows interfaces wrapping lazily evaluated data to compute
+        the statistics for multiple dimensions of the dataset in a
+        single pass over the data, caching the results (see
+        DataStatistics). By default statistics are computed on demand.
+        """
+
     @classmethod
     def shape(cls, dataset):
         return dataset.data.shape
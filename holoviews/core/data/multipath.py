@@ -202,14 +202,12 @@ class MultiInterface(Interface):
             values.append(vals)
         values = tuple(values)
 
-        # Iterate over the unique entries applying selection masks
-        from . import Dataset
-        ds = Dataset(values, dimensions)
-        keys = (tuple(vals[i] for vals in values) for i in range(len(vals)))
+        # Find the unique keys and collect the paths in each group
+        first, index, offsets = util.group_indices(values)
+        keys = zip(*[vals[first] for vals in values])
         grouped_data = []
-        for unique_key in util.unique_iterator(keys):
-            mask = ds.interface.select_mask(ds, dict(zip(dimensions, unique_key)))
-            selection = [data for data, m in zip(dataset.data, mask) if m]
+        for unique_key, start, end in zip(keys, offsets[:-1], offsets[1:]):
+            selection = [dataset.data[i] for i in index[start:end]]
             group_data = group_type(selection, **group_kwargs)
             grouped_data.append((unique_key, group_data))
 
@@ -151,6 +151,11 @@ class PandasInterface(Interface):
                             "not found: %s" % repr(not_found), cls)
 
 
+    @classmethod
+    def column_source(cls, dataset, dimension):
+        return dataset.data, (dataset.get_dimension(dimension, strict=True).name,)
+
+
     @classmethod
     def range(cls, dataset, dimension):
         column = dataset.data[dataset.get_dimension(dimension, strict=True).name]
@@ -190,6 +195,7 @@ class PandasInterface(Interface):
         if group_type != 'raw' and issubclass(group_type, Element):
             group_kwargs = dict(util.get_param_values(dataset),
                                 kdims=element_dims)
+            group_kwargs.update(cls.trusted_kwargs(group_type, **kwargs))
         group_kwargs.update(kwargs)
 
         group_by = [d.name for d in index_dims]
@@ -0,0 +1,589 @@
+import warnings
+
+import numpy as np
+
+from .. import util
+from ..dimension import dimension_name
+from ..element import Element
+from ..ndmapping import NdMapping, OrderedDict, item_check, sorted_context
+from ..util import isscalar
+from .interface import Interface, DataError
+
+
+class RaggedData(object):
+    """
+    RaggedData stores a collection of path or polygon geometries as
+    contiguous columns holding the concatenated vertices of all
+    geometries, along with an array of offsets which delimits the
+    vertices of each geometry, i.e. the vertices of geometry i are
+    found at offsets[i]:offsets[i+1]. Values which are constant for
+    each geometry may instead be stored as scalar columns with one
+    value per geometry.
+
+    Polygon holes are stored in the same way, as a tuple of the
+    concatenated (N, 2) array of hole coordinates, the offsets of each
+    ring into the coordinates, the offsets of the rings belonging to
+    each (sub-)polygon and the offsets of the (sub-)polygons belonging
+    to each geometry.
+    """
+
+    def __init__(self, columns=None, offsets=None, scalars=None, holes=None):
+        self.columns = OrderedDict(columns or [])
+        self.scalars = OrderedDict(scalars or [])
+        if offsets is None:
+            lengths = [len(v) for v in self.columns.values()]
+            offsets = [0, lengths[0]] if lengths else [0]
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.holes = holes
+        self._geometry_index = None
+
+    def __len__(self):
+        return len(self.offsets)-1
+
+    def __contains__(self, name):
+        return name in self.columns or name in self.scalars
+
+    def __getitem__(self, name):
+        if name in self.columns:
+            return self.columns[name]
+        return self.scalars[name]
+
+    @property
+    def lengths(self):
+        "The number of vertices in each geometry."
+        return np.diff(self.offsets)
+
+    @property
+    def geometry_index(self):
+        "The index of the geometry each vertex belongs to."
+        if self._geometry_index is None:
+            self._geometry_index = np.repeat(np.arange(len(self)), self.lengths)
+        return self._geometry_index
+
+    def vertex_values(self, name):
+        """
+        Returns the values of a column for each vertex, expanding
+        scalar columns to the length of each geometry.
+        """
+        if name in self.columns:
+            return self.columns[name]
+        return self.scalars[name][self.geometry_index]
+
+    def _take_offsets(self, offsets, indices):
+        """
+        Given offsets delimiting a ragged array and the indices of
+        the segments to select returns the new offsets and the index
+        of the selected elements.
+        """
+        starts, lengths = offsets[:-1][indices], np.diff(offsets)[indices]
+        new_offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        index = (np.repeat(starts-new_offsets[:-1], lengths) +
+                 np.arange(new_offsets[-1], dtype=np.int64))
+        return new_offsets, index
+
+    def take(self, indices):
+        """
+        Returns a new RaggedData object containing only the geometries
+        at the supplied integer indices.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        offsets, index = self._take_offsets(self.offsets, indices)
+        columns = [(k, v[index]) for k, v in self.columns.items()]
+        scalars = [(k, v[indices]) for k, v in self.scalars.items()]
+        holes = None
+        if self.holes is not None:
+            coords, rings, polygons, geometries = self.holes
+            geometries, poly_index = self._take_offsets(geometries, indices)
+            polygons, ring_index = self._take_offsets(polygons, poly_index)
+            rings, coord_index = self._take_offsets(rings, ring_index)
+            holes = (coords[coord_index], rings, polygons, geometries)
+        return RaggedData(columns, offsets, scalars, holes)
+
+    def mask(self, mask):
+        """
+        Returns a new RaggedData object containing only the vertices
+        selected by the boolean mask, retaining empty geometries.
+        """
+        counts = np.bincount(self.geometry_index[mask], minlength=len(self))
+        offsets = np.concatenate([[0], np.cumsum(counts)])
+        columns = [(k, v[mask]) for k, v in self.columns.items()]
+        return RaggedData(columns, offsets, self.scalars, self.holes)
+
+    def hole_lists(self, splits):
+        """
+        Returns the holes of each geometry as a list-of-lists of
+        arrays, given the number of NaN-separated sub-geometries of
+        each geometry, which have no holes unless declared.
+        """
+        if self.holes is None:
+            return [[[] for _ in range(n)] for n in splits]
+        coords, rings, polygons, geometries = self.holes
+        holes = []
+        for i, n in enumerate(splits):
+            geom_holes = [[coords[rings[r]:rings[r+1]] for r in range(polygons[p], polygons[p+1])]
+                          for p in range(geometries[i], geometries[i+1])]
+            holes.append(geom_holes or [[] for _ in range(n)])
+        return holes
+
+    @classmethod
+    def from_paths(cls, paths, dimensions, hole_key=None):
+        """
+        Converts a list of tabular data types (dictionaries of columns
+        and scalars, 2D arrays, tuples of columns or DataFrames) into
+        a RaggedData object, concatenating the columns of all paths.
+        """
+        values = OrderedDict((d, []) for d in dimensions)
+        lengths, holes, array_dims = [], [], set()
+        for path in paths:
+            if isinstance(path, tuple):
+                path = dict(zip(dimensions, path))
+            elif isinstance(path, np.ndarray):
+                path = np.atleast_2d(path)
+                path = {d: path[:, i] for i, d in enumerate(dimensions)
+                        if i < path.shape[1]}
+            elif util.pd and isinstance(path, util.pd.DataFrame):
+                path = {d: path[d].values for d in dimensions if d in path}
+            elif isinstance(path, dict):
+                path = dict(path)
+                for k, v in list(path.items()):
+                    if isinstance(k, tuple):
+                        v = np.asarray(path.pop(k))
+                        path.update({d: v[:, i] for i, d in enumerate(k)})
+            else:
+                raise ValueError('RaggedData paths must be tabular data '
+                                 'types, found %s.' % type(path).__name__)
+
+            length = None
+            for d in dimensions:
+                if d not in path:
+                    raise ValueError("Values for dimension %s not found" % d)
+                value = path[d]
+                if isinstance(value, np.ndarray) or not isscalar(value):
+                    value = np.asarray(value)
+                    if length is not None and len(value) != length:
+                        raise ValueError('Columns of each path must be '
+                                         'the same length.')
+                    length = len(value)
+                    array_dims.add(d)
+                values[d].append(value)
+            lengths.append(1 if length is None else length)
+            holes.append(path.get(hole_key) if hole_key else None)
+
+        columns, scalars = OrderedDict(), OrderedDict()
+        for d, vals in values.items():
+            if d not in array_dims:
+                scalars[d] = np.array(vals)
+            else:
+                arrays = [v if isinstance(v, np.ndarray) else np.full(n, v)
+                          for v, n in zip(vals, lengths)]
+                columns[d] = np.concatenate(arrays)
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+
+        if not any(isinstance(h, list) for h in holes):
+            return cls(columns, offsets, scalars)
+        rings, ring_counts, polygon_counts = [], [], []
+        for geom_holes in holes:
+            geom_holes = geom_holes if isinstance(geom_holes, list) else []
+            polygon_counts.append(len(geom_holes))
+            for polygon_holes in geom_holes:
+                ring_counts.append(len(polygon_holes))
+                rings += [np.asarray(h, dtype=np.float64).reshape(-1, 2) for h in polygon_holes]
+        coords = np.concatenate(rings) if rings else np.empty((0, 2))
+        ring_offsets = np.cumsum([0]+[len(r) for r in rings])
+        holes = (coords, ring_offsets, np.cumsum([0]+ring_counts),
+                 np.cumsum([0]+polygon_counts))
+        return cls(columns, offsets, scalars, holes)
+
+
+
+class RaggedInterface(Interface):
+    """
+    RaggedInterface stores a collection of paths, contours or polygons
+    as a RaggedData object, i.e. as contiguous columns of concatenated
+    vertices with an array of offsets delimiting each geometry. This
+    allows range computation, selection and splitting to operate on
+    all geometries at once, which makes it much more efficient than
+    the MultiInterface for large numbers of geometries.
+
+    Like the MultiInterface the data appears as a single dataset made
+    up of the concatenated subpaths separated by NaN values. A list
+    of tabular data types supplied with the 'ragged' datatype is
+    converted to the ragged representation.
+    """
+
+    types = (RaggedData,)
+
+    datatype = 'ragged'
+
+    subtypes = ['dictionary', 'dataframe', 'array', 'dask']
+
+    multi = True
+
+    @classmethod
+    def init(cls, eltype, data, kdims, vdims):
+        dims = {'kdims': eltype.kdims, 'vdims': eltype.vdims}
+        if kdims is not None:
+            dims['kdims'] = kdims
+        if vdims is not None:
+            dims['vdims'] = vdims
+        if isinstance(data, list):
+            dimensions = [dimension_name(d) for d in dims['kdims']+dims['vdims']]
+            data = RaggedData.from_paths(data, dimensions, getattr(eltype, '_hole_key', None))
+        elif not isinstance(data, RaggedData):
+            raise ValueError('RaggedInterface data must be a RaggedData object '
+                             'or a list of tabular data types.')
+        return data, dims, {}
+
+    @classmethod
+    def validate(cls, dataset, vdims=True):
+        Interface.validate(dataset, vdims)
+        data = dataset.data
+        nvertices = data.offsets[-1] if len(data.offsets) else 0
+        for k, v in data.columns.items():
+            if len(v) != nvertices:
+                raise DataError('Column %s has length %d but the offsets '
+                                'declare %d vertices.' % (k, len(v), nvertices), cls)
+        for k, v in data.scalars.items():
+            if len(v) != len(data):
+                raise DataError('Scalar column %s has length %d but the '
+                                'offsets declare %d geometries.' % (k, len(v), len(data)), cls)
+
+        from holoviews.element import Polygons
+        if isinstance(dataset, Polygons) and data.holes is not None:
+            polygons = np.diff(data.holes[-1])
+            declared = polygons > 0
+            splits = cls._splits(dataset)
+            if (polygons[declared] != splits[declared]).any():
+                raise DataError('Polygons with holes containing multi-geometries '
+                                'must declare a list of holes for each geometry.', cls)
+
+    @classmethod
+    def _splits(cls, dataset):
+        """
+        Returns the number of NaN-separated sub-geometries in each
+        geometry.
+        """
+        data = dataset.data
+        name = dataset.kdims[0].name
+        if name not in data.columns or data.columns[name].dtype.kind not in 'fc':
+            return np.ones(len(data), dtype=int)
+        isnan = np.isnan(data.columns[name])
+        return np.bincount(data.geometry_index[isnan], minlength=len(data))+1
+
+    @classmethod
+    def column_source(cls, dataset, dimension):
+        name = dataset.get_dimension(dimension, strict=True).name
+        if name in dataset.data and getattr(dataset, 'level', None) is None:
+            return dataset.data[name], ()
+        return None
+
+    @classmethod
+    def dimension_type(cls, dataset, dim):
+        if not len(dataset.data):
+            return float
+        return dataset.data[dataset.get_dimension(dim, strict=True).name].dtype.type
+
+    @classmethod
+    def range(cls, dataset, dim):
+        if not len(dataset.data):
+            return (None, None)
+
+        # Backward compatibility for Contours/Polygons level
+        level = getattr(dataset, 'level', None)
+        dim = dataset.get_dimension(dim)
+        if level is not None and dim is dataset.vdims[0]:
+            return (level, level)
+
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', r'All-NaN (slice|axis) encountered')
+            return util.find_range(dataset.data[dim.name])
+
+    @classmethod
+    def has_holes(cls, dataset):
+        holes = dataset.data.holes
+        return holes is not None and len(holes[1]) > 1
+
+    @classmethod
+    def holes(cls, dataset):
+        return dataset.data.hole_lists(cls._splits(dataset))
+
+    @classmethod
+    def isscalar(cls, dataset, dim):
+        """
+        Tests if dimension is scalar in each subpath.
+        """
+        data = dataset.data
+        name = dataset.get_dimension(dim, strict=True).name
+        if not len(data) or name in data.scalars:
+            return True
+        values = data.columns[name]
+        if len(values) < 2:
+            return True
+        changed = values[1:] != values[:-1]
+        if values.dtype.kind in 'fc':
+            changed &= ~(np.isnan(values[1:]) & np.isnan(values[:-1]))
+        index = data.geometry_index
+        return not (changed & (index[1:] == index[:-1])).any()
+
+    @classmethod
+    def select_mask(cls, dataset, selection):
+        """
+        Computes a boolean mask over the vertices of all geometries,
+        given a dictionary of dimension selections.
+        """
+        data = dataset.data
+        mask = np.ones(data.offsets[-1], dtype=np.bool)
+        for dim, k in selection.items():
+            if isinstance(k, tuple):
+                k = slice(*k)
+            name = dataset.get_dimension(dim, strict=True).name
+            arr = data[name]
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore', r'invalid value encountered')
+                if isinstance(k, slice):
+                    sel = True
+                    if k.start is not None:
+                        sel &= k.start <= arr
+                    if k.stop is not None:
+                        sel &= arr < k.stop
+                elif isinstance(k, (set, list)):
+                    sel = np.logical_or.reduce([arr == ik for ik in k])
+                elif callable(k):
+                    sel = k(arr)
+                else:
+                    sel = arr == k
+            if sel is True:
+                continue
+            elif name not in data.columns:
+                sel = np.asarray(sel)[data.geometry_index]
+            mask &= sel
+        return mask
+
+    @classmethod
+    def select(cls, dataset, selection_mask=None, **selection):
+        """
+        Applies the selection to the vertices of all subpaths.
+        """
+        if not len(dataset.data):
+            return dataset.data
+        if selection_mask is None:
+            selection_mask = cls.select_mask(dataset, selection)
+        return dataset.data.mask(selection_mask)
+
+    @classmethod
+    def select_paths(cls, dataset, selection):
+        """
+        Allows selecting paths with usual NumPy slicing index.
+        """
+        return dataset.data.take(np.arange(len(dataset.data))[selection])
+
+    @classmethod
+    def aggregate(cls, dataset, dimensions, function, **kwargs):
+        raise NotImplementedError('Aggregation currently not implemented')
+
+    @classmethod
+    def groupby(cls, dataset, dimensions, container_type, group_type, **kwargs):
+        # Get dimensions information
+        dimensions = [dataset.get_dimension(d) for d in dimensions]
+        kdims = [kdim for kdim in dataset.kdims if kdim not in dimensions]
+
+        # Update the kwargs appropriately for Element group types
+        group_kwargs = {}
+        group_type = list if group_type == 'raw' else group_type
+        if issubclass(group_type, Element):
+            group_kwargs.update(util.get_param_values(dataset))
+            group_kwargs['kdims'] = kdims
+        group_kwargs.update(kwargs)
+
+        # Find all the keys along supplied dimensions
+        values = []
+        for d in dimensions:
+            if not cls.isscalar(dataset, d):
+                raise ValueError('RaggedInterface can only apply groupby '
+                                 'on scalar dimensions, %s dimension'
+                                 'is not scalar' % d)
+            vals = cls.values(dataset, d, False, True)
+            values.append(vals)
+        values = tuple(values)
+
+        # Find the unique keys and collect the paths in each group
+        first, index, offsets = util.group_indices(values)
+        keys = zip(*[vals[first] for vals in values])
+        grouped_data = []
+        for unique_key, start, end in zip(keys, offsets[:-1], offsets[1:]):
+            selection = dataset.data.take(index[start:end])
+            if group_type is list:
+                selection = cls._geometries(dataset.clone(selection), 0, len(selection))
+            group_data = group_type(selection, **group_kwargs)
+            grouped_data.append((unique_key, group_data))
+
+        if issubclass(container_type, NdMapping):
+            with item_check(False), sorted_context(False):
+                return container_type(grouped_data, kdims=dimensions)
+        else:
+            return container_type(grouped_data)
+
+    @classmethod
+    def sample(cls, dataset, samples=[]):
+        raise NotImplementedError('Sampling operation on subpaths not supported')
+
+    @classmethod
+    def shape(cls, dataset):
+        """
+        Returns the shape of all subpaths, making it appear like a
+        single array of concatenated subpaths separated by NaN values.
+        """
+        return cls.length(dataset), len(dataset.dimensions())
+
+    @classmethod
+    def length(cls, dataset):
+        """
+        Returns the length of the ragged dataset making it appear
+        like a single array of concatenated subpaths separated by NaN
+        values.
+        """
+        data = dataset.data
+        if not len(data):
+            return 0
+        return int(data.offsets[-1]-data.offsets[0]) + len(data)-1
+
+    @classmethod
+    def nonzero(cls, dataset):
+        return bool(len(dataset.data))
+
+    @classmethod
+    def redim(cls, dataset, dimensions):
+        data = dataset.data
+        all_dims = dataset.dimensions()
+        renamed = []
+        for columns in (data.columns, data.scalars):
+            cols = OrderedDict()
+            for k, v in columns.items():
+                if k in dimensions:
+                    k = dimensions[k].name
+                elif k in all_dims:
+                    k = dataset.get_dimension(k).name
+                cols[k] = v
+            renamed.append(cols)
+        return RaggedData(renamed[0], data.offsets, renamed[1], data.holes)
+
+    @classmethod
+    def values(cls, dataset, dimension, expanded=True, flat=True):
+        """
+        Returns a single concatenated array of all subpaths separated
+        by NaN values. If expanded keyword is False the unique values
+        in each subpath are concatenated instead.
+        """
+        data = dataset.data
+        if not len(data):
+            return np.array([])
+        name = dataset.get_dimension(dimension, strict=True).name
+        if not expanded:
+            if name in data.scalars:
+                return data.scalars[name]
+            return cls._unique_values(data, data.columns[name])
+
+        values = data.vertex_values(name)
+        nonempty = data.lengths > 0
+        if nonempty.sum() < 2:
+            return values
+        kind = values.dtype.kind
+        if kind in 'iub':
+            dtype, fill = np.float64, np.NaN
+        elif kind in 'fcM':
+            dtype, fill = values.dtype, np.NaN if kind != 'M' else np.datetime64('NaT')
+        else:
+            dtype, fill = object, np.NaN
+        positions = np.cumsum(nonempty)-1
+        index = np.arange(len(values)) + positions[data.geometry_index]
+        expanded = np.full(len(values)+nonempty.sum()-1, fill, dtype=dtype)
+        expanded[index] = values
+        return expanded
+
+    @classmethod
+    def _unique_values(cls, data, values):
+        """
+        Returns the unique values of each geometry in order of
+        appearance, concatenated across all geometries.
+        """
+        if values.dtype.kind == 'O':
+            return np.concatenate([util.unique_array(values[s:e]) for s, e in
+                                   zip(data.offsets[:-1], data.offsets[1:])])
+        index = data.geometry_index
+        order = np.lexsort((values, index))
+        svals, sindex = values[order], index[order]
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = (svals[1:] != svals[:-1]) | (sindex[1:] != sindex[:-1])
+        return values[np.sort(order[first])]
+
+    @classmethod
+    def _geometries(cls, dataset, start, end, dimensions=None, hole_key=None):
+        """
+        Returns a list of dictionaries containing views of the columns
+        of each geometry between start and end, with scalar columns
+        stored as scalars and the holes under the supplied key.
+        """
+        data = dataset.data
+        names = [d.name for d in dataset.dimensions()] if dimensions is None else dimensions
+        holes = data.hole_lists(cls._splits(dataset)) if hole_key and data.holes else None
+        geoms = []
+        for i in range(start, end):
+            s, e = data.offsets[i], data.offsets[i+1]
+            geom = OrderedDict()
+            for name in names:
+                geom[name] = data.columns[name][s:e] if name in data.columns else data.scalars[name][i]
+            if holes is not None:
+                geom[hole_key] = holes[i]
+            geoms.append(geom)
+        return geoms
+
+    @classmethod
+    def split(cls, dataset, start, end, datatype, **kwargs):
+        """
+        Splits a ragged Dataset into regular Datasets or arrays,
+        dataframes or dictionaries of columns. The arrays are returned
+        as views into a single array holding the vertices of all paths.
+        """
+        data = dataset.data
+        start, end, _ = slice(start, end).indices(len(data))
+        if end <= start:
+            return []
+        hole_key = getattr(dataset, '_hole_key', None)
+        if datatype is None:
+            return [dataset.clone(d, datatype=cls.subtypes)
+                    for d in cls._geometries(dataset, start, end, hole_key=hole_key)]
+        elif datatype == 'array':
+            dimensions = kwargs.get('dimensions') or dataset.dimensions()
+            names = [dataset.get_dimension(d, strict=True).name for d in dimensions]
+            lower, upper = data.offsets[start], data.offsets[end]
+            columns = [data.vertex_values(n)[lower:upper] for n in names]
+            array = columns[0][:, np.newaxis] if len(columns) == 1 else np.column_stack(columns)
+            return np.split(array, data.offsets[start+1:end]-lower)
+        elif datatype == 'dataframe':
+            dimensions = kwargs.get('dimensions') or dataset.dimensions()
+            names = [dataset.get_dimension(d, strict=True).name for d in dimensions]
+            return [util.pd.DataFrame(d, columns=names) for d in
+                    cls._geometries(dataset, start, end, names)]
+        elif datatype == 'columns':
+            dimensions = kwargs.get('dimensions')
+            names = None if dimensions is None else [
+                dataset.get_dimension(d, strict=True).name for d in dimensions]
+            return cls._geometries(dataset, start, end, names, hole_key)
+        else:
+            raise ValueError("%s datatype not support" % datatype)
+
+    @classmethod
+    def add_dimension(cls, dataset, dimension, dim_pos, values, vdim):
+        data = dataset.data
+        if values is None or util.isscalar(values):
+            values = [values]*len(data)
+        elif not len(values) == len(data):
+            raise ValueError('Added dimension values must be scalar or '
+                             'match the length of the data.')
+        scalars = list(data.scalars.items())
+        scalars.insert(dim_pos, (dimension_name(dimension), np.asarray(values)))
+        return RaggedData(data.columns, data.offsets, scalars, data.holes)
+
+
+
+Interface.register(RaggedInterface)
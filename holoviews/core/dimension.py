@@ -452,8 +452,11 @@ class Dimension(param.Parameterized):
         """
         Compatibility for pickles before alias attribute was introduced.
         """
+        has_label = ('_label_param_value' in d or
+                     'label' in d.get('_instance__params', {}))
         super(Dimension, self).__setstate__(d)
-        self.label = self.name
+        if not has_label:
+            self.label = self.name
 
     def __eq__(self, other):
         "Implements equals operator including sanitized comparison."
@@ -4,6 +4,7 @@ map types. The former class only allows indexing whereas the latter
 also enables slicing over multiple dimension ranges.
 """
 
+import numbers
 from itertools import cycle
 from operator import itemgetter
 import numpy as np
@@ -56,6 +57,160 @@ class sorted_context(object):
 
 
 
+class KeyIndex(object):
+    """
+    Sorted per-dimension index over the keys of a
+    MultiDimensionalMapping. For each key dimension the key values are
+    held in a sorted numpy array alongside their positions in the
+    mapping, allowing value and range lookups by bisection rather than
+    by scanning every key. The index for a dimension is only built
+    when it is first queried; dimensions whose values cannot be
+    represented as a sortable array (e.g. mixed types or None) are
+    not indexed and lookups on them return None.
+
+    Keys appended to or removed from the mapping are applied to the
+    per-dimension indexes in place (see append and remove), while a
+    resort of the mapping requires a new index.
+    """
+
+    _sortable_kinds = 'biufmMSU'
+
+    def __init__(self, keys):
+        self.keys = keys
+        self._dims = {}
+
+
+    def _dimension(self, idx):
+        if idx in self._dims:
+            return self._dims[idx]
+        index = None
+        keys = [k[idx] for k in self.keys]
+        try:
+            values = np.asarray(keys)
+        except Exception:
+            values = None
+        if (values is not None and values.ndim == 1 and
+            values.dtype.kind in self._sortable_kinds):
+            # numpy coerces mixed numeric and string keys to strings
+            if (values.dtype.kind in 'SU' and
+                not all(isinstance(k, basestring) for k in keys)):
+                return self._dims.setdefault(idx, None)
+            positions = np.arange(len(values))
+            if values.dtype.kind in 'fmM':
+                # NaN/NaT keys never satisfy a comparison so exclude them
+                valid = values == values
+                values, positions = values[valid], positions[valid]
+            order = np.argsort(values, kind='mergesort')
+            index = (values[order], positions[order])
+        self._dims[idx] = index
+        return index
+
+
+    def append(self, key):
+        """
+        Adds a key appended to the end of the mapping. Dimensions
+        whose index cannot hold the new value without changing its
+        dtype are dropped and rebuilt when next queried.
+        """
+        self.keys.append(key)
+        position = len(self.keys)-1
+        for idx, index in list(self._dims.items()):
+            if index is None:
+                # Unsortable values remain unsortable
+                continue
+            values, positions = index
+            value = key[idx]
+            try:
+                array = np.asarray([value])
+                compatible = (array.ndim == 1 and
+                              np.result_type(values, array) == values.dtype and
+                              (values.dtype.kind not in 'SU' or
+                               isinstance(value, basestring)))
+            except Exception:
+                compatible = False
+            if not compatible:
+                del self._dims[idx]
+                continue
+            elif values.dtype.kind in 'fmM' and array[0] != array[0]:
+                continue
+            insert = values.searchsorted(array[0], 'right')
+            self._dims[idx] = (np.insert(values, insert, array[0]),
+                               np.insert(positions, insert, position))
+
+
+    def remove(self, key):
+        """
+        Removes a key from the mapping, shifting the positions of the
+        keys following it.
+        """
+        position = self.keys.index(key)
+        del self.keys[position]
+        for idx, index in self._dims.items():
+            if index is None:
+                continue
+            values, positions = index
+            keep = positions != position
+            values, positions = values[keep], positions[keep]
+            self._dims[idx] = (values, positions - (positions > position))
+
+
+    @classmethod
+    def _comparable(cls, values, value):
+        """
+        Whether the value can be compared against the indexed values
+        with the same semantics as a Python comparison.
+        """
+        kind = values.dtype.kind
+        if kind in 'SU':
+            return isinstance(value, basestring)
+        elif kind in 'mM':
+            return isinstance(value, (np.datetime64, np.timedelta64))
+        return isinstance(value, numbers.Number)
+
+
+    def lookup(self, idx, selection):
+        """
+        Returns the positions of the keys matching the selection
+        along the dimension at the supplied index, where the selection
+        may be a scalar value, a slice without a step or a list/set of
+        values. Returns None if the selection cannot be resolved using
+        the index.
+        """
+        index = self._dimension(idx)
+        if index is None or callable(selection):
+            return None
+        values, positions = index
+        try:
+            if isinstance(selection, slice):
+                if selection.step is not None:
+                    return None
+                if not all(self._comparable(values, v) for v in
+                           (selection.start, selection.stop) if v is not None):
+                    return None
+                start = (0 if selection.start is None else
+                         values.searchsorted(selection.start, 'left'))
+                stop = (len(values) if selection.stop is None else
+                        values.searchsorted(selection.stop, 'left'))
+                return positions[start:max(start, stop)]
+            elif isinstance(selection, (set, list)):
+                matches = [self.lookup(idx, v) for v in selection]
+                if any(m is None for m in matches):
+                    return None
+                elif not matches:
+                    return positions[:0]
+                return np.unique(np.concatenate(matches))
+            elif isinstance(selection, tuple):
+                return None
+            elif not self._comparable(values, selection):
+                return None
+            start = values.searchsorted(selection, 'left')
+            stop = values.searchsorted(selection, 'right')
+        except Exception:
+            return None
+        return positions[start:stop]
+
+
+
 class MultiDimensionalMapping(Dimensioned):
     """
     An MultiDimensionalMapping is a Dimensioned mapping (like a
@@ -95,6 +250,9 @@ class MultiDimensionalMapping(Dimensioned):
     _deep_indexable = False
     _check_items = True
 
+    # Cached KeyIndex along with the data it was built for
+    _key_index = None
+
     def __init__(self, initial_items=None, kdims=None, **params):
         if isinstance(initial_items, MultiDimensionalMapping):
             params = dict(util.get_param_values(initial_items),
@@ -170,16 +328,40 @@ class MultiDimensionalMapping(Dimensioned):
                                ' specified dimension values.' % (dim, repr(val)))
 
         # Updates nested data structures rather than simply overriding them.
-        if (update and (dim_vals in self.data)
+        exists = dim_vals in self.data
+        if (update and exists
             and isinstance(self.data[dim_vals], (MultiDimensionalMapping, OrderedDict))):
             self.data[dim_vals].update(data)
         else:
+            if not exists:
+                last_key = next(reversed(self.data), None) if sort else None
+                index = self._cached_index()
             self.data[dim_vals] = data
+            # Keys appended in order do not require the data to be resorted
+            if sort and not exists and self._sorts_after(dim_vals, last_key):
+                sort = False
+            if not exists and not sort and index is not None:
+                index.append(dim_vals)
 
         if sort:
             self._resort()
 
 
+    def _sorts_after(self, key, other):
+        """
+        Whether the key is known to sort strictly after the other key,
+        using the same ordering as dimension_sort.
+        """
+        if other is None:
+            return True
+        sort_key = lambda k: tuple(([None]+list(d.values)).index(v) if d.values else v
+                                   for d, v in zip(self.kdims, k))
+        try:
+            return bool(sort_key(key) > sort_key(other))
+        except Exception:
+            return False
+
+
     def _apply_key_type(self, keys):
         """
         If a type is specified by the corresponding key dimension,
@@ -249,6 +431,33 @@ class MultiDimensionalMapping(Dimensioned):
                                                range(self.ndims)))
 
 
+    def _cached_index(self):
+        """
+        Returns the KeyIndex if one was built for the current data,
+        i.e. the data was not replaced (e.g. when resorting) or had
+        keys added or removed other than through _add_item and pop.
+        """
+        cached = self._key_index
+        if (cached is None or cached[0] is not self.data or
+            len(cached[1].keys) != len(self.data)):
+            return None
+        return cached[1]
+
+
+    @property
+    def _index(self):
+        """
+        KeyIndex over the current keys, which is updated in place as
+        keys are appended or popped and rebuilt when the data is
+        replaced or modified directly.
+        """
+        index = self._cached_index()
+        if index is None:
+            index = KeyIndex(list(self.data.keys()))
+            self._key_index = (self.data, index)
+        return index
+
+
     def clone(self, data=None, shared_data=True, *args, **overrides):
         """
         Overrides Dimensioned clone to avoid checking items if data
@@ -499,6 +708,10 @@ class MultiDimensionalMapping(Dimensioned):
     def pop(self, key, default=None):
         "Standard pop semantics for all mapping types"
         if not isinstance(key, tuple): key = (key,)
+        if key in self.data:
+            index = self._cached_index()
+            if index is not None:
+                index.remove(key)
         return self.data.pop(key, default)
 
 
@@ -529,8 +742,10 @@ class MultiDimensionalMapping(Dimensioned):
     def __contains__(self, key):
         if self.ndims == 1:
             return key in self.data.keys()
-        else:
-            return key in self.keys()
+        try:
+            return key in self.data
+        except TypeError:
+            return False
 
     def __len__(self):
         return len(self.data)
@@ -579,8 +794,23 @@ class NdMapping(MultiDimensionalMapping):
             return self._dataslice(self.data[map_slice], data_slice)
         else:
             conditions = self._generate_conditions(map_slice)
-            items = self.data.items()
-            for cidx, (condition, dim) in enumerate(zip(conditions, self.kdims)):
+            selection, unindexed = None, []
+            for cidx, (condition, dim, dim_slice) in enumerate(zip(conditions, self.kdims, map_slice)):
+                if dim_slice is Ellipsis or dim_slice == slice(None):
+                    continue
+                positions = None if dim.values else self._index.lookup(cidx, dim_slice)
+                if positions is None:
+                    unindexed.append((cidx, condition, dim))
+                elif selection is None:
+                    selection = positions
+                else:
+                    selection = np.intersect1d(selection, positions)
+            if selection is None:
+                items = self.data.items()
+            else:
+                keys = self._index.keys
+                items = [(keys[i], self.data[keys[i]]) for i in np.sort(selection)]
+            for cidx, condition, dim in unindexed:
                 values = dim.values
                 items = [(k, v) for k, v in items
                          if condition(values.index(k[cidx])
@@ -600,7 +830,6 @@ class NdMapping(MultiDimensionalMapping):
         """
         Expands slices containing steps into a list.
         """
-        keys = list(self.data.keys())
         expanded = []
         for idx, ind in enumerate(indices):
             if isinstance(ind, slice) and ind.step is not None:
@@ -613,7 +842,7 @@ class NdMapping(MultiDimensionalMapping):
                     condition = self._from_condition(dim_ind)
                 else:
                     condition = self._range_condition(dim_ind)
-                dim_vals = unique_iterator(k[idx] for k in keys)
+                dim_vals = unique_iterator(k[idx] for k in self._index.keys)
                 expanded.append(set([k for k in dim_vals if condition(k)][::int(ind.step)]))
             else:
                 expanded.append(ind)
@@ -2,12 +2,33 @@
 Operations manipulate Elements, HoloMaps and Layouts, typically for
 the purposes of analysis or visualization.
 """
+import time
+
 import param
-from .dimension import ViewableElement
+from .dimension import OrderedDict, ViewableElement
 from .element import Element, HoloMap, GridSpace, NdLayout
 from .layout import Layout
 from .overlay import NdOverlay, Overlay
 from .spaces import DynamicMap, Callable
+from .util import basestring
+
+
+def apply_items(operation, params, items, keyed=True):
+    """
+    Applies the operation with the supplied parameter overrides to a
+    list of (key, element) items, returning a list of (key, processed
+    element, time taken in seconds) tuples. Defined at the module
+    level so that chunks of items may be dispatched to worker
+    processes.
+    """
+    operation.p = param.ParamOverrides(operation, params)
+    results = []
+    for key, element in items:
+        start = time.time()
+        processed = operation._apply(element, key=key if keyed else None)
+        results.append((key, processed, time.time()-start))
+    return results
+
 
 
 class Operation(param.ParameterizedFunction):
@@ -61,6 +82,25 @@ class Operation(param.ParameterizedFunction):
         List of streams that are applied if dynamic=True, allowing
         for dynamic interaction with the plot.""")
 
+    executor = param.Parameter(default=None, doc="""
+        Executor used to process the frames of a HoloMap (or the cells
+        of a GridSpace or NdLayout) in parallel. May be 'thread' or
+        'process' to process the frames on a new thread or process
+        pool, or an existing concurrent.futures.Executor. By default
+        frames are processed sequentially. The order of the processed
+        frames is always retained. When using processes the operation
+        and the elements must be picklable and the operation should
+        not depend on any state modified by processing other frames.""")
+
+    max_workers = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+        Maximum number of workers used when creating a thread or
+        process pool, defaults to the number of processors.""")
+
+    chunksize = param.Integer(default=1, bounds=(1, None), doc="""
+        Number of frames submitted to the executor as a single task.
+        Larger chunks reduce the overhead of dispatching many cheap
+        frames, particularly when using processes.""")
+
     # Hooks to allow external libraries to extend existing operations.
     # Preprocessor hooks should accept the operation and input element
     # and return a dictionary of data which will be made available to
@@ -69,6 +109,9 @@ class Operation(param.ParameterizedFunction):
     _preprocess_hooks = []
     _postprocess_hooks = []
 
+    # Time taken to process each frame by the last call, keyed by frame key
+    timings = None
+
     @classmethod
     def search(cls, element, pattern):
         """
@@ -110,6 +153,14 @@ class Operation(param.ParameterizedFunction):
             raise ValueError("Extents across the overlay are inconsistent")
 
 
+    def __reduce__(self):
+        # The parameter overrides are recreated on each call and cannot
+        # be pickled, e.g. when dispatching frames to other processes
+        reconstructor, args, state = super(Operation, self).__reduce__()
+        state.pop('p', None)
+        return reconstructor, args, state
+
+
     def _apply(self, element, key=None):
         """
         Applies the operation to the element, executing any pre- and
@@ -124,6 +175,53 @@ class Operation(param.ParameterizedFunction):
         return ret
 
 
+    def _apply_items(self, items, keyed=True):
+        """
+        Applies the operation to a list of (key, element) items,
+        returning the processed items in the same order. The items are
+        dispatched in chunks to the executor if one is defined. The
+        time taken to process each item is recorded on the timings
+        attribute, keyed by the item key.
+        """
+        items = list(items)
+        params = dict(self.p)
+        executor = self.p.executor
+        if executor is None or len(items) < 2:
+            results = apply_items(self, params, items, keyed)
+        else:
+            chunksize = self.p.chunksize
+            chunks = [items[i:i+chunksize] for i in range(0, len(items), chunksize)]
+            if isinstance(executor, basestring):
+                with self._create_executor(executor) as pool:
+                    chunked = list(pool.map(apply_items, [self]*len(chunks), [params]*len(chunks),
+                                            chunks, [keyed]*len(chunks)))
+            else:
+                chunked = list(executor.map(apply_items, [self]*len(chunks), [params]*len(chunks),
+                                            chunks, [keyed]*len(chunks)))
+            results = [result for chunk in chunked for result in chunk]
+        self.timings = OrderedDict((key, elapsed) for key, _, elapsed in results)
+        return [(key, processed) for key, processed, _ in results]
+
+
+    def _create_executor(self, executor):
+        """
+        Creates a thread or process pool given the executor type.
+        """
+        try:
+            from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+        except ImportError:
+            raise ImportError('Processing frames in parallel requires the '
+                              'concurrent.futures module, on Python 2 install '
+                              'the futures package.')
+        if executor == 'thread':
+            return ThreadPoolExecutor(self.p.max_workers)
+        elif executor == 'process':
+            return ProcessPoolExecutor(self.p.max_workers)
+        raise ValueError("Operation executor must be one of 'thread', "
+                         "'process' or a concurrent.futures.Executor, "
+                         "got %r." % executor)
+
+
     def _process(self, view, key=None):
         """
         Process a single input element and outputs new single element or
@@ -149,7 +247,12 @@ class Operation(param.ParameterizedFunction):
                     isinstance(element, DynamicMap))
                    or self.p.dynamic is True)
 
-        if isinstance(element, (GridSpace, NdLayout)):
+        if (isinstance(element, (GridSpace, NdLayout)) and not dynamic and
+            self.p.executor is not None and
+            all(isinstance(cell, ViewableElement) for cell in element)):
+            # Process the cells of the layout in parallel
+            processed = element.clone(self._apply_items(element.items(), keyed=False))
+        elif isinstance(element, (GridSpace, NdLayout)):
             # Initialize an empty axis layout
             grid_data = ((pos, self(cell, **params))
                          for pos, cell in element.items())
@@ -169,9 +272,7 @@ class Operation(param.ParameterizedFunction):
             samples = tuple(d.values for d in element.kdims)
             processed = self(element[samples], **params)
         elif isinstance(element, HoloMap):
-            mapped_items = [(k, self._apply(el, key=k))
-                            for k, el in element.items()]
-            processed = element.clone(mapped_items)
+            processed = element.clone(self._apply_items(element.items()))
         else:
             raise ValueError("Cannot process type %r" % type(element).__name__)
         return processed
@@ -529,6 +529,10 @@ class OptionTree(AttrTree):
     approach method may only be used with the group lists format.
     """
 
+    # Incremented whenever any OptionTree is modified, invalidating
+    # the options resolved by Store.lookup_options
+    _version = 0
+
     def __init__(self, items=None, identifier=None, parent=None,
                  groups=None, options=None, **kwargs):
 
@@ -582,6 +586,11 @@ class OptionTree(AttrTree):
                               group_name=group_name,
                               path = self.path)
 
+    def _propagate(self, path, val):
+        OptionTree._version += 1
+        super(OptionTree, self)._propagate(path, val)
+
+
     def __getitem__(self, item):
         if item in self.groups:
             return self.groups[item]
@@ -1052,6 +1061,12 @@ class Store(object):
 
     current_backend = 'matplotlib'
 
+    # Cache of the Options resolved by lookup_options
+    _lookup_cache = {}
+    _lookup_cache_size = 10000
+    _lookup_version = None
+    _lookup_stats = {'hits': 0, 'misses': 0}
+
     @classmethod
     def options(cls, backend=None, val=None):
         backend = cls.current_backend if backend is None else backend
@@ -1152,11 +1167,45 @@ class Store(object):
 
     @classmethod
     def lookup_options(cls, backend, obj, group):
+        """
+        Returns the Options for the supplied object and option group
+        (e.g. 'plot' or 'style'), resolved from the custom OptionTree
+        for the object id if there is one and the OptionTree for the
+        backend otherwise. The resolved Options are cached until any
+        OptionTree is modified and must therefore not be mutated.
+        """
         # Current custom_options dict may not have entry for obj.id
         if obj.id in cls._custom_options[backend]:
-            return cls._custom_options[backend][obj.id].closest(obj, group)
+            tree = cls._custom_options[backend][obj.id]
         else:
-            return cls._options[backend].closest(obj, group)
+            tree = cls._options[backend]
+
+        if cls._lookup_version != OptionTree._version:
+            cls._lookup_cache.clear()
+            cls._lookup_version = OptionTree._version
+        # Resolution on custom trees falls back to the current backend
+        root = cls._options.get(cls.current_backend)
+        key = (backend, cls.current_backend, obj.id, type(obj).__name__,
+               obj.group, obj.label, group)
+        entry = cls._lookup_cache.get(key)
+        if entry is not None and entry[0] is tree and entry[1] is root:
+            cls._lookup_stats['hits'] += 1
+            return entry[2]
+        cls._lookup_stats['misses'] += 1
+        options = tree.closest(obj, group)
+        if len(cls._lookup_cache) >= cls._lookup_cache_size:
+            cls._lookup_cache.clear()
+        cls._lookup_cache[key] = (tree, root, options)
+        return options
+
+
+    @classmethod
+    def lookup_stats(cls):
+        """
+        Returns a dictionary with the number of hits and misses of the
+        cache used by lookup_options and the number of cached entries.
+        """
+        return dict(cls._lookup_stats, entries=len(cls._lookup_cache))
 
     @classmethod
     def lookup(cls, backend, obj):
@@ -1,6 +1,8 @@
 import itertools
 import types
 import inspect
+import pickle
+import tempfile
 
 from numbers import Number
 from itertools import groupby
@@ -456,11 +458,15 @@ class Callable(param.Parameterized):
     to a DynamicMap.
 
     Additionally, if the memoize attribute is True, a Callable will
-    memoize the last returned value based on the arguments to the
+    memoize the last returned values based on the arguments to the
     function and the state of all streams on its inputs, to avoid
     calling the function unnecessarily. Note that because memoization
     includes the streams found on the inputs it may be disabled if the
-    stream requires it and is triggering.
+    stream requires it and is triggering. The number of memoized
+    values and the approximate memory they may occupy are bounded by
+    the memoize_size and memoize_nbytes parameters, evicting the least
+    recently used values first, and the cache_info property reports
+    the hits, misses and evictions of the cache.
 
     A Callable may also specify a stream_mapping which specifies the
     objects that are associated with interactive (i.e linked) streams
@@ -502,6 +508,20 @@ class Callable(param.Parameterized):
          based on the call arguments and any streams attached to the
          inputs.""")
 
+    memoize_size = param.Integer(default=1, bounds=(1, None), doc="""
+         The maximum number of return values to memoize. Once the
+         limit is reached the least recently used value is evicted.
+         Increasing the size allows revisiting previous stream states
+         or arguments without calling the callable again.""")
+
+    memoize_nbytes = param.Integer(default=None, allow_None=True,
+                                   bounds=(0, None), doc="""
+         The approximate maximum number of bytes of data held by the
+         memoized return values, as estimated from the data of the
+         returned objects. Once exceeded the least recently used values
+         are evicted (the most recent value is always retained). If
+         None only memoize_size bounds the cache.""")
+
     stream_mapping = param.Dict(default={}, constant=True, doc="""
          Defines how streams should be mapped to objects returned by
          the Callable, e.g. when it returns a Layout.""")
@@ -509,7 +529,9 @@ class Callable(param.Parameterized):
     def __init__(self, callable, **params):
         super(Callable, self).__init__(callable=callable,
                                        **dict(params, name=util.callable_name(callable)))
-        self._memoized = {}
+        self._memoized = OrderedDict()
+        self._memoized_nbytes = {}
+        self._cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
         self._is_overlay = False
         self.args = None
         self.kwargs = None
@@ -526,6 +548,47 @@ class Callable(param.Parameterized):
         return self.argspec == noargs
 
 
+    @property
+    def cache_info(self):
+        """
+        Returns a dictionary reporting the number of memoization hits,
+        misses and evictions along with the number of entries and the
+        estimated number of bytes currently held in the cache.
+        """
+        return dict(self._cache_stats, entries=len(self._memoized),
+                    nbytes=sum(self._memoized_nbytes.values()))
+
+
+    def clear_cache(self):
+        """
+        Clears all memoized return values.
+        """
+        self._memoized.clear()
+        self._memoized_nbytes.clear()
+
+
+    def _memoize(self, hashed_key, ret):
+        """
+        Inserts a return value into the memoization cache, evicting
+        the least recently used entries until the size and memory
+        limits are satisfied.
+        """
+        self._memoized.pop(hashed_key, None)
+        self._memoized[hashed_key] = ret
+        if self.memoize_nbytes is not None:
+            self._memoized_nbytes[hashed_key] = util.estimate_nbytes(ret)
+        else:
+            self._memoized_nbytes.pop(hashed_key, None)
+        while len(self._memoized) > 1:
+            nbytes = sum(self._memoized_nbytes.values())
+            if (len(self._memoized) <= self.memoize_size and
+                (self.memoize_nbytes is None or nbytes <= self.memoize_nbytes)):
+                break
+            evicted, _ = self._memoized.popitem(last=False)
+            self._memoized_nbytes.pop(evicted, None)
+            self._cache_stats['evictions'] += 1
+
+
     def clone(self, callable=None, **overrides):
         """
         Allows making a copy of the Callable optionally overriding
@@ -554,7 +617,12 @@ class Callable(param.Parameterized):
 
         hashed_key = util.deephash(key) if self.memoize else None
         if hashed_key is not None and memoize and hashed_key in self._memoized:
-            return self._memoized[hashed_key]
+            self._cache_stats['hits'] += 1
+            ret = self._memoized.pop(hashed_key)
+            self._memoized[hashed_key] = ret
+            return ret
+        elif hashed_key is not None:
+            self._cache_stats['misses'] += 1
 
         if self.argspec.varargs is not None:
             # Missing information on positional argument names, cannot promote to keywords
@@ -587,7 +655,7 @@ class Callable(param.Parameterized):
             raise
 
         if hashed_key is not None:
-            self._memoized = {hashed_key : ret}
+            self._memoize(hashed_key, ret)
         return ret
 
 
@@ -656,6 +724,108 @@ def dynamicmap_memoization(callable_obj, streams):
 
 
 
+class FrameSpill(object):
+    """
+    Disk tier for frames evicted from the DynamicMap cache. Frames are
+    pickled into a single anonymous temporary file, which is deleted
+    by the operating system once it is closed or garbage collected.
+    Frames which cannot be pickled are discarded. Once the space held
+    by frames that were reloaded exceeds the space held by the frames
+    still spilled the file is compacted, so it never grows beyond
+    twice the size of the spilled frames.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = directory
+        self._file = None
+        self._offsets = {}
+        self._nbytes = 0
+        self._dead = 0
+
+    def __contains__(self, key):
+        try:
+            return key in self._offsets
+        except TypeError:
+            return False
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getstate__(self):
+        # Spilled frames are not persisted when pickling the DynamicMap
+        return {'directory': self.directory, '_file': None, '_offsets': {},
+                '_nbytes': 0, '_dead': 0}
+
+    @property
+    def nbytes(self):
+        "The number of bytes held by the spilled frames."
+        return self._nbytes
+
+    def put(self, key, frame):
+        """
+        Pickles the frame to disk, returning whether it was spilled.
+        """
+        try:
+            data = pickle.dumps(frame, protocol=-1)
+        except Exception:
+            return False
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self.directory)
+        if key in self._offsets:
+            self._discard(key)
+        self._file.seek(0, 2)
+        self._offsets[key] = (self._file.tell(), len(data))
+        self._nbytes += len(data)
+        self._file.write(data)
+        return True
+
+    def pop(self, key):
+        """
+        Loads the frame for the supplied key, removing it from disk.
+        """
+        offset, length = self._offsets[key]
+        self._file.seek(offset)
+        frame = pickle.loads(self._file.read(length))
+        self._discard(key)
+        if not self._offsets:
+            self.clear()
+        elif self._dead > self._nbytes:
+            self.compact()
+        return frame
+
+    def _discard(self, key):
+        _, length = self._offsets.pop(key)
+        self._nbytes -= length
+        self._dead += length
+
+    def compact(self):
+        """
+        Rewrites the spilled frames into a new temporary file,
+        reclaiming the space held by frames that were reloaded.
+        """
+        if self._file is None:
+            return
+        compacted = tempfile.TemporaryFile(dir=self.directory)
+        offsets = {}
+        for key, (offset, length) in self._offsets.items():
+            self._file.seek(offset)
+            offsets[key] = (compacted.tell(), length)
+            compacted.write(self._file.read(length))
+        self._file.close()
+        self._file, self._offsets, self._dead = compacted, offsets, 0
+
+    def clear(self):
+        """
+        Discards all spilled frames, deleting the temporary file.
+        """
+        self._offsets.clear()
+        self._nbytes = self._dead = 0
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+
 class periodic(object):
     """
     Implements the utility of the same name on DynamicMap.
@@ -738,6 +908,25 @@ class DynamicMap(HoloMap):
        cache where the least recently used item is overwritten once
        the cache is full.""")
 
+    cache_nbytes = param.Integer(default=None, allow_None=True,
+                                 bounds=(0, None), doc="""
+       The approximate maximum number of bytes of data held by the
+       cached entries, as estimated from the data of each element.
+       Once exceeded the least recently used entries are evicted (the
+       most recently generated entry is always retained). If None only
+       the cache_size bounds the cache.""")
+
+    cache_spill = param.Boolean(default=False, doc="""
+       Whether entries evicted from the cache are pickled to a
+       temporary file on disk instead of being discarded, allowing
+       them to be reloaded without invoking the callback when they
+       are requested again.""")
+
+    cache_spill_dir = param.String(default=None, allow_None=True, doc="""
+       The directory in which the temporary file holding spilled
+       cache entries is created, defaults to the system temporary
+       directory.""")
+
     def __init__(self, callback, initial_items=None, streams=None, **params):
         streams = (streams or [])
 
@@ -783,6 +972,23 @@ class DynamicMap(HoloMap):
                 stream.source = self
         self.redim = redim(self, mode='dynamic')
         self.periodic = periodic(self)
+        self._cache_order = OrderedDict()
+        self._cache_nbytes = 0
+        self._cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0,
+                             'spill_hits': 0}
+        self._spill = FrameSpill()
+
+    @property
+    def cache_info(self):
+        """
+        Returns a dictionary reporting the number of cache hits,
+        misses, evictions and reloads of spilled entries along with the
+        number of entries and the estimated number of bytes currently
+        held in memory and the number of entries spilled to disk.
+        """
+        nbytes = sum(v for k, v in self._cache_order.items() if k in self.data)
+        return dict(self._cache_stats, entries=len(self), nbytes=nbytes,
+                    spilled=len(self._spill))
 
     @property
     def unbounded(self):
@@ -1011,6 +1217,9 @@ class DynamicMap(HoloMap):
         Return a cleared dynamic map with a cleared cached
         """
         self.data = OrderedDict()
+        self._cache_order.clear()
+        self._cache_nbytes = 0
+        self._spill.clear()
         return self
 
 
@@ -1125,7 +1334,13 @@ class DynamicMap(HoloMap):
             empty = util.stream_parameters(self.streams) == [] and self.kdims==[]
             if dimensionless or empty:
                 raise KeyError('Using dimensionless streams disables DynamicMap cache')
+            reloaded = tuple_key in self._spill
+            if reloaded:
+                self._cache_stats['spill_hits'] += 1
+                self._cache(tuple_key, self._spill.pop(tuple_key))
             cache = super(DynamicMap,self).__getitem__(key)
+            if not reloaded:
+                self._touch(tuple_key)
         except KeyError:
             cache = None
 
@@ -1136,6 +1351,7 @@ class DynamicMap(HoloMap):
 
         # Not a cross product and nothing cached so compute element.
         if cache is not None: return cache
+        self._cache_stats['misses'] += 1
         val = self._execute_callback(*tuple_key)
         if data_slice:
             val = self._dataslice(val, data_slice)
@@ -1176,18 +1392,62 @@ class DynamicMap(HoloMap):
             return dmap
 
 
+    def _touch(self, key):
+        """
+        Marks a cached key as the most recently used entry.
+        """
+        try:
+            nbytes = self._cache_order.pop(key)
+        except (KeyError, TypeError):
+            return
+        self._cache_order[key] = nbytes
+        self._cache_stats['hits'] += 1
+
+
     def _cache(self, key, val):
         """
-        Request that a key/value pair be considered for caching.
+        Request that a key/value pair be considered for caching,
+        evicting the least recently used entries if the cache_size or
+        cache_nbytes limits would be exceeded.
         """
         cache_size = (1 if util.dimensionless_contents(self.streams, self.kdims)
                       else self.cache_size)
-        if len(self) >= cache_size:
-            first_key = next(k for k in self.data)
-            self.data.pop(first_key)
+
+        if key in self._cache_order:
+            self._cache_nbytes -= self._cache_order.pop(key)
+        if len(self._cache_order) != len(self.data) - (key in self.data):
+            self._sync_cache_order(key)
+
+        nbytes = util.estimate_nbytes(val)
+        while self._cache_order and (len(self._cache_order) >= cache_size or
+                                     (self.cache_nbytes is not None and
+                                      self._cache_nbytes + nbytes > self.cache_nbytes)):
+            evicted_key, evicted_nbytes = self._cache_order.popitem(last=False)
+            self._cache_nbytes -= evicted_nbytes
+            evicted = self.pop(evicted_key, None)
+            self._cache_stats['evictions'] += 1
+            if self.cache_spill and evicted is not None:
+                self._spill.directory = self.cache_spill_dir
+                self._spill.put(evicted_key, evicted)
+        self._cache_order[key] = nbytes
+        self._cache_nbytes += nbytes
         self[key] = val
 
 
+    def _sync_cache_order(self, key):
+        """
+        Resynchronizes the tracked cache entries with the data after it
+        was modified directly (e.g. on clone), treating entries which
+        are not tracked yet as least recently used.
+        """
+        untracked = [(k, util.estimate_nbytes(v)) for k, v in self.data.items()
+                     if k not in self._cache_order and k != key]
+        tracked = [(k, v) for k, v in self._cache_order.items()
+                   if k in self.data and k != key]
+        self._cache_order = OrderedDict(untracked + tracked)
+        self._cache_nbytes = sum(self._cache_order.values())
+
+
     def map(self, map_fn, specs=None, clone=True, link_inputs=True):
         """
         Recursively replaces elements using a map function when the
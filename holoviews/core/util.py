@@ -1,5 +1,6 @@
 import os, sys, warnings, operator
 import time
+import hashlib
 import types
 import numbers
 import inspect
@@ -96,12 +97,88 @@ class Config(param.ParameterizedFunction):
       maximal allowable sampling difference between sample
       locations.""")
 
+    hash_fingerprint_size = param.Integer(default=None, allow_None=True,
+                                          bounds=(1, None), doc="""
+      The size in bytes above which arrays and DataFrames are hashed
+      from an evenly strided sample of their contents rather than the
+      full data buffer when computing memoization hashes. Fingerprint
+      hashing is much cheaper for very large arrays but may fail to
+      detect changes to values which are not sampled, so it is
+      disabled (None) by default.""")
+
+    hash_fingerprint_samples = param.Integer(default=10000, bounds=(1, None), doc="""
+      The number of evenly strided elements sampled from arrays and
+      DataFrames when fingerprint hashing is enabled.""")
+
     def __call__(self, **params):
         self.set_param(**params)
         return self
 
 config = Config()
 
+def _fingerprint_indices(size):
+    """
+    Returns the flat indices sampled from an array of the given size
+    when fingerprint hashing is enabled, or None if the full array
+    should be hashed.
+    """
+    nsamples = config.hash_fingerprint_samples
+    if size <= nsamples:
+        return None
+    return np.linspace(0, size-1, nsamples).astype('int64')
+
+
+def hash_array(arr):
+    """
+    Computes a content hash of a numpy array directly from its dtype,
+    shape and raw data buffer, avoiding any conversion of the values
+    to Python objects. If config.hash_fingerprint_size is set and the
+    array is larger than the specified number of bytes only an evenly
+    strided sample of the values is hashed. Arrays of object dtype
+    cannot be hashed from their buffer and return None.
+    """
+    if arr.dtype.kind == 'O':
+        return None
+    hasher = hashlib.md5()
+    hasher.update(('%s%s' % (arr.dtype.str, arr.shape)).encode('utf-8'))
+    fingerprint = config.hash_fingerprint_size
+    indices = None
+    if fingerprint is not None and arr.nbytes > fingerprint:
+        indices = _fingerprint_indices(arr.size)
+    if indices is not None:
+        arr = arr.flat[indices]
+    data = np.ascontiguousarray(arr).reshape(-1)
+    hasher.update(data.view(np.uint8))
+    return hasher.hexdigest()
+
+
+def hash_pandas(obj):
+    """
+    Computes a content hash of a pandas Series or DataFrame from
+    vectorized per-row hashes of the values and index (computed by
+    pandas), the column names and dtypes. If config.hash_fingerprint_size
+    is set and the object is larger than the specified number of bytes
+    only an evenly strided sample of the rows is hashed.
+    """
+    fingerprint = config.hash_fingerprint_size
+    if fingerprint is not None:
+        nbytes = obj.memory_usage(index=True, deep=False)
+        if isinstance(obj, pd.DataFrame):
+            nbytes = nbytes.sum()
+        indices = _fingerprint_indices(len(obj)) if nbytes > fingerprint else None
+        if indices is not None:
+            obj = obj.iloc[indices]
+    if isinstance(obj, pd.DataFrame):
+        meta = [list(obj.columns), [str(dt) for dt in obj.dtypes]]
+    else:
+        meta = [obj.name, str(obj.dtype)]
+    row_hashes = pd.util.hash_pandas_object(obj, index=True).values
+    hasher = hashlib.md5()
+    hasher.update(repr(meta).encode('utf-8'))
+    hasher.update(np.ascontiguousarray(row_hashes).view(np.uint8))
+    return hasher.hexdigest()
+
+
 class HashableJSON(json.JSONEncoder):
     """
     Extends JSONEncoder to generate a hashable string for as many types
@@ -117,6 +194,13 @@ class HashableJSON(json.JSONEncoder):
     or numpy arrays, HashableJSON has to convert these types to
     datastructures that can normally be represented as JSON.
 
+    Array-like objects are not serialized but are hashed directly
+    from their data buffers using the functions declared on the
+    content_hashers list, which maps from a type (or tuple of types)
+    to a function returning a hex digest (or None if the object
+    could not be hashed). Custom array types may be supported by
+    appending to this list.
+
     Support for other object types may need to be introduced in
     future. By default, unrecognized object types are represented by
     their id.
@@ -126,11 +210,21 @@ class HashableJSON(json.JSONEncoder):
     """
     string_hashable = (dt.datetime,)
     repr_hashable = ()
+    content_hashers = [(np.ndarray, hash_array)]
 
     def default(self, obj):
         if isinstance(obj, set):
             return hash(frozenset(obj))
-        elif isinstance(obj, np.ndarray):
+        for hash_types, hasher in self.content_hashers:
+            if isinstance(obj, hash_types):
+                try:
+                    digest = hasher(obj)
+                except Exception:
+                    digest = None
+                if digest is not None:
+                    return [type(obj).__name__, digest]
+                break
+        if isinstance(obj, np.ndarray):
             return obj.tolist()
         if pd and isinstance(obj, (pd.Series, pd.DataFrame)):
             return obj.to_csv().encode('utf-8')
@@ -143,6 +237,9 @@ class HashableJSON(json.JSONEncoder):
         except:
             return id(obj)
 
+if pd:
+    HashableJSON.content_hashers.append(((pd.Series, pd.DataFrame), hash_pandas))
+
 
 class periodic(Thread):
     """
@@ -215,6 +312,35 @@ class periodic(Thread):
 
 
 
+def estimate_nbytes(obj, _seen=None):
+    """
+    Estimates the number of bytes occupied by the array data held by
+    an object. Supports numpy arrays, pandas objects and any object
+    exposing an nbytes attribute (e.g. xarray and dask objects) along
+    with dictionaries, lists and tuples of such objects. Other objects
+    with a data attribute (e.g. HoloViews elements and containers) are
+    estimated from their data. Objects referenced more than once are
+    only counted once and unrecognized objects count as zero bytes.
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+    if pd and isinstance(obj, (pd.Series, pd.DataFrame, pd.Index)):
+        nbytes = obj.memory_usage(index=True, deep=False)
+        return int(nbytes.sum() if isinstance(obj, pd.DataFrame) else nbytes)
+    elif isinstance(getattr(obj, 'nbytes', None), numbers.Number):
+        return int(obj.nbytes)
+    elif isinstance(obj, dict):
+        return sum(estimate_nbytes(v, _seen) for v in obj.values())
+    elif isinstance(obj, (list, tuple)):
+        return sum(estimate_nbytes(v, _seen) for v in obj)
+    elif hasattr(obj, 'data') and not isinstance(obj, type):
+        return estimate_nbytes(obj.data, _seen)
+    return 0
+
+
 def deephash(obj):
     """
     Given an object, return a hash using HashableJSON. This hash is not
@@ -972,6 +1098,72 @@ def unique_array(arr):
         return arr[np.sort(uniq_inds)]
 
 
+def _rank_codes(codes, first):
+    """
+    Renumbers integer codes such that they are ordered by the supplied
+    first index at which each code appears.
+    """
+    order = np.argsort(first, kind='mergesort')
+    ranks = np.empty(len(order), dtype='int64')
+    ranks[order] = np.arange(len(order))
+    return ranks[codes], order
+
+
+def factorize(values):
+    """
+    Encodes an array as integer codes along with the unique values in
+    order of first appearance. Null values (NaN, NaT and None) are
+    assigned a single code of their own.
+    """
+    values = np.asarray(values)
+    if pd:
+        codes, uniques = pd.factorize(values, sort=False)
+        uniques = np.asarray(uniques)
+        nulls = codes == -1
+        if not nulls.any():
+            return codes, uniques
+        codes = np.where(nulls, len(uniques), codes)
+        uniques = np.append(uniques, values[np.argmax(nulls)])
+        codes, order = _rank_codes(codes, np.unique(codes, return_index=True)[1])
+        return codes, uniques[order]
+    try:
+        uniques, first, inverse = np.unique(values, return_index=True,
+                                            return_inverse=True)
+    except TypeError:
+        # Mixed types cannot be sorted, fall back to Python hashing
+        lookup = {}
+        codes = np.array([lookup.setdefault(v, len(lookup)) for v in values.tolist()],
+                         dtype='int64')
+        return codes, values[np.unique(codes, return_index=True)[1]]
+    codes, order = _rank_codes(inverse, first)
+    return codes, uniques[order]
+
+
+def group_indices(columns):
+    """
+    Computes the groups formed by the unique combinations of values
+    across a list of equal length key columns in a few vectorized
+    passes, avoiding a selection mask per group. Returns the index of
+    the first row of each group (in order of first appearance), a
+    stable sort index which orders the rows by group and the offsets
+    delimiting each group in the sorted order, i.e. the rows of group
+    i are given by index[offsets[i]:offsets[i+1]].
+    """
+    codes = None
+    for column in columns:
+        col_codes, uniques = factorize(column)
+        if codes is None:
+            codes = col_codes
+        else:
+            codes, _ = factorize(codes * len(uniques) + col_codes)
+    if codes is None or not len(codes):
+        return (np.array([], dtype='int64'),)*2 + (np.array([0], dtype='int64'),)
+    index = np.argsort(codes, kind='mergesort')
+    counts = np.bincount(codes)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    return index[offsets[:-1]], index, offsets
+
+
 def match_spec(element, specification):
     """
     Matches the group.label specification of the supplied
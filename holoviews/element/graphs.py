@@ -4,13 +4,14 @@ import param
 import numpy as np
 
 from ..core import Dimension, Dataset, Element2D
+from ..core.data import RaggedData
 from ..core.dimension import redim
 from ..core.util import max_range, search_indices
 from ..core.operation import Operation
 from .chart import Points
 from .path import Path
-from .util import (split_path, pd, circular_layout, connect_edges,
-                   connect_edges_pd, quadratic_bezier)
+from .util import split_path, pd, circular_layout, connect_edges_ragged
+from .util import connect_edges, connect_edges_pd # noqa (API import)
 
 
 class redim_graph(redim):
@@ -368,11 +369,8 @@ class Graph(Dataset, Element2D):
         """
         if self._edgepaths:
             return self._edgepaths
-        if pd is None:
-            paths = connect_edges(self)
-        else:
-            paths = connect_edges_pd(self)
-        return self.edge_type(paths, kdims=self.nodes.kdims[:2])
+        paths = connect_edges_ragged(self)
+        return self.edge_type(paths, kdims=self.nodes.kdims[:2], datatype=['ragged'])
 
 
     @classmethod
@@ -554,6 +552,49 @@ class layout_chords(Operation):
     max_chords = param.Integer(default=500, doc="""
         Maximum number of chords to render.""")
 
+    @classmethod
+    def _assign_chords(cls, src_idx, tgt_idx, n_conns, n_slots):
+        """
+        Assigns the chords of each edge a slot in the angular slice
+        of its source and target node. Each edge draws as many chords
+        as the total weight between its nodes and slots are popped
+        from the end of each slice in edge order. Returns the edge
+        each chord belongs to and the source and target slot of each
+        chord.
+        """
+        chord_edges = np.repeat(np.arange(len(n_conns)), n_conns)
+        src, tgt = src_idx[chord_edges], tgt_idx[chord_edges]
+        demand = np.bincount(np.concatenate([src, tgt]), minlength=len(n_slots))
+        if (demand <= n_slots).all():
+            # Every chord finds a free slot so the number of slots
+            # popped before each one can be computed by ranking the
+            # pops on each node
+            pops = np.column_stack([src, tgt]).ravel()
+            order = np.argsort(pops, kind='mergesort')
+            group_start = np.concatenate([[0], np.cumsum(np.bincount(pops, minlength=len(n_slots)))])
+            ranks = np.empty(len(pops), dtype='int64')
+            ranks[order] = np.arange(len(pops)) - group_start[pops[order]]
+            slots = n_slots[pops] - 1 - ranks
+            return chord_edges, slots[::2], slots[1::2]
+
+        # Duplicate edges exhaust the slots of a node, in which case
+        # chords are skipped once either slice is empty
+        remaining = n_slots.copy()
+        edges, src_slots, tgt_slots = [], [], []
+        for i, (s, t, n) in enumerate(zip(src_idx, tgt_idx, n_conns)):
+            for _ in range(n):
+                if not remaining[s] or not remaining[t]:
+                    continue
+                remaining[s] -= 1
+                src_slot = remaining[s]
+                if not remaining[t]:
+                    continue
+                remaining[t] -= 1
+                edges.append(i)
+                src_slots.append(src_slot)
+                tgt_slots.append(remaining[t])
+        return tuple(np.array(v, dtype='int64') for v in (edges, src_slots, tgt_slots))
+
     def _process(self, element, key=None):
         nodes_el = element._nodes
         if nodes_el:
@@ -584,8 +625,7 @@ class layout_chords(Operation):
 
         # Compute connectivity matrix
         matrix = np.zeros((len(nodes), len(nodes)))
-        for s, t, v in zip(src_idx, tgt_idx, values):
-            matrix[s, t] += v
+        np.add.at(matrix, (src_idx, tgt_idx), values)
 
         # Compute weighted angular slice for each connection
         weights_of_areas = (matrix.sum(axis=0) + matrix.sum(axis=1))
@@ -601,40 +641,36 @@ class layout_chords(Operation):
         mxs = np.cos(midpoints)
         mys = np.sin(midpoints)
 
-        # Compute angles of chords in each edge
-        all_areas = []
-        for i in range(areas_in_radians.shape[0]):
-            n_conn = weights_of_areas[i]
-            p0, p1 = points[i], points[i+1]
-            angles = np.linspace(p0, p1, n_conn)
-            coords = list(zip(np.cos(angles), np.sin(angles)))
-            all_areas.append(coords)
-
-        # Draw each chord by interpolating quadratic splines
-        # Separate chords in each edge by NaNs
-        empty = np.array([[np.NaN, np.NaN]])
-        paths = []
-        for i in range(len(element)):
-            sidx, tidx = src_idx[i], tgt_idx[i]
-            src_area, tgt_area = all_areas[sidx], all_areas[tidx]
-            n_conns = matrix[sidx, tidx]
-            subpaths = []
-            for _ in range(int(n_conns)):
-                if not src_area or not tgt_area:
-                    continue
-                x0, y0 = src_area.pop()
-                if not tgt_area:
-                    continue
-                x1, y1 = tgt_area.pop()
-                b = quadratic_bezier((x0, y0), (x1, y1), (x0/2., y0/2.),
-                                     (x1/2., y1/2.), steps=self.p.chord_samples)
-                subpaths.append(b)
-                subpaths.append(empty)
-            subpaths = [p for p in subpaths[:-1] if len(p)]
-            if subpaths:
-                paths.append(np.concatenate(subpaths))
-            else:
-                paths.append(np.empty((0, 2)))
+        # Assign each chord an angle in the slice of its source and
+        # target node, slices are consumed from their end
+        n_conns = matrix[src_idx, tgt_idx].astype('int64')
+        n_slots = weights_of_areas.astype('int64')
+        chord_edges, chord_src, chord_tgt = self._assign_chords(
+            src_idx, tgt_idx, n_conns, n_slots)
+        steps = (points[1:]-points[:-1])/np.maximum(n_slots-1, 1)
+        src_angles = points[src_idx[chord_edges]] + chord_src*steps[src_idx[chord_edges]]
+        tgt_angles = points[tgt_idx[chord_edges]] + chord_tgt*steps[tgt_idx[chord_edges]]
+        x0, y0 = np.cos(src_angles)[:, None], np.sin(src_angles)[:, None]
+        x1, y1 = np.cos(tgt_angles)[:, None], np.sin(tgt_angles)[:, None]
+
+        # Draw all chords by interpolating quadratic splines, each
+        # chord is followed by a NaN separator
+        t = np.linspace(0, 1, self.p.chord_samples)
+        c0, c1 = (1-t)**3+1.5*(1-t)**2*t, 1.5*(1-t)*t**2+t**3
+        n_chords, samples = len(chord_edges), self.p.chord_samples+1
+        chords = np.full((n_chords, samples, 2), np.NaN)
+        chords[:, :-1, 0] = x0*c0 + x1*c1
+        chords[:, :-1, 1] = y0*c0 + y1*c1
+        chords = chords.reshape(-1, 2)
+
+        # Group chords by edge dropping the trailing separator of each
+        offsets = np.zeros(len(element)+1, dtype='int64')
+        offsets[1:] = np.bincount(chord_edges, minlength=len(element)).cumsum()
+        nonempty = offsets[1:] > offsets[:-1]
+        chords = np.delete(chords, offsets[1:][nonempty]*samples-1, axis=0)
+        offsets = offsets*samples - np.concatenate([[0], nonempty.cumsum()])
+        columns = [(d.name, chords[:, i]) for i, d in enumerate(EdgePaths.kdims)]
+        paths = RaggedData(columns, offsets)
 
         # Construct Chord element from components
         if nodes_el:
@@ -648,7 +684,7 @@ class layout_chords(Operation):
             kdims = Nodes.kdims
             values, vdims = (), []
         nodes = Nodes((mxs, mys, nodes)+values, kdims=kdims, vdims=vdims)
-        edges = EdgePaths(paths)
+        edges = EdgePaths(paths, datatype=['ragged'])
         chord = Chord((element.data, nodes, edges), compute=False)
         chord._angles = points
         return chord
@@ -33,7 +33,9 @@ class Path(Dataset, Element2D):
     extensible list of interfaces. Natively, HoloViews provides the
     MultiInterface which allows representing paths as lists of regular
     columnar data objects including arrays, dataframes and
-    dictionaries of column arrays and scalars.
+    dictionaries of column arrays and scalars. Large numbers of paths
+    are more efficiently stored using the 'ragged' datatype, which
+    concatenates the columns of all paths into contiguous arrays.
 
     The canonical representation is a list of dictionaries storing the
     x- and y-coordinates along with any other values:
@@ -59,7 +61,7 @@ class Path(Dataset, Element2D):
 
     group = param.String(default="Path", constant=True)
 
-    datatype = param.ObjectSelector(default=['multitabular'])
+    datatype = param.ObjectSelector(default=['multitabular', 'ragged'])
 
     def __init__(self, data, kdims=None, vdims=None, **params):
         if isinstance(data, tuple) and len(data) == 2:
@@ -70,7 +72,8 @@ class Path(Dataset, Element2D):
                 raise ValueError("Path x and y values must be the same length.")
             data = [np.column_stack((x, y[:, i])) for i in range(y.shape[1])]
         elif isinstance(data, list) and all(isinstance(path, Path) for path in data):
-            data = [p for path in data for p in path.data]
+            data = [p for path in data for p in
+                    (path.data if isinstance(path.data, list) else path.split(datatype='columns'))]
         super(Path, self).__init__(data, kdims=kdims, vdims=vdims, **params)
 
     def __setstate__(self, state):
@@ -1,4 +1,5 @@
 import itertools
+import warnings
 
 import param
 import numpy as np
@@ -246,49 +247,610 @@ def quadratic_bezier(start, end, c0=(0, 0), c1=(0, 0), steps=50):
     return np.column_stack([xs, ys])
 
 
-def connect_edges_pd(graph):
+def edge_node_indices(graph):
     """
-    Given a Graph element containing abstract edges compute edge
-    segments directly connecting the source and target nodes. This
-    operation depends on pandas and is a lot faster than the pure
-    NumPy equivalent.
+    Given a Graph element returns the positions of the source and
+    target node of each edge in the nodes of the Graph. Rather than
+    selecting the nodes of each edge individually the node index is
+    hashed (if pandas is available) or sorted and all edges are
+    looked up at once. Edges which reference a node which does not
+    exist are assigned a position of -1.
+    """
+    nodes = graph.nodes.dimension_values(2)
+    edges = [graph.dimension_values(i) for i in range(2)]
+    if not len(nodes):
+        return tuple(np.full(len(e), -1, dtype=np.int64) for e in edges)
+    if pd is not None:
+        index = pd.Index(nodes)
+        positions = None
+        if not index.is_unique:
+            first = ~index.duplicated()
+            index, positions = index[first], np.flatnonzero(first)
+        indices = []
+        for values in edges:
+            idx = index.get_indexer(values)
+            if positions is not None:
+                idx = np.where(idx < 0, -1, positions[idx])
+            indices.append(idx)
+        return tuple(indices)
+    sorter = np.argsort(nodes, kind='mergesort')
+    sorted_nodes = nodes[sorter]
+    indices = []
+    for values in edges:
+        idx = np.searchsorted(sorted_nodes, values).clip(0, len(nodes)-1)
+        indices.append(np.where(sorted_nodes[idx] == values, sorter[idx], -1))
+    return tuple(indices)
+
+
+def edge_segments(graph, drop_missing=False):
     """
-    edges = graph.dframe()
-    edges.index.name = 'graph_edge_index'
-    edges = edges.reset_index()
-    nodes = graph.nodes.dframe()
-    src, tgt = graph.kdims
-    x, y, idx = graph.nodes.kdims[:3]
+    Given a Graph element containing abstract edges compute an array
+    of shape (N, 2, 2) containing the start and end coordinates of
+    the segment directly connecting the source and target node of each
+    edge. If drop_missing is enabled edges which reference nodes that
+    do not exist are dropped, otherwise a ValueError is raised.
+    """
+    src, tgt = edge_node_indices(graph)
+    missing = (src < 0) | (tgt < 0)
+    if missing.any():
+        if not drop_missing:
+            raise ValueError('Could not find node positions for all edges')
+        src, tgt = src[~missing], tgt[~missing]
+    xs, ys = (graph.nodes.dimension_values(i) for i in range(2))
+    segments = np.empty((len(src), 2, 2), dtype=np.result_type(xs, ys))
+    segments[:, 0, 0], segments[:, 0, 1] = xs[src], ys[src]
+    segments[:, 1, 0], segments[:, 1, 1] = xs[tgt], ys[tgt]
+    return segments
 
-    df = pd.merge(edges, nodes, left_on=[src.name], right_on=[idx.name])
-    df = df.rename(columns={x.name: 'src_x', y.name: 'src_y'})
 
-    df = pd.merge(df, nodes, left_on=[tgt.name], right_on=[idx.name])
-    df = df.rename(columns={x.name: 'dst_x', y.name: 'dst_y'})
-    df = df.sort_values('graph_edge_index').drop(['graph_edge_index'], axis=1)
+def connect_edges_ragged(graph):
+    """
+    Given a Graph element containing abstract edges compute the edge
+    segments directly connecting the source and target nodes as
+    RaggedData, storing the coordinates of all segments in contiguous
+    columns rather than as one array per edge. Edges referencing nodes
+    which do not exist are dropped.
+    """
+    from ..core.data import RaggedData
+    segments = edge_segments(graph, drop_missing=True)
+    x, y = graph.nodes.kdims[:2]
+    columns = [(x.name, segments[:, :, 0].ravel()),
+               (y.name, segments[:, :, 1].ravel())]
+    return RaggedData(columns, np.arange(0, len(segments)*2+1, 2))
+
 
-    edge_segments = []
-    for i, edge in df.iterrows():
-        start = edge['src_x'], edge['src_y']
-        end = edge['dst_x'], edge['dst_y']
-        edge_segments.append(np.array([start, end]))
-    return edge_segments
+def connect_edges_pd(graph):
+    """
+    Given a Graph element containing abstract edges compute edge
+    segments directly connecting the source and target nodes. Edges
+    referencing nodes which do not exist are dropped.
+    """
+    return list(edge_segments(graph, drop_missing=True))
 
 
 def connect_edges(graph):
     """
     Given a Graph element containing abstract edges compute edge
-    segments directly connecting the source and target nodes.  This
-    operation just uses internal HoloViews operations and will be a
-    lot slower than the pandas equivalent.
-    """
-    paths = []
-    for start, end in graph.array(graph.kdims):
-        start_ds = graph.nodes[:, :, start]
-        end_ds = graph.nodes[:, :, end]
-        if not len(start_ds) or not len(end_ds):
-            raise ValueError('Could not find node positions for all edges')
-        start = start_ds.array(start_ds.kdims[:2])
-        end = end_ds.array(end_ds.kdims[:2])
-        paths.append(np.array([start[0], end[0]]))
-    return paths
+    segments directly connecting the source and target nodes. Raises
+    a ValueError if the position of a node could not be found.
+    """
+    return list(edge_segments(graph))
+
+
+class GridIndex(object):
+    """
+    Bucketed spatial index over a set of 2D points. The points are
+    binned on a regular grid spanning their extent and the point
+    indices are sorted by bin, so that the points within a rectangular
+    region can be looked up by only visiting the bins overlapping it
+    rather than scanning all the points. Points with non-finite
+    coordinates are never returned.
+    """
+
+    def __init__(self, xs, ys, bins=256):
+        xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+        valid = np.isfinite(xs) & np.isfinite(ys)
+        self.xs, self.ys, self.bins = xs, ys, bins
+        if valid.any():
+            self.x0, self.x1 = xs[valid].min(), xs[valid].max()
+            self.y0, self.y1 = ys[valid].min(), ys[valid].max()
+        else:
+            self.x0 = self.x1 = self.y0 = self.y1 = 0
+        xidx, yidx = self._bin(xs, ys)
+        buckets = np.where(valid, xidx*bins+yidx, bins*bins)
+        self.order = np.argsort(buckets)
+        counts = np.bincount(buckets, minlength=bins*bins+1)
+        self.offsets = np.concatenate([[0], np.cumsum(counts)])
+
+    def _bin(self, xs, ys):
+        bins = self.bins
+        xscale = bins/float(self.x1-self.x0) if self.x1 > self.x0 else 0
+        yscale = bins/float(self.y1-self.y0) if self.y1 > self.y0 else 0
+        with np.errstate(invalid='ignore'):
+            xidx = np.clip(np.nan_to_num((xs-self.x0)*xscale), 0, bins-1).astype(int)
+            yidx = np.clip(np.nan_to_num((ys-self.y0)*yscale), 0, bins-1).astype(int)
+        return xidx, yidx
+
+    def query(self, x_range, y_range, sort=True):
+        """
+        Returns the indices of the points within the supplied x- and
+        y-ranges, where the lower bound is inclusive and the upper
+        bound exclusive. Unless sort is enabled the indices are
+        returned in the order of the bins rather than in data order.
+        """
+        (xstart, xend), (ystart, yend) = x_range, y_range
+        if (xend < self.x0 or xstart > self.x1 or
+            yend < self.y0 or ystart > self.y1):
+            return np.array([], dtype=int)
+        (xi0, xi1), (yi0, yi1) = self._bin(np.array([xstart, xend], dtype=float),
+                                           np.array([ystart, yend], dtype=float))
+        bins, offsets = self.bins, self.offsets
+        candidates = np.concatenate([
+            self.order[offsets[xi*bins+yi0]:offsets[xi*bins+yi1+1]]
+            for xi in range(xi0, xi1+1)])
+        xs, ys = self.xs[candidates], self.ys[candidates]
+        mask = (xs >= xstart) & (xs < xend) & (ys >= ystart) & (ys < yend)
+        selected = candidates[mask]
+        return np.sort(selected) if sort else selected
+
+
+def lttb_indices(xs, ys, n):
+    """
+    Downsamples a series of points to n points using the
+    Largest-Triangle-Three-Buckets algorithm, which retains the visual
+    shape of a line, returning the indices of the selected points.
+    """
+    N = len(xs)
+    if n >= N:
+        return np.arange(N)
+    elif n < 3:
+        return np.array([0, N-1][:n], dtype=int)
+    xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+    edges = np.linspace(1, N-1, n-1).astype(int)
+    selected = np.empty(n, dtype=int)
+    selected[0], selected[-1] = 0, N-1
+    a = 0
+    for i in range(n-2):
+        start, end = edges[i], edges[i+1]
+        if i == n-3:
+            avg_x, avg_y = xs[-1], ys[-1]
+        else:
+            next_end = edges[i+2]
+            avg_x = np.nanmean(xs[end:next_end])
+            avg_y = np.nanmean(ys[end:next_end])
+        bx, by = xs[start:end], ys[start:end]
+        area = np.abs((xs[a]-avg_x)*(by-ys[a]) - (xs[a]-bx)*(avg_y-ys[a]))
+        area[~np.isfinite(area)] = -1
+        a = start + int(np.argmax(area))
+        selected[i+1] = a
+    return selected
+
+
+def minmax_indices(xs, ys, n):
+    """
+    Downsamples a series of points by splitting the x-axis into n/2
+    equal-width bins (e.g. one per pixel column) and selecting the
+    points with the minimum and maximum y-value in each bin, returning
+    the sorted indices of the selected points.
+    """
+    N = len(xs)
+    if n >= N:
+        return np.arange(N)
+    xs, ys = np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+    valid = np.flatnonzero(np.isfinite(xs) & np.isfinite(ys))
+    if not len(valid):
+        return np.array([], dtype=int)
+    nbins = max(n//2, 1)
+    vx, vy = xs[valid], ys[valid]
+    x0, x1 = vx.min(), vx.max()
+    scale = nbins/(x1-x0) if x1 > x0 else 0
+    bins = np.clip(((vx-x0)*scale).astype(int), 0, nbins-1)
+    order = np.lexsort((vy, bins))
+    sorted_bins = bins[order]
+    first = np.flatnonzero(np.r_[True, sorted_bins[1:] != sorted_bins[:-1]])
+    last = np.r_[first[1:]-1, len(order)-1]
+    return np.unique(valid[order[np.concatenate([first, last])]])
+
+
+class ImagePyramid(object):
+    """
+    Multi-resolution pyramid over a 2D array (or a 3D array of
+    channels), where each level halves the resolution of the previous
+    one by aggregating blocks of 2x2 pixels with the mean or maximum,
+    ignoring NaNs. Arrays with an odd number of rows or columns are
+    padded with NaNs, so that each pixel on level n covers exactly
+    2**n pixels of the original array along each axis.
+    """
+
+    def __init__(self, array, aggregator='mean'):
+        if aggregator not in ('mean', 'max'):
+            raise ValueError("ImagePyramid aggregator must be 'mean' or 'max', "
+                             "got %r." % aggregator)
+        reduce_fn = np.nanmean if aggregator == 'mean' else np.nanmax
+        dtype = array.dtype if array.dtype.kind == 'f' else np.float64
+        self.aggregator = aggregator
+        self.levels = [array]
+        while max(self.levels[-1].shape[:2]) > 1:
+            arr = self.levels[-1].astype(dtype, copy=False)
+            ny, nx = arr.shape[:2]
+            if ny % 2 or nx % 2:
+                pad = [(0, ny % 2), (0, nx % 2)] + [(0, 0)]*(arr.ndim-2)
+                arr = np.pad(arr, pad, 'constant', constant_values=np.NaN)
+            ny, nx = arr.shape[:2]
+            blocks = arr.reshape((ny//2, 2, nx//2, 2)+arr.shape[2:])
+            with warnings.catch_warnings():
+                # Blocks only containing NaNs are expected
+                warnings.simplefilter('ignore', RuntimeWarning)
+                self.levels.append(reduce_fn(blocks, axis=(1, 3)))
+
+    def level(self, factor):
+        """
+        Returns the index of the coarsest level whose resolution is
+        reduced by at most the supplied factor.
+        """
+        if factor < 2:
+            return 0
+        return min(int(np.log2(factor)), len(self.levels)-1)
+
+
+def contour_levels(zmin, zmax, n):
+    """
+    Picks at most n+1 evenly spaced contour levels at round numbers
+    spanning the range from zmin to zmax, trimming levels beyond the
+    first level below zmin and above zmax. Equivalent to the levels
+    matplotlib picks given an integer number of contour levels.
+    """
+    nbins = n + 1
+    raw_step = (zmax - zmin) / float(nbins)
+    mean = (zmax + zmin) / 2.
+    if abs(mean) / (zmax - zmin) < 100:
+        offset = 0
+    else:
+        offset = np.copysign(10**np.floor(np.log10(abs(mean))), mean)
+    vmin, vmax = zmin - offset, zmax - offset
+    steps = np.array([1, 1.5, 2, 2.5, 3, 4, 5, 6, 8, 10])
+    steps = np.concatenate([0.1*steps[:-1], steps, [10*steps[1]]])
+    steps = steps * 10**np.floor(np.log10(raw_step))
+    for step in steps[:np.flatnonzero(steps >= raw_step)[0]+1][::-1]:
+        # Allow for loss of precision when the offset is large
+        tol = 1e-10
+        if offset:
+            tol = min(0.4999, max(tol, 10**(np.log10(abs(offset)/step) - 12)))
+        best_min = (vmin // step) * step
+        low, rem = divmod(vmin - best_min, step)
+        if abs(rem/step - 1) < tol:
+            low += 1
+        high, rem = divmod(vmax - best_min, step)
+        if abs(rem/step) >= tol:
+            high += 1
+        levels = np.arange(low, high+1) * step + best_min
+        if ((levels >= vmin) & (levels <= vmax)).any():
+            break
+    levels = levels + offset
+    under = np.flatnonzero(levels < zmin)
+    over = np.flatnonzero(levels > zmax)
+    i0 = under[-1] if len(under) else 0
+    i1 = over[0]+1 if len(over) else len(levels)
+    if i1 - i0 < 3:
+        i0, i1 = 0, len(levels)
+    return levels[i0:i1]
+
+
+def _contour_segments(start_above, center_above, edges):
+    """
+    Computes the marching squares line segments through each quad of
+    a grid given whether each corner of the quads is above the
+    contour level. The corners and edges are given as (Q, 4) arrays
+    in counter-clockwise order, with edge k running from corner k to
+    corner k+1. Segments are oriented so that the nodes above the
+    level are on the left, so a segment starts where the
+    level is crossed downward going around the quad and ends on the
+    next upward crossing. In saddle quads the segments instead end on
+    the previous upward crossing if the center of the quad is below
+    the level. Returns the start and end edge and the quad of each
+    segment.
+    """
+    end_above = start_above[:, [1, 2, 3, 0]]
+    down = start_above & ~end_above
+    up = ~start_above & end_above
+    saddle = down.sum(axis=1) == 2
+    quads, positions = np.nonzero(down)
+    up, rows = up[quads], np.arange(len(quads))
+    p1, p2, p3 = (positions+1) % 4, (positions+2) % 4, (positions+3) % 4
+    ends = np.where(up[rows, p1], p1, np.where(up[rows, p2], p2, p3))
+    ends = np.where(saddle[quads] & ~center_above[quads], p3, ends)
+    return edges[quads, positions], edges[quads, ends], quads
+
+
+def _rank_chains(succ):
+    """
+    Given the index of the successor of each point in a set of
+    disjoint chains (or -1 for the last point in a chain) returns the
+    last point of the chain each point belongs to and the distance to
+    it, using pointer jumping. Points on cycles never reach the end of
+    a chain and are flagged as unfinished.
+    """
+    n = len(succ)
+    index = np.arange(n)
+    nxt = np.where(succ < 0, index, succ)
+    dist = (succ >= 0).astype('int64')
+    finished = succ < 0
+    while True:
+        dist, nxt = dist + dist[nxt], nxt[nxt]
+        now_finished = succ[nxt] < 0
+        if (now_finished == finished).all():
+            break
+        finished = now_finished
+    return nxt, dist, finished
+
+
+def _link_segments(starts, ends, quads, stride):
+    """
+    Links directed segments between point ids into chains, where the
+    end point of one segment is the start point of another. Cycles
+    are broken at their lowest point id and marked as closed. Returns
+    the point ids ordered by chain, the offsets of each chain into the
+    points and whether each chain is closed. Chains are ordered by the
+    group of their points, given by the point id divided by the
+    stride, and then by the quad their first segment passes through.
+    """
+    ids, inverse = np.unique(np.concatenate([starts, ends]), return_inverse=True)
+    n, m = len(ids), len(starts)
+    src, dst = inverse[:m], inverse[m:]
+    succ = np.full(n, -1, dtype='int64')
+    succ[src] = dst
+    pred = np.full(n, -1, dtype='int64')
+    pred[dst] = src
+    heads = pred < 0
+
+    # Break cycles at their lowest point
+    terminal, dist, finished = _rank_chains(succ)
+    closed = np.zeros(n, dtype=bool)
+    cyclic = np.flatnonzero(~finished)
+    if len(cyclic):
+        lookup = np.full(n, -1, dtype='int64')
+        lookup[cyclic] = np.arange(len(cyclic))
+        low, jump = cyclic, lookup[succ[cyclic]]
+        while True:
+            new_low, jump = np.minimum(low, low[jump]), jump[jump]
+            if (new_low == low).all():
+                break
+            low = new_low
+        cycle_heads = cyclic[low == cyclic]
+        heads[cycle_heads] = True
+        closed[pred[cycle_heads]] = True
+        succ[pred[cycle_heads]] = -1
+        terminal, dist, _ = _rank_chains(succ)
+
+    # Order chains by group, the quad they start in and their head
+    # and place each point by its distance from the end of its chain
+    head_quads = np.zeros(n, dtype='int64')
+    head_quads[src] = quads
+    heads = np.flatnonzero(heads)
+    heads = heads[np.lexsort((heads, head_quads[heads], ids[heads] // stride))]
+    offsets = np.concatenate([[0], np.cumsum(dist[heads]+1)])
+    chain_end = np.zeros(n, dtype='int64')
+    chain_end[terminal[heads]] = offsets[1:]-1
+    order = np.empty(n, dtype='int64')
+    order[chain_end[terminal]-dist] = np.arange(n)
+    return ids[order], offsets, closed[terminal[heads]]
+
+
+def _ring_area(coords, offsets):
+    "Computes the signed area of each closed ring using the shoelace formula."
+    x, y = coords[:, 0], coords[:, 1]
+    nxt = np.arange(1, len(coords)+1)
+    nxt[offsets[1:]-1] = offsets[:-1]
+    cross = x*y[nxt] - x[nxt]*y
+    return np.add.reduceat(cross, offsets[:-1])/2.
+
+
+def _points_in_ring(points, ring):
+    "Tests whether each point lies inside the ring using ray casting."
+    x0, y0 = ring[:, 0], ring[:, 1]
+    x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+    px, py = points[:, :1], points[:, 1:]
+    crosses = (y0 > py) != (y1 > py)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        xs = x0 + (py-y0)*(x1-x0)/(y1-y0)
+        return (crosses & (px < xs)).sum(axis=1) % 2 == 1
+
+
+def marching_squares(xs, ys, zs, levels, filled=False):
+    """
+    Computes contour lines or filled contours of a 2D array of values
+    using the marching squares algorithm. The xs and ys define the
+    coordinates of the values and may be 1D or 2D arrays, for
+    curvilinear grids. Quads with a NaN corner are treated as lying
+    outside the grid.
+
+    All levels are processed at once, returning a list containing a
+    list of (N, 2) arrays of the lines for each level if filled is
+    False. Closed lines repeat their first point at the end.
+
+    If filled is True the polygons between each pair of consecutive
+    levels are computed instead, covering the values above the lower
+    level and up to and including the upper level (or including the
+    lower level if it is the minimum value). Returns a list containing
+    a list of (exterior, holes) tuples of each polygon for each pair
+    of levels.
+    """
+    zs = np.asarray(zs, dtype=np.float64)
+    ny, nx = zs.shape
+    xs, ys = np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)
+    if xs.ndim == 1:
+        xs, ys = np.meshgrid(xs, ys)
+    xs, ys, zs = xs.ravel(), ys.ravel(), zs.ravel()
+    levels = np.asarray(levels, dtype=np.float64)
+    nlevels = len(levels)-1 if filled else len(levels)
+    results = [[] for _ in range(max(nlevels, 0))]
+    if nx < 2 or ny < 2 or nlevels < 1:
+        return results
+
+    # Node and edge indices of each quad in counter-clockwise order,
+    # horizontal edges are numbered before vertical edges
+    nh = ny*(nx-1)
+    nedges = nh + (ny-1)*nx
+    def quad_geometry(quads):
+        qj, qi = quads // (nx-1), quads % (nx-1)
+        a = qj*nx + qi
+        corners = np.column_stack([a, a+1, a+nx+1, a+nx])
+        edges = np.column_stack([qj*(nx-1)+qi, nh+a+1, (qj+1)*(nx-1)+qi, nh+a])
+        return corners, edges
+    grid = zs.reshape(ny, nx)
+    valid = np.isfinite(grid)
+    valid = (valid[:-1, :-1] & valid[:-1, 1:] & valid[1:, 1:] & valid[1:, :-1]).ravel()
+    centers = ((grid[:-1, :-1] + grid[:-1, 1:] + grid[1:, 1:] + grid[1:, :-1])/4.).ravel()
+
+    # The range of values of each quad, which is NaN if a corner is
+    # NaN so that the quad is never crossed
+    zmin = np.minimum(np.minimum(grid[:-1, :-1], grid[:-1, 1:]),
+                      np.minimum(grid[1:, 1:], grid[1:, :-1])).ravel()
+    zmax = np.maximum(np.maximum(grid[:-1, :-1], grid[:-1, 1:]),
+                      np.maximum(grid[1:, 1:], grid[1:, :-1])).ravel()
+
+    # Filled contours are closed along the edges of the grid, which
+    # are the quad edges not shared with another valid quad. Points at
+    # grid nodes are identified by the boundary edge leaving the node,
+    # which is the next edge of the same quad if it is on the boundary
+    # so that quads touching only at a corner are kept apart
+    if filled:
+        lowers, uppers = levels[:-1].copy(), levels[1:]
+        if len(zs) and lowers[0] == np.nanmin(zs):
+            lowers[0] -= 1
+        padded = np.pad(valid.reshape(ny-1, nx-1), 1, 'constant')
+        neighbors = [padded[:-2, 1:-1], padded[1:-1, 2:], padded[2:, 1:-1], padded[1:-1, :-2]]
+        interior = neighbors[0] & neighbors[1] & neighbors[2] & neighbors[3]
+        quads = np.flatnonzero(valid & ~interior.ravel())
+        corners, edges = quad_geometry(quads)
+        boundary = ~np.column_stack([n.ravel()[quads] for n in neighbors])
+        nboundary = boundary.sum()
+        boundary_index = np.full(edges.shape, -1, dtype='int64')
+        boundary_index[boundary] = np.arange(nboundary)
+        rows, positions = np.nonzero(boundary)
+        b_quads, b_edges = quads[rows], edges[boundary]
+        b_start, b_end = corners[boundary], np.roll(corners, -1, axis=1)[boundary]
+        leaving = np.full(len(zs), -1, dtype='int64')
+        leaving[b_start] = np.arange(nboundary)
+        b_next = boundary_index[rows, (positions+1) % 4]
+        b_next = np.where(b_next < 0, leaving[b_end], b_next)
+        stride = 2*nedges + nboundary
+    else:
+        lowers, uppers, stride = levels, None, nedges
+
+    # Compute the segments for all levels, the upper level of each
+    # filled band is the lower level of the next band so the segments
+    # of each distinct level are only computed once
+    level_segments = {}
+    starts, ends, segment_quads = [], [], []
+    for role, level_values in enumerate([lowers, uppers]):
+        if level_values is None:
+            continue
+        for i, level in enumerate(level_values):
+            if level not in level_segments:
+                # Only quads with corners on both sides of the level
+                # are crossed by the contour
+                with np.errstate(invalid='ignore'):
+                    crossed = np.flatnonzero((zmin <= level) & (zmax > level))
+                corners, edges = quad_geometry(crossed)
+                seg_start, seg_end, seg_quads = _contour_segments(
+                    zs[corners] > level, centers[crossed] > level, edges)
+                level_segments[level] = seg_start, seg_end, crossed[seg_quads]
+            seg_start, seg_end, seg_quads = level_segments[level]
+            offset = i*stride + role*nedges
+            if role:
+                seg_start, seg_end = seg_end, seg_start
+            starts.append(seg_start + offset)
+            ends.append(seg_end + offset)
+            segment_quads.append(seg_quads)
+
+    # Add the parts of the boundary edges lying between the levels
+    if filled:
+        z0, z1 = zs[b_start], zs[b_end]
+        rows = np.arange(nboundary)[:, None]
+        for i, (lower, upper) in enumerate(zip(lowers, uppers)):
+            offset = i*stride
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t_lower = np.where((z0 > lower) != (z1 > lower), (lower-z0)/(z1-z0), np.inf)
+                t_upper = np.where((z0 > upper) != (z1 > upper), (upper-z0)/(z1-z0), np.inf)
+            ts = np.column_stack([np.zeros(nboundary), t_lower, t_upper, np.ones(nboundary)])
+            ids = np.column_stack([np.arange(nboundary), b_edges - 2*nedges,
+                                   b_edges - nedges, b_next]) + offset + 2*nedges
+            order = np.argsort(ts, axis=1, kind='mergesort')
+            ts, ids = ts[rows, order], ids[rows, order]
+            with np.errstate(invalid='ignore'):
+                mids = z0[:, None] + (ts[:, :-1]+ts[:, 1:])/2.*(z1-z0)[:, None]
+                inside = (mids > lower) & (mids <= upper) & np.isfinite(mids)
+            seg_rows, seg_cols = np.nonzero(inside)
+            starts.append(ids[seg_rows, seg_cols])
+            ends.append(ids[seg_rows, seg_cols+1])
+            segment_quads.append(b_quads[seg_rows])
+
+    starts, ends = np.concatenate(starts), np.concatenate(ends)
+    if not len(starts):
+        return results
+    ids, offsets, closed = _link_segments(starts, ends, np.concatenate(segment_quads), stride)
+
+    # Compute the coordinates of each point, interpolating crossings
+    # along the edges of the grid
+    group, point = ids // stride, ids % stride
+    on_edge = point < (2*nedges if filled else nedges)
+    edge = point % nedges
+    if filled:
+        nodes = b_start[np.clip(point-2*nedges, 0, nboundary-1)]
+    else:
+        nodes = 0
+    horizontal = edge < nh
+    node0 = np.where(horizontal, edge + edge//(nx-1), edge-nh)
+    node1 = node0 + np.where(horizontal, 1, nx)
+    node0 = np.where(on_edge, node0, nodes)
+    node1 = np.where(on_edge, node1, nodes)
+    if filled:
+        level = np.where(point < nedges, lowers[group], uppers[group])
+    else:
+        level = lowers[group]
+    z0, z1 = zs[node0], zs[node1]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(on_edge & (z1 != z0), (level-z0)/(z1-z0), 0)
+    coords = np.column_stack([xs[node0] + t*(xs[node1]-xs[node0]),
+                              ys[node0] + t*(ys[node1]-ys[node0])])
+    index_coords = np.column_stack([node0 % nx + t*(node1 % nx - node0 % nx),
+                                    node0 // nx + t*(node1 // nx - node0 // nx)])
+
+    chains = [np.concatenate([coords[s:e], coords[s:s+1]]) if c else coords[s:e]
+              for s, e, c in zip(offsets[:-1], offsets[1:], closed)]
+    chain_groups = group[offsets[:-1]]
+    if not filled:
+        for g, chain in zip(chain_groups, chains):
+            results[g].append(chain)
+        return results
+
+    # Split rings into exteriors and holes by their orientation on the
+    # grid and assign each hole to the smallest exterior containing it
+    areas = _ring_area(index_coords, offsets)
+    for g in np.unique(chain_groups):
+        in_group = np.flatnonzero(chain_groups == g)
+        exteriors = in_group[areas[in_group] > 0]
+        holes = in_group[areas[in_group] < 0]
+        polygons = [(chains[e], []) for e in exteriors]
+        if len(holes) and len(exteriors):
+            hole_points = index_coords[offsets[holes]]
+            owner = np.full(len(holes), -1)
+            owner_area = np.full(len(holes), np.inf)
+            for j, e in enumerate(exteriors):
+                ring = index_coords[offsets[e]:offsets[e+1]]
+                (xmin, ymin), (xmax, ymax) = ring.min(axis=0), ring.max(axis=0)
+                candidates = np.flatnonzero(
+                    (hole_points[:, 0] >= xmin) & (hole_points[:, 0] <= xmax) &
+                    (hole_points[:, 1] >= ymin) & (hole_points[:, 1] <= ymax) &
+                    (owner_area > areas[e]))
+                if not len(candidates):
+                    continue
+                contained = candidates[_points_in_ring(hole_points[candidates], ring)]
+                owner[contained] = j
+                owner_area[contained] = areas[e]
+            for h, j in zip(holes, owner):
+                if j >= 0:
+                    polygons[j][1].append(chains[h])
+        results[g] = polygons
+    return results
@@ -28,6 +28,7 @@ from ..core.data import PandasInterface, XArrayInterface
 from ..core.sheetcoords import BoundingBox
 from ..core.util import get_param_values, basestring, datetime_types, dt_to_int
 from ..element import (Image, Path, Curve, RGB, Graph, TriMesh, QuadMesh, Contours)
+from ..element.util import connect_edges_ragged, edge_segments
 from ..streams import RangeXY, PlotSize
 
 
@@ -1193,5 +1194,12 @@ class directly_connect_edges(_connect_edges, connect_edges):
     Given a Graph object will directly connect all nodes.
     """
 
-    def _bundle(self, position_df, edges_df):
-        return connect_edges.__call__(self, position_df, edges_df)
+    def _process(self, element, key=None):
+        if self.p.split:
+            paths = connect_edges_ragged(element)
+        else:
+            segments = edge_segments(element, drop_missing=True)
+            separators = np.full((len(segments), 1, 2), np.NaN)
+            coords = np.concatenate([segments, separators], axis=1).reshape(-1, 2)
+            paths = [pd.DataFrame(coords, columns=[d.name for d in element.nodes.kdims[:2]])]
+        return element.clone((element.data, element.nodes, paths))
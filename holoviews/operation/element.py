@@ -4,21 +4,27 @@ examples.
 """
 from __future__ import division
 
+import copy
+import weakref
+
 import numpy as np
 
 import param
 from param import _is_number
+from param.parameterized import bothmethod
 
 from ..core import (Operation, NdOverlay, Overlay, GridMatrix,
                     HoloMap, Dataset, Element, Collator, Dimension)
-from ..core.data import ArrayInterface, DictInterface, default_datatype
+from ..core.data import ArrayInterface, DictInterface, DataStatistics, default_datatype
 from ..core.util import (group_sanitizer, label_sanitizer, pd,
                          basestring, datetime_types, isfinite, dt_to_int)
 from ..element.chart import Histogram, Scatter
 from ..element.raster import Image, RGB
 from ..element.path import Contours, Polygons
 from ..element.util import categorical_aggregate2d # noqa (API import)
-from ..streams import RangeXY
+from ..element.util import (GridIndex, ImagePyramid, contour_levels, lttb_indices,
+                            marching_squares, minmax_indices)
+from ..streams import RangeXY, PlotSize
 
 column_interfaces = [ArrayInterface, DictInterface]
 if pd:
@@ -421,14 +427,6 @@ class contours(Operation):
         Whether to overlay the contour on the supplied Element.""")
 
     def _process(self, element, key=None):
-        try:
-            from matplotlib.contour import QuadContourSet
-            from matplotlib.axes import Axes
-            from matplotlib.figure import Figure
-        except ImportError:
-            raise ImportError("contours operation requires matplotlib.")
-        extent = element.range(0) + element.range(1)[::-1]
-
         data = (element.dimension_values(0, False, flat=False),
                 element.dimension_values(1, False, flat=False),
                 element.dimension_values(2, flat=False))
@@ -439,47 +437,40 @@ class contours(Operation):
             contour_type = Contours
         vdims = element.vdims[:1]
 
-        kwargs = {}
         levels = self.p.levels
         zmin, zmax = element.range(2)
         if isinstance(self.p.levels, int):
             if zmin == zmax:
                 contours = contour_type([], [xdim, ydim], vdims)
                 return (element * contours) if self.p.overlaid else contours
-            data += (levels,)
-        else:
-            kwargs = {'levels': levels}
-
-        fig = Figure()
-        ax = Axes(fig, [0, 0, 1, 1])
-        contour_set = QuadContourSet(ax, *data, filled=self.p.filled,
-                                     extent=extent, **kwargs)
-        levels = np.array(contour_set.get_array())
-        crange = levels.min(), levels.max()
+            levels = contour_levels(zmin, zmax, levels)
+        levels = np.asarray(levels, dtype=np.float64)
+        if not self.p.filled:
+            # Levels at or beyond the data range would trace degenerate
+            # lines along the grid, so drop them like matplotlib does
+            zmin, zmax = element.range(2, dimension_range=False)
+            levels = levels[(levels > zmin) & (levels < zmax)]
+
+        # All levels are traced in a single pass over the grid
+        contour_sets = marching_squares(*data, levels=levels, filled=self.p.filled)
         if self.p.filled:
+            crange = levels.min(), levels.max()
             levels = levels[:-1] + np.diff(levels)/2.
             vdims = [vdims[0].clone(range=crange)]
 
         paths = []
         empty = np.array([[np.nan, np.nan]])
-        for level, cset in zip(levels, contour_set.collections):
-            exteriors = []
-            interiors = []
-            for geom in cset.get_paths():
-                interior = []
-                polys = geom.to_polygons(closed_only=False)
-                for ncp, cp in enumerate(polys):
-                    if ncp == 0:
-                        exteriors.append(cp)
-                        exteriors.append(empty)
-                    else:
-                        interior.append(cp)
-                if len(polys):
-                    interiors.append(interior)
-            if not exteriors:
+        for level, geoms in zip(levels, contour_sets):
+            if not geoms:
                 continue
+            if self.p.filled:
+                exteriors = [exterior for exterior, _ in geoms]
+                interiors = [holes for _, holes in geoms]
+            else:
+                exteriors, interiors = geoms, []
+            exteriors = [arr for exterior in exteriors for arr in (exterior, empty)]
             geom = {element.vdims[0].name: level, (xdim, ydim): np.concatenate(exteriors[:-1])}
-            if self.p.filled and interiors:
+            if self.p.filled:
                 geom['holes'] = interiors
             paths.append(geom)
         contours = contour_type(paths, label=element.label, kdims=element.kdims, vdims=vdims)
@@ -636,6 +627,12 @@ class decimate(Operation):
     rows if the current view defined by the x_range and y_range
     contains more than max_samples. By default the operation returns a
     DynamicMap with a RangeXY stream allowing dynamic downsampling.
+
+    Numeric x- and y-coordinates are looked up using a GridIndex,
+    which is built once and cached on the underlying data so it may be
+    reused whenever the ranges change. Instead of sampling random rows
+    the 'lttb' and 'minmax' modes provide deterministic, shape
+    preserving downsampling suitable for Curve elements.
     """
 
     dynamic = param.Boolean(default=True, doc="""
@@ -649,6 +646,16 @@ class decimate(Operation):
     max_samples = param.Integer(default=5000, doc="""
         Maximum number of samples to display at the same time.""")
 
+    mode = param.ObjectSelector(default='random', objects=['random', 'lttb', 'minmax'], doc="""
+        The downsampling strategy applied when the current view contains
+        more than max_samples rows:
+
+        * random: Selects a random subset of the rows.
+        * lttb: Selects rows using the Largest-Triangle-Three-Buckets
+          algorithm, which preserves the shape of a line.
+        * minmax: Selects the rows with the minimum and maximum
+          y-value in max_samples/2 equal-width bins along the x-axis.""")
+
     random_seed = param.Integer(default=42, doc="""
         Seed used to initialize randomization.""")
 
@@ -664,6 +671,32 @@ class decimate(Operation):
        The x_range as a tuple of min and max y-value. Auto-ranges
        if set to None.""")
 
+    def _get_index(self, element, xdim, ydim):
+        """
+        Returns the GridIndex over the x- and y-coordinates of the
+        element, cached on the underlying data, or None if the
+        coordinates are not numeric or the index cannot be cached.
+        """
+        interface = element.interface
+        xsource = interface.column_source(element, xdim)
+        ysource = interface.column_source(element, ydim)
+        if xsource is None or ysource is None:
+            return None
+
+        def build():
+            xs = element.dimension_values(xdim)
+            ys = element.dimension_values(ydim)
+            if xs.dtype.kind not in 'iuf' or ys.dtype.kind not in 'iuf':
+                return None
+            index = GridIndex(xs, ys)
+            index.source = weakref.ref(ysource[0])
+            return index
+
+        index = DataStatistics.lookup(element, xdim, ('grid_index', ydim.name), build)
+        if index is not None and index.source() is not ysource[0]:
+            return None
+        return index
+
     def _process_layer(self, element, key=None):
         if not isinstance(element, Dataset):
             raise ValueError("Cannot downsample non-Dataset types.")
@@ -674,14 +707,167 @@ class decimate(Operation):
         ystart, yend = self.p.y_range if self.p.y_range else element.range(1)
 
         # Slice element to current ranges
-        xdim, ydim = element.dimensions(label=True)[0:2]
-        sliced = element.select(**{xdim: (xstart, xend),
-                                   ydim: (ystart, yend)})
+        xdim, ydim = element.dimensions()[0:2]
+        index = self._get_index(element, xdim, ydim)
+        if index is None:
+            element = element.select(**{xdim.name: (xstart, xend),
+                                        ydim.name: (ystart, yend)})
+            rows = np.arange(len(element))
+            if len(element) <= self.p.max_samples:
+                return element
+        else:
+            rows = index.query((xstart, xend), (ystart, yend), sort=False)
+            if len(rows) <= self.p.max_samples:
+                return element.iloc[np.sort(rows)]
 
-        if len(sliced) > self.p.max_samples:
+        if self.p.mode == 'random':
             prng = np.random.RandomState(self.p.random_seed)
-            return element.iloc[prng.choice(len(sliced), self.p.max_samples, False)]
-        return sliced
+            choice = prng.choice(len(rows), self.p.max_samples, False)
+            return element.iloc[np.sort(rows[choice])]
+
+        rows = np.sort(rows)
+        xs = element.dimension_values(0)[rows]
+        ys = element.dimension_values(1)[rows]
+        if xs.dtype.kind == 'M':
+            xs = xs.astype('datetime64[ns]').astype('int64')
+        elif xs.dtype.kind not in 'iufb':
+            xs = np.arange(len(xs))
+        if self.p.mode == 'lttb':
+            selected = lttb_indices(xs, ys, self.p.max_samples)
+        else:
+            selected = minmax_indices(xs, ys, self.p.max_samples)
+        return element.iloc[rows[selected]]
+
+    def _process(self, element, key=None):
+        return element.map(self._process_layer, Element)
+
+
+class downsample_image(Operation):
+    """
+    Downsamples an Image to the resolution of the plot, returning only
+    the part of the image visible within the x_range and y_range. By
+    default the operation returns a DynamicMap with RangeXY and
+    PlotSize streams, so only the data matching the current viewport
+    is sent to the plot when zooming and panning.
+
+    The image is downsampled by selecting the coarsest level of an
+    ImagePyramid that still provides at least one pixel per screen
+    pixel. The pyramid is built once and cached on the underlying
+    data (see DataStatistics), so it is discarded along with the data.
+    """
+
+    aggregator = param.ObjectSelector(default='mean', objects=['mean', 'max'], doc="""
+        How blocks of pixels are aggregated on the downsampled levels.""")
+
+    dynamic = param.Boolean(default=True, doc="""
+       Enables dynamic processing by default.""")
+
+    link_inputs = param.Boolean(default=True, doc="""
+         By default, the link_inputs parameter is set to True so that
+         when applying the operation, backends that support linked
+         streams update RangeXY streams on the inputs of the operation.""")
+
+    height = param.Integer(default=400, doc="""
+       The height of the plot in pixels.""")
+
+    width = param.Integer(default=400, doc="""
+       The width of the plot in pixels.""")
+
+    streams = param.List(default=[PlotSize, RangeXY], doc="""
+        List of streams that are applied if dynamic=True, allowing
+        for dynamic interaction with the plot.""")
+
+    x_range  = param.NumericTuple(default=None, length=2, doc="""
+       The x_range as a tuple of min and max x-value. Auto-ranges
+       if set to None.""")
+
+    y_range  = param.NumericTuple(default=None, length=2, doc="""
+       The y_range as a tuple of min and max y-value. Auto-ranges
+       if set to None.""")
+
+    @bothmethod
+    def instance(self_or_cls, **params):
+        inst = super(downsample_image, self_or_cls).instance(**params)
+        inst._pyramids = {}
+        return inst
+
+    def _get_pyramid(self, element):
+        """
+        Returns the ImagePyramid of the element, cached on its data.
+        Since not all data can be weakly referenced the most recent
+        pyramid per aggregator is also held on the operation instance,
+        which is validated against a weak reference to the element.
+        """
+        aggregator = self.p.aggregator
+        ref, pyramid = self._pyramids.get(aggregator, (None, None))
+        if ref is not None and ref() is element:
+            return pyramid
+
+        if isinstance(element, RGB):
+            array = np.dstack([element.dimension_values(vd, flat=False)
+                               for vd in element.vdims])
+        else:
+            array = element.dimension_values(2, flat=False)
+
+        def build():
+            # The full resolution level may be a view on the data and
+            # would keep it alive, so only the coarser levels are cached
+            cached = ImagePyramid(array, aggregator)
+            cached.levels[0] = None
+            return cached
+
+        cached = DataStatistics.lookup(element, None, ('pyramid', aggregator), build)
+        pyramid = copy.copy(cached)
+        pyramid.levels = [array] + cached.levels[1:]
+        self._pyramids[aggregator] = (weakref.ref(element), pyramid)
+        return pyramid
+
+    def _process_layer(self, element, key=None):
+        if not isinstance(element, Image):
+            raise ValueError("downsample_image can only be applied to Image types.")
+        try:
+            l, b, r, t = [float(v) for v in element.bounds.lbrt()]
+        except TypeError:
+            # Datetime coordinates are not supported
+            return element
+
+        pyramid = self._get_pyramid(element)
+        ny, nx = pyramid.levels[0].shape[:2]
+        if not nx or not ny:
+            return element
+        x0, x1 = self.p.x_range if self.p.x_range else (l, r)
+        y0, y1 = self.p.y_range if self.p.y_range else (b, t)
+        x0, x1, y0, y1 = max(x0, l), min(x1, r), max(y0, b), min(y1, t)
+        if x0 >= x1 or y0 >= y1:
+            return element.clone(np.zeros((0, 0)), datatype=['image'])
+
+        # Select the level matching the number of visible pixels
+        xdensity, ydensity = nx/(r-l), ny/(t-b)
+        width, height = self.p.width or 400, self.p.height or 400
+        factor = min((x1-x0)*xdensity/width, (y1-y0)*ydensity/height)
+        level = pyramid.level(factor)
+        array = pyramid.levels[level]
+        scale = 2**level
+
+        # Slice the pixels overlapping the viewport on that level
+        xstep, ystep = scale/xdensity, scale/ydensity
+        i0, i1 = int(np.floor((x0-l)/xstep)), int(np.ceil((x1-l)/xstep))
+        j0, j1 = int(np.floor((y0-b)/ystep)), int(np.ceil((y1-b)/ystep))
+        i0, i1 = max(i0, 0), min(i1, array.shape[1])
+        j0, j1 = max(j0, 0), min(j1, array.shape[0])
+        if level == 0 and (i0, j0, i1, j1) == (0, 0, nx, ny):
+            return element
+
+        # The last row and column of a level may be partially padded,
+        # drop them unless the tile would otherwise be empty
+        i1 = min(i1, max(nx//scale, i0+1))
+        j1 = min(j1, max(ny//scale, j0+1))
+        tile = array[j0:j1, i0:i1]
+        dtype = pyramid.levels[0].dtype
+        if isinstance(element, RGB) and level and dtype.kind in 'iu':
+            tile = np.round(tile).astype(dtype)
+        bounds = (l+i0*xstep, b+j0*ystep, min(l+i1*xstep, r), min(b+j1*ystep, t))
+        return element.clone(np.flipud(tile), bounds=bounds, datatype=['image'])
 
     def _process(self, element, key=None):
         return element.map(self._process_layer, Element)
@@ -1,3 +1,5 @@
+from itertools import product
+
 import param
 import numpy as np
 
@@ -20,6 +22,93 @@ def _kde_support(bin_range, bw, gridsize, cut, clip):
     return np.linspace(kmin, kmax, gridsize)
 
 
+def _kde_fft(data, grids, cov, truncate=4, oversample=8, max_cells=2**20):
+    """
+    Evaluates a Gaussian kernel density estimate of the (D, N) array
+    of samples with the supplied kernel covariance on the cartesian
+    product of the supplied grids. Rather than evaluating the kernel
+    of every sample at every grid point the samples are linearly
+    binned onto a regular grid oversampling the kernel bandwidth,
+    which is convolved with the kernel using an FFT and then
+    interpolated onto the requested grids. Samples further than
+    truncate times the kernel bandwidth from the grids are ignored.
+
+    The bins along each axis oversample the narrowest width of the
+    kernel, given by the smallest eigenvalue of its correlation
+    matrix scaled by the bandwidth along the axis, so correlated
+    kernels are resolved. If this would require more than max_cells
+    bins, e.g. for heavy tailed data spanning many bandwidths, None
+    is returned and the density should be evaluated directly.
+    """
+    from scipy.signal import fftconvolve
+
+    data = np.atleast_2d(data)
+    cov = np.atleast_2d(cov)
+    ndim, n = data.shape
+    inv_cov = np.linalg.inv(cov)
+
+    # Compute regular grid of bins extending past the requested grids
+    max_bins = int(max_cells**(1./ndim))
+    sigmas = np.sqrt(np.diag(cov))
+    min_width = np.sqrt(max(np.linalg.eigvalsh(cov/np.outer(sigmas, sigmas)).min(), 0))
+    los, steps, exts, shape = [], [], [], []
+    for grid, sigma in zip(grids, sigmas):
+        span = grid[-1] - grid[0] + 2*truncate*sigma
+        resolution = min_width*sigma/oversample
+        step = max(resolution, span/(max_bins-1))
+        if not resolution or step > resolution:
+            return None
+        ext = int(np.ceil(truncate*sigma/step))
+        lo = grid[0] - ext*step
+        los.append(lo)
+        steps.append(step)
+        exts.append(ext)
+        shape.append(int(np.ceil((grid[-1]-lo)/step)) + ext + 1)
+    los, steps, shape = np.array(los), np.array(steps), tuple(shape)
+
+    # Linearly bin the samples distributing each sample between the
+    # corners of the bin it falls into
+    positions = (data - los[:, None]) / steps[:, None]
+    inside = ((positions >= 0) & (positions <= np.array(shape)[:, None]-1)).all(axis=0)
+    positions = positions[:, inside]
+    indices = np.minimum(positions.astype('int64'), np.array(shape)[:, None]-2)
+    fractions = positions - indices
+    counts = np.zeros(np.prod(shape))
+    for corner in product([0, 1], repeat=ndim):
+        weights = np.prod([f if c else 1-f for c, f in zip(corner, fractions)], axis=0)
+        flat = np.ravel_multi_index(tuple(i+c for c, i in zip(corner, indices)), shape)
+        counts += np.bincount(flat, weights, minlength=counts.size)
+    counts = counts.reshape(shape)
+
+    # Convolve binned samples with the kernel sampled on the bins
+    offsets = np.meshgrid(*[np.arange(-e, e+1)*s for e, s in zip(exts, steps)],
+                          indexing='ij')
+    offsets = np.array([o.ravel() for o in offsets])
+    distances = np.einsum('ik,ij,jk->k', offsets, inv_cov, offsets)
+    kernel = np.exp(-0.5*distances).reshape(tuple(2*e+1 for e in exts))
+    kernel /= kernel.sum()*np.prod(steps)
+    density = np.clip(fftconvolve(counts, kernel, mode='same')/n, 0, None)
+
+    # Interpolate density onto the requested grids
+    indices, fractions = [], []
+    for grid, lo, step, size in zip(grids, los, steps, shape):
+        positions = (np.asarray(grid) - lo) / step
+        index = np.clip(positions.astype('int64'), 0, size-2)
+        indices.append(index)
+        fractions.append(positions-index)
+    result = 0
+    for corner in product([0, 1], repeat=ndim):
+        weights = np.ix_(*[f if c else 1-f for c, f in zip(corner, fractions)])
+        weights = np.prod(np.broadcast_arrays(*weights), axis=0)
+        result = result + weights*density[np.ix_(*[i+c for c, i in zip(corner, indices)])]
+    return result
+
+
+def _use_fft(method, n_samples):
+    "Whether a KDE over the number of samples should use the FFT."
+    return method == 'fft' or (method == 'auto' and n_samples > 10000)
+
+
 class univariate_kde(Operation):
     """
     Computes a 1D kernel density estimate (KDE) along the supplied
@@ -41,6 +130,17 @@ class univariate_kde(Operation):
     cut = param.Number(default=3, doc="""
         Draw the estimate to cut * bw from the extreme data points.""")
 
+    method = param.ObjectSelector(default='auto', objects=['auto', 'scipy', 'fft'], doc="""
+        Whether to evaluate the KDE using scipy.stats.gaussian_kde, whose
+        cost scales with the number of samples times the number of points
+        the KDE is evaluated on, or by linearly binning the samples and
+        convolving them with the kernel using an FFT, which is much
+        faster for large numbers of samples but slightly less accurate.
+        The 'auto' method uses the FFT when there are more than 10000
+        samples. Falls back to scipy if the grid of bins required to
+        resolve the kernel would be too large, e.g. for heavy tailed
+        data.""")
+
     bin_range = param.NumericTuple(default=None, length=2,  doc="""
         Specifies the range within which to compute the KDE.""")
 
@@ -104,19 +204,26 @@ class univariate_kde(Operation):
         element_type = Area if self.p.filled else Curve
         data = data[isfinite(data)] if len(data) else []
         if len(data) > 1:
-            try:
-                kde = stats.gaussian_kde(data)
-            except LinAlgError:
-                return element_type([], selected_dim, vdims, **params)
-            kde = stats.gaussian_kde(data)
-            if self.p.bandwidth:
-                kde.set_bandwidth(self.p.bandwidth)
-            bw = kde.scotts_factor() * data.std(ddof=1)
+            std = data.std(ddof=1)
+            bw = len(data)**(-1./5) * std
             if self.p.bin_range:
                 xs = np.linspace(bin_range[0], bin_range[1], self.p.n_samples)
             else:
                 xs = _kde_support(bin_range, bw, self.p.n_samples, self.p.cut, selected_dim.range)
-            ys = kde.evaluate(xs)
+            ys = None
+            if _use_fft(self.p.method, len(data)):
+                if not std:
+                    return element_type([], selected_dim, vdims, **params)
+                factor = self.p.bandwidth or len(data)**(-1./5)
+                ys = _kde_fft(data, [xs], (factor*std)**2)
+            if ys is None:
+                try:
+                    kde = stats.gaussian_kde(data)
+                except LinAlgError:
+                    return element_type([], selected_dim, vdims, **params)
+                if self.p.bandwidth:
+                    kde.set_bandwidth(self.p.bandwidth)
+                ys = kde.evaluate(xs)
         else:
             xs = np.linspace(bin_range[0], bin_range[1], self.p.n_samples)
             ys = np.full_like(xs, 0)
@@ -152,6 +259,17 @@ class bivariate_kde(Operation):
     cut = param.Number(default=3, doc="""
         Draw the estimate to cut * bw from the extreme data points.""")
 
+    method = param.ObjectSelector(default='auto', objects=['auto', 'scipy', 'fft'], doc="""
+        Whether to evaluate the KDE using scipy.stats.gaussian_kde, whose
+        cost scales with the number of samples times the number of points
+        the KDE is evaluated on, or by linearly binning the samples and
+        convolving them with the kernel using an FFT, which is much
+        faster for large numbers of samples but slightly less accurate.
+        The 'auto' method uses the FFT when there are more than 10000
+        samples. Falls back to scipy if the grid of bins required to
+        resolve the kernel would be too large, e.g. for heavy tailed
+        data.""")
+
     filled = param.Boolean(default=False, doc="""
         Controls whether to return filled or unfilled contours.""")
 
@@ -202,10 +320,8 @@ class bivariate_kde(Operation):
 
         data = data[:, isfinite(data).min(axis=0)] if data.shape[1] > 1 else np.empty((2, 0))
         if data.shape[1] > 1:
-            kde = stats.gaussian_kde(data)
-            if self.p.bandwidth:
-                kde.set_bandwidth(self.p.bandwidth)
-            bw = kde.scotts_factor() * data.std(ddof=1)
+            n = data.shape[1]
+            bw = n**(-1./6) * data.std(ddof=1)
             if self.p.x_range:
                 xs = np.linspace(xmin, xmax, self.p.n_samples)
             else:
@@ -214,9 +330,17 @@ class bivariate_kde(Operation):
                 ys = np.linspace(ymin, ymax, self.p.n_samples)
             else:
                 ys = _kde_support((ymin, ymax), bw, self.p.n_samples, self.p.cut, ydim.range)
-            xx, yy = cartesian_product([xs, ys], False)
-            positions = np.vstack([xx.ravel(), yy.ravel()])
-            f = np.reshape(kde(positions).T, xx.shape)
+            f = None
+            if _use_fft(self.p.method, n):
+                factor = self.p.bandwidth or n**(-1./6)
+                f = _kde_fft(data, [xs, ys], np.cov(data)*factor**2)
+            if f is None:
+                kde = stats.gaussian_kde(data)
+                if self.p.bandwidth:
+                    kde.set_bandwidth(self.p.bandwidth)
+                xx, yy = cartesian_product([xs, ys], False)
+                positions = np.vstack([xx.ravel(), yy.ravel()])
+                f = np.reshape(kde(positions).T, xx.shape)
         elif self.p.contours:
             eltype = Polygons if self.p.filled else Contours
             return eltype([], kdims=[xdim, ydim], vdims=[vdim])
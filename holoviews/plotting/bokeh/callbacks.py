@@ -13,7 +13,8 @@ from ...streams import (Stream, PointerXY, RangeXY, Selection1D, RangeX,
                         RangeY, PointerX, PointerY, BoundsX, BoundsY,
                         Tap, SingleTap, DoubleTap, MouseEnter, MouseLeave,
                         PlotSize, Draw, BoundsXY, PlotReset, BoxEdit,
-                        PointDraw, PolyDraw, PolyEdit, CDSStream, FreehandDraw)
+                        PointDraw, PolyDraw, PolyEdit, CDSStream, FreehandDraw,
+                        TableWindow)
 from ...streams import PositionX, PositionY, PositionXY, Bounds # Deprecated: remove in 2.0
 from ..links import Link, RangeToolLink, DataLink
 from ..plot import GenericElementPlot, GenericOverlayPlot
@@ -810,6 +811,25 @@ class ResetCallback(Callback):
         return {'resetting': True}
 
 
+class TableWindowCallback(Callback):
+    """
+    Returns the first row and sort order selected with the paging
+    widgets of a paginated table.
+    """
+
+    attributes = {'start': 'page_slider.attributes.value',
+                  'sort': 'sort_select.attributes.value'}
+    models = ['page_slider', 'sort_select']
+    on_changes = ['value']
+
+    def _process_msg(self, msg):
+        if 'sort' in msg:
+            msg['sort'] = msg['sort'] or None
+        if msg.get('start') is not None:
+            msg['start'] = int(msg['start'])
+        return msg
+
+
 class CDSCallback(Callback):
     """
     A Stream callback that syncs the data on a bokeh ColumnDataSource
@@ -1051,6 +1071,7 @@ callbacks[PlotSize]    = PlotSizeCallback
 callbacks[Draw]        = DrawCallback
 callbacks[PlotReset]   = ResetCallback
 callbacks[CDSStream]   = CDSCallback
+callbacks[TableWindow] = TableWindowCallback
 callbacks[BoxEdit]     = BoxEditCallback
 callbacks[PointDraw]   = PointDrawCallback
 callbacks[FreehandDraw]   = FreehandDrawCallback
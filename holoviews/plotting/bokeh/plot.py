@@ -214,16 +214,19 @@ class BokehPlot(DimensionedPlot):
         """
         Update datasource with data for a new frame.
         """
-        data = {k: decode_bytes(vs) for k, vs in data.items()}
         empty = all(len(v) == 0 for v in data.values())
         if (self.streaming and self.streaming[0].data is self.current_frame.data
             and self._stream_data and not empty):
             stream = self.streaming[0]
             if stream._triggering:
-                data = {k: v[-stream._chunk_length:] for k, v in data.items()}
+                # Only the appended rows have to be sent
+                data = {k: decode_bytes(v[-stream._chunk_length:])
+                        for k, v in data.items()}
                 source.stream(data, stream.length)
             return
 
+        data = {k: decode_bytes(vs) for k, vs in data.items()}
+
         # Determine if the CDS.data requires a full replacement or simply needs
         # to be updated. A replacement is required if untouched columns
         # are not the same length as the columns being updated.
@@ -1,15 +1,17 @@
 import param
 
+from bokeh.models.layouts import Column, WidgetBox
 from bokeh.models.widgets import (
     DataTable, TableColumn, NumberEditor, NumberFormatter, DateFormatter,
-    DateEditor, StringFormatter, StringEditor, IntEditor
+    DateEditor, StringFormatter, StringEditor, IntEditor, Select, Slider
 )
 
 from ...core import Dataset, Dimension
 from ...element import ItemTable
-from ...streams import Buffer
+from ...streams import Buffer, TableWindow
 from ...core.util import dimension_sanitizer, datetime_types
 from ..plot import GenericElementPlot
+from .callbacks import TableWindowCallback
 from .plot import BokehPlot
 from .util import bokeh_version
 
@@ -20,6 +22,14 @@ class TablePlot(BokehPlot, GenericElementPlot):
 
     width = param.Number(default=400)
 
+    page_size = param.Integer(default=None, bounds=(1, None), doc="""
+        Number of rows held by the table at a time. If set, only a
+        window of rows is sent to the browser and the table is paged
+        and sorted using widgets below it, fetching the requested
+        window from Python. Sorting and any filters supplied on a
+        TableWindow stream are applied using the element's interface,
+        which allows displaying tables with millions of rows.""")
+
     style_opts = (
         ['row_headers', 'selectable', 'editable',
          'sortable', 'fit_columns', 'scroll_to_selection'] +
@@ -41,11 +51,85 @@ class TablePlot(BokehPlot, GenericElementPlot):
         self.callbacks = self._construct_callbacks()
         self.streaming = [s for s in self.streams if isinstance(s, Buffer)]
         self.static_source = False
+        self._window_cache = None
+        if self.page_size:
+            windows = [s for cb in self.callbacks for s in cb.streams
+                       if isinstance(s, TableWindow)]
+            if not windows:
+                windows = [TableWindow()]
+                self.callbacks.append(TableWindowCallback(self, windows, self.hmap.last))
+            self.window = windows[0]
+            self.window.add_subscriber(self._update_window)
+        else:
+            self.window = None
+
+    @property
+    def state(self):
+        return self.handles.get('layout', self.handles['plot'])
+
+    def _get_window(self, element):
+        """
+        Applies the filters and sort order of the window stream to the
+        element, caching the result so that paging through the rows
+        does not sort the data again, and returns the rows in the
+        current window along with the total number of rows.
+        """
+        sort, filters = self.window.sort, self.window.filters
+        cache = self._window_cache
+        if cache and cache[0] is element and cache[1] == sort and cache[2] == filters:
+            rows = cache[3]
+        else:
+            rows = element.select(**filters) if filters else element
+            if sort:
+                rows = rows.sort(sort.lstrip('-'), reverse=sort.startswith('-'))
+            self._window_cache = (element, sort, filters, rows)
+        nrows = len(rows)
+        start = min(self.window.start, max(nrows-self.page_size, 0))
+        return rows.iloc[start:start+self.page_size], start, nrows
 
     def get_data(self, element, ranges, style):
+        if self.page_size:
+            element, _, _ = self._get_window(element)
         return ({dimension_sanitizer(d.name): element.dimension_values(d)
                  for d in element.dimensions()}, {}, style)
 
+    def _init_window_widgets(self, element):
+        """
+        Creates the widgets used to page through and sort the rows of
+        a paginated table.
+        """
+        _, start, nrows = self._get_window(element)
+        slider = Slider(title='First row', start=0, end=max(nrows-1, 1),
+                        step=self.page_size, value=start, width=self.width)
+        options = [('', 'Unsorted')]
+        for d in element.dimensions():
+            options += [(d.name, '%s (ascending)' % d.pprint_label),
+                        ('-'+d.name, '%s (descending)' % d.pprint_label)]
+        select = Select(title='Sort by', options=options,
+                        value=self.window.sort or '', width=self.width)
+        self.handles['page_slider'] = slider
+        self.handles['sort_select'] = select
+        return WidgetBox(slider, select, width=self.width)
+
+    def _update_window(self, **kwargs):
+        """
+        Sends the rows in the current window of the table after the
+        window stream is updated.
+        """
+        element = self.current_frame
+        if element is None or 'source' not in self.handles:
+            return
+        style = self.lookup_options(element, 'style')[self.cyclic_index]
+        data, _, _ = self.get_data(element, {}, style)
+        self._update_datasource(self.handles['source'], data)
+        _, start, nrows = self._get_window(element)
+        slider = self.handles['page_slider']
+        slider.end = max(nrows-1, 1)
+        if slider.value != start:
+            slider.value = start
+        if self.comm is not None and self.top_level:
+            self.push()
+
 
     def initialize_plot(self, ranges=None, plot=None, plots=None, source=None):
         """
@@ -65,10 +149,16 @@ class TablePlot(BokehPlot, GenericElementPlot):
 
         columns = self._get_columns(element, data)
         style['reorderable'] = False
+        if self.page_size:
+            # Sorting in the browser would only sort the current window
+            style['sortable'] = False
         table = DataTable(source=source, columns=columns, height=self.height,
                           width=self.width, **style)
         self.handles['plot'] = table
         self.handles['glyph_renderer'] = table
+        if self.page_size:
+            widgets = self._init_window_widgets(element)
+            self.handles['layout'] = Column(table, widgets)
         self._execute_hooks(element)
         self.drawn = True
 
@@ -124,3 +214,6 @@ class TablePlot(BokehPlot, GenericElementPlot):
         columns = self._get_columns(element, data)
         self.handles['plot'].columns = columns
         self._update_datasource(source, data)
+        if self.page_size:
+            _, _, nrows = self._get_window(element)
+            self.handles['page_slider'].end = max(nrows-1, 1)
@@ -123,6 +123,10 @@ class MPLPlot(DimensionedPlot):
 
     _close_figures = True
 
+    # The object the plot was created from, which is pickled to
+    # rebuild the plot when rendering frames in parallel
+    _source = None
+
     def __init__(self, fig=None, axis=None, **params):
         self._create_fig = True
         super(MPLPlot, self).__init__(**params)
@@ -1,11 +1,14 @@
 import sys
 import base64
+import subprocess
+from collections import deque
 from io import BytesIO
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryFile
 from contextlib import contextmanager
 from itertools import chain
 from distutils.version import LooseVersion
 
+import numpy as np
 import matplotlib as mpl
 from matplotlib import pyplot as plt
 from param.parameterized import bothmethod
@@ -14,6 +17,7 @@ import param
 from ...core import HoloMap
 from ...core.options import Store
 
+from ..plot import Plot
 from ..renderer import Renderer, MIME_TYPES, HTML_TAGS
 from .widgets import MPLSelectionWidget, MPLScrubberWidget
 from .util import get_tight_bbox, mpl_version
@@ -43,6 +47,35 @@ if LooseVersion(mpl.__version__) >= '2.2':
     ANIMATION_OPTS['gif'] = ('pillow', 'gif', {'fps': 10}, [])
 
 
+# State of a worker process rendering animation frames in parallel
+_frame_worker = {}
+
+def _init_frame_worker(payload, dpi, size):
+    """
+    Builds the plot rendered by a worker process from the pickled
+    object the plot was created from.
+    """
+    renderer = MPLRenderer.instance(dpi=dpi, size=size)
+    _frame_worker['plot'] = renderer.get_plot(Store.loads(payload))
+
+
+def _render_frames(keys, dpi):
+    """
+    Rasterizes the frames of the supplied keys in a worker process,
+    returning the size of the frames in pixels and the RGBA buffers.
+    """
+    plot = _frame_worker['plot']
+    frames = []
+    with mpl.rc_context(rc=plot.fig_rcparams):
+        for key in keys:
+            plot.update(key)
+            bytes_io = BytesIO()
+            plot.state.savefig(bytes_io, format='rgba', dpi=dpi)
+            frames.append(bytes_io.getvalue())
+    w, h = plot.state.get_size_inches()*dpi
+    return (int(w), int(h)), frames
+
+
 class MPLRenderer(Renderer):
     """
     Exporter used to render data from matplotlib, either to a stream
@@ -79,6 +112,27 @@ class MPLRenderer(Renderer):
 
     mode = param.ObjectSelector(default='default', objects=['default'])
 
+    processes = param.Integer(default=None, allow_None=True, bounds=(1, None), doc="""
+        Number of worker processes used to render the frames of gif,
+        mp4 and webm animations in parallel. Each worker rebuilds the
+        plot from the pickled object and rasterizes chunks of frames,
+        which are passed to the encoder in order. By default the
+        frames are rendered sequentially.""")
+
+    chunksize = param.Integer(default=10, bounds=(1, None), doc="""
+        Number of consecutive frames rasterized by a worker process
+        as a single task.""")
+
+    max_buffered_frames = param.Integer(default=100, bounds=(1, None), doc="""
+        Maximum number of rasterized frames held in memory while
+        waiting to be passed to the encoder when rendering frames in
+        parallel.""")
+
+    progress_bar = param.Parameter(default=None, doc="""
+        The progress bar instance used to report the percentage of
+        frames rendered in parallel. Set to None to disable progress
+        bars.""")
+
 
     mode_formats = {'fig':     {'default': ['png', 'svg', 'pdf', 'html', None, 'auto']},
                     'holomap': {'default': ['widgets', 'scrubber', 'webm','mp4', 'gif',
@@ -112,6 +166,17 @@ class MPLRenderer(Renderer):
                       'mime_type':MIME_TYPES[fmt]}
 
 
+    @bothmethod
+    def get_plot(self_or_cls, obj, renderer=None, **kwargs):
+        """
+        Given a HoloViews Viewable return a corresponding plot instance.
+        """
+        plot = super(MPLRenderer, self_or_cls).get_plot(obj, renderer, **kwargs)
+        if not isinstance(obj, Plot):
+            plot._source = obj
+        return plot
+
+
     def show(self, obj):
         """
         Renders the supplied object and displays it using the active
@@ -191,9 +256,13 @@ class MPLRenderer(Renderer):
         if fmt in ['gif', 'mp4', 'webm']:
             if sys.version_info[0] == 3 and mpl.__version__[:-2] in ['1.2', '1.3']:
                 raise Exception("<b>Python 3 matplotlib animation support broken &lt;= 1.3</b>")
-            with mpl.rc_context(rc=plot.fig_rcparams):
-                anim = plot.anim(fps=self.fps)
-            data = self._anim_data(anim, fmt)
+            payload = self._parallel_payload(plot, fmt)
+            if payload is None:
+                with mpl.rc_context(rc=plot.fig_rcparams):
+                    anim = plot.anim(fps=self.fps)
+                data = self._anim_data(anim, fmt)
+            else:
+                data = self._parallel_anim_data(plot, fmt, payload)
         else:
             fig = plot.state
 
@@ -248,6 +317,111 @@ class MPLRenderer(Renderer):
         return video
 
 
+    def _parallel_payload(self, plot, fmt):
+        """
+        Returns the pickled object the plot was created from if the
+        animation can be rendered in parallel.
+        """
+        writer = ANIMATION_OPTS[fmt][0]
+        if (self.processes is None or writer not in ('ffmpeg', 'pillow')
+            or plot._source is None or plot.dynamic):
+            return None
+        try:
+            return Store.dumps(plot._source, protocol=-1)
+        except Exception as e:
+            self.warning('Could not pickle %s to render frames in parallel, '
+                         'rendering frames sequentially: %s'
+                         % (type(plot._source).__name__, e))
+            return None
+
+
+    def _parallel_anim_data(self, plot, fmt, payload):
+        """
+        Renders the frames of an animation on a pool of worker
+        processes and returns the encoded animation. Chunks of
+        frames are submitted as earlier chunks are encoded, so that
+        at most max_buffered_frames frames are held in memory.
+        """
+        import multiprocessing
+        (writer, _, anim_kwargs, extra_args) = ANIMATION_OPTS[fmt]
+        fps = max([int(self.fps), 1]) if self.fps is not None else anim_kwargs.get('fps', 5)
+        dpi = self.dpi if self.dpi is not None else plot.state.dpi
+        keys = list(plot.keys)
+        chunks = iter([keys[i:i+self.chunksize] for i in range(0, len(keys), self.chunksize)])
+        max_pending = max(1, self.max_buffered_frames // self.chunksize)
+
+        pool = multiprocessing.Pool(self.processes, _init_frame_worker,
+                                    (payload, dpi, self.size))
+        encoder = None
+        with NamedTemporaryFile(suffix='.%s' % fmt) as f:
+            try:
+                pending = deque(pool.apply_async(_render_frames, (chunk, dpi))
+                                for _, chunk in zip(range(max_pending), chunks))
+                rendered = 0
+                while pending:
+                    size, frames = pending.popleft().get()
+                    if encoder is None:
+                        encoder = self._frame_encoder(writer, size, fps, f.name,
+                                                      anim_kwargs, extra_args)
+                        next(encoder)
+                    for frame in frames:
+                        encoder.send(frame)
+                    rendered += len(frames)
+                    if self.progress_bar is not None:
+                        self.progress_bar(100.*rendered/len(keys))
+                    chunk = next(chunks, None)
+                    if chunk is not None:
+                        pending.append(pool.apply_async(_render_frames, (chunk, dpi)))
+                if encoder is not None:
+                    encoder.close()
+            finally:
+                pool.terminate()
+            return f.read()
+
+
+    def _frame_encoder(self, writer, size, fps, filename, anim_kwargs, extra_args):
+        """
+        Coroutine which is sent the RGBA buffers of each frame and
+        writes the encoded animation to the supplied filename once
+        closed.
+        """
+        w, h = size
+        if writer == 'pillow':
+            from PIL import Image
+            frames = []
+            try:
+                while True:
+                    frames.append(Image.frombytes('RGBA', (w, h), (yield)))
+            except GeneratorExit:
+                frames[0].save(filename, save_all=True, append_images=frames[1:],
+                               duration=int(1000 / fps))
+            return
+
+        # Video codecs with chroma subsampling require even frame sizes
+        cropped = (w - w % 2, h - h % 2)
+        codec = anim_kwargs.get('codec', mpl.rcParams['animation.codec'])
+        args = [mpl.rcParams['animation.ffmpeg_path'], '-f', 'rawvideo',
+                '-vcodec', 'rawvideo', '-s', '%dx%d' % cropped, '-pix_fmt', 'rgba',
+                '-r', str(fps), '-i', 'pipe:', '-vcodec', codec]
+        args += list(extra_args) + ['-y', filename]
+        with TemporaryFile() as log:
+            proc = subprocess.Popen(args, stdin=subprocess.PIPE,
+                                    stdout=log, stderr=log)
+            try:
+                while True:
+                    frame = yield
+                    if cropped != size:
+                        frame = np.frombuffer(frame, dtype='uint8').reshape(h, w, 4)
+                        frame = np.ascontiguousarray(frame[:cropped[1], :cropped[0]]).tobytes()
+                    proc.stdin.write(frame)
+            except GeneratorExit:
+                proc.stdin.close()
+                if proc.wait():
+                    log.seek(0)
+                    raise RuntimeError('Encoding the animation with ffmpeg failed:\n%s'
+                                       % log.read().decode('utf-8', 'replace'))
+
+
     def _compute_bbox(self, fig, kw):
         """
         Compute the tight bounding box for each figure once, reducing
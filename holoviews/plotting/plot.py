@@ -12,6 +12,7 @@ import param
 
 from ..core import OrderedDict
 from ..core import util, traversal
+from ..core.data import Dataset
 from ..core.element import Element
 from ..core.overlay import Overlay, CompositeOverlay
 from ..core.layout import Empty, NdLayout, Layout
@@ -444,6 +445,9 @@ class DimensionedPlot(Plot):
         group_ranges = OrderedDict()
         for el in elements:
             if isinstance(el, (Empty, Table)): continue
+            if isinstance(el, Dataset):
+                # Allows lazy interfaces to compute all ranges in one pass
+                el.interface.prefetch(el, el.dimensions('ranges'))
             for dim in el.dimensions('ranges'):
                 data_range = el.range(dim, dimension_range=False)
                 if dim.name not in group_ranges:
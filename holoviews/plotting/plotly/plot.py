@@ -17,6 +17,11 @@ class PlotlyPlot(DimensionedPlot):
 
     height = param.Integer(default=400)
 
+    # Whether pushed updates only contain the changes since the last
+    # update, disabled when the plot is displayed by a widget since
+    # the widget caches every frame it receives
+    _incremental = True
+
     @property
     def state(self):
         """
@@ -26,6 +31,16 @@ class PlotlyPlot(DimensionedPlot):
         return self.handles['fig']
 
 
+    def push(self):
+        """
+        Pushes updated plot data via the Comm.
+        """
+        if self.comm is None:
+            raise Exception('Renderer does not have a comm.')
+        diff = self.renderer.diff(self, incremental=self._incremental)
+        self.comm.send(diff)
+
+
     def initialize_plot(self, ranges=None):
         return self.generate_plot(self.keys[-1], ranges)
 
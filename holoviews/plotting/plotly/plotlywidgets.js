@@ -25,8 +25,12 @@ var PlotlyMethods = {
     this.update(this.current);
   },
   update : function(current){
-    var data = this.frames[current];
+    var data = hv_decode_arrays(this.frames[current]);
     var plot = $('#'+this.id)[0];
+    if (data.data.length != plot.data.length) {
+      Plotly.newPlot(plot, data.data, data.layout);
+      return;
+    }
     for (var i = 0; i < data.data.length; i++) {
       for (var key in data.data[i]) {
         plot.data[i][key] = data.data[i][key];
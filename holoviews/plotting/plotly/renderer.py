@@ -1,4 +1,5 @@
 import json
+import weakref
 
 import param
 with param.logging_level('CRITICAL'):
@@ -7,20 +8,62 @@ with param.logging_level('CRITICAL'):
 from ..renderer import Renderer, MIME_TYPES
 from ...core.options import Store
 from ...core import HoloMap
+from .util import encode_arrays, figure_patch, figure_state
 from .widgets import PlotlyScrubberWidget, PlotlySelectionWidget
 
 
-plotly_msg_handler = """
+# Decodes the base64 encoded arrays produced by encode_arrays into
+# typed arrays, 2D arrays are returned as a list of rows. Exported on
+# the window so that it is available to the widgets.
+plotly_decode_js = """
+function hv_decode_arrays(obj) {
+  var types = {float64: Float64Array, float32: Float32Array, int8: Int8Array,
+               int16: Int16Array, int32: Int32Array, uint8: Uint8Array,
+               uint16: Uint16Array, uint32: Uint32Array};
+  if (Array.isArray(obj)) {
+    return obj.map(hv_decode_arrays);
+  } else if (obj === null || typeof obj !== 'object') {
+    return obj;
+  } else if (obj.bdata !== undefined && obj.dtype in types) {
+    var bytes = atob(obj.bdata);
+    var buffer = new Uint8Array(bytes.length);
+    for (var i = 0; i < bytes.length; i++) {
+      buffer[i] = bytes.charCodeAt(i);
+    }
+    var array = new types[obj.dtype](buffer.buffer);
+    if (obj.shape === undefined) {
+      return array;
+    }
+    var rows = [], ncols = obj.shape[1];
+    for (var r = 0; r < obj.shape[0]; r++) {
+      rows.push(array.subarray(r*ncols, (r+1)*ncols));
+    }
+    return rows;
+  }
+  var decoded = {};
+  for (var key in obj) {
+    decoded[key] = hv_decode_arrays(obj[key]);
+  }
+  return decoded;
+}
+window.hv_decode_arrays = hv_decode_arrays;
+"""
+
+plotly_msg_handler = plotly_decode_js.replace('{', '{{').replace('}', '}}') + """
 /* Backend specific body of the msg_handler, updates displayed frame */
 var plot = $('#{plot_id}')[0];
-var data = JSON.parse(msg);
-$.each(data.data, function(i, obj) {{
-  $.each(Object.keys(obj), function(j, key) {{
-    plot.data[i][key] = obj[key];
+var data = hv_decode_arrays(JSON.parse(msg));
+if (!data.patch && data.data.length != plot.data.length) {{
+  Plotly.newPlot(plot, data.data, data.layout);
+}} else {{
+  $.each(data.data, function(i, obj) {{
+    $.each(Object.keys(obj), function(j, key) {{
+      plot.data[i][key] = obj[key];
+    }});
   }});
-}});
-Plotly.relayout(plot, data.layout);
-Plotly.redraw(plot);
+  Plotly.relayout(plot, data.layout);
+  Plotly.redraw(plot);
+}}
 """
 
 PLOTLY_WARNING = """
@@ -53,6 +96,10 @@ class PlotlyRenderer(Renderer):
 
     _loaded = False
 
+    # Figure state last sent to the frontend for each plot, used to
+    # compute incremental diffs
+    _sent_states = weakref.WeakKeyDictionary()
+
     def __call__(self, obj, fmt='html', divuuid=None):
         plot, fmt =  self._validate(obj, fmt)
         mime_types = {'file-ext':fmt, 'mime_type': MIME_TYPES[fmt]}
@@ -65,15 +112,25 @@ class PlotlyRenderer(Renderer):
             return self.diff(plot), mime_types
 
 
-    def diff(self, plot, serialize=True):
+    def diff(self, plot, serialize=True, incremental=False):
         """
         Returns a json diff required to update an existing plot with
-        the latest plot data.
+        the latest plot data. If incremental, the diff is a patch
+        only containing the traces and layout keys which changed since
+        the state last sent for the plot. Numeric arrays are
+        serialized as base64 encoded binary buffers.
         """
-        diff = {'data': plot.state.get('data', []),
-                'layout': plot.state.get('layout', {})}
+        state = plot.state
+        previous = self._sent_states.get(plot) if incremental else None
+        patch = None if previous is None else figure_patch(previous, state)
+        if patch is None:
+            diff = {'data': state.get('data', []),
+                    'layout': state.get('layout', {}), 'patch': False}
+        else:
+            diff = dict(patch, patch=True)
+        self._sent_states[plot] = figure_state(state)
         if serialize:
-            return json.dumps(diff, cls=utils.PlotlyJSONEncoder)
+            return json.dumps(encode_arrays(diff), cls=utils.PlotlyJSONEncoder)
         else:
             return diff
 
@@ -83,8 +140,9 @@ class PlotlyRenderer(Renderer):
         if divuuid is None:
             divuuid = plot.id
 
-        jdata = json.dumps(figure.get('data', []), cls=utils.PlotlyJSONEncoder)
-        jlayout = json.dumps(figure.get('layout', {}), cls=utils.PlotlyJSONEncoder)
+        self._sent_states[plot] = figure_state(figure)
+        jdata = json.dumps(encode_arrays(figure.get('data', [])), cls=utils.PlotlyJSONEncoder)
+        jlayout = json.dumps(encode_arrays(figure.get('layout', {})), cls=utils.PlotlyJSONEncoder)
 
         config = {}
         config['showLink'] = False
@@ -98,7 +156,8 @@ class PlotlyRenderer(Renderer):
                       '</script>')
 
         script = '\n'.join([
-            'Plotly.plot("{id}", {data}, {layout}, {config}).then(function() {{',
+            plotly_decode_js.replace('{', '{{').replace('}', '}}'),
+            'Plotly.plot("{id}", hv_decode_arrays({data}), hv_decode_arrays({layout}), {config}).then(function() {{',
             '    var elem = document.getElementById("{id}.loading"); elem.parentNode.removeChild(elem);',
             '}})']).format(id=divuuid,
                            data=jdata,
@@ -1,6 +1,16 @@
+import base64
+
+import numpy as np
 import plotly.graph_objs as go
 
 
+# Mapping from numpy dtype to the corresponding JS typed array,
+# dtypes without an equivalent are sent as float64
+typed_array_dtypes = {'f8': 'float64', 'f4': 'float32', 'i1': 'int8',
+                      'i2': 'int16', 'i4': 'int32', 'u1': 'uint8',
+                      'u2': 'uint16', 'u4': 'uint32'}
+
+
 def add_figure(fig, subfig, r, c, idx):
     """
     Combines a figure with an existing figure created with
@@ -32,3 +42,83 @@ def replace_refs(obj, ind):
         return new_obj
     else:
         return obj
+
+
+def encode_arrays(obj):
+    """
+    Recursively replaces the numeric 1D and 2D arrays in a figure with
+    base64 encoded buffers, which are decoded into typed arrays by
+    the frontend rather than being serialized as lists of numbers.
+    """
+    if (isinstance(obj, np.ndarray) and obj.dtype.kind in 'iuf'
+        and obj.ndim in (1, 2) and obj.size):
+        key = obj.dtype.str[1:]
+        if key not in typed_array_dtypes:
+            obj, key = obj.astype('float64'), 'f8'
+        data = np.ascontiguousarray(obj, dtype=obj.dtype.newbyteorder('<'))
+        encoded = {'dtype': typed_array_dtypes[key],
+                   'bdata': base64.b64encode(data.tobytes()).decode('ascii')}
+        if obj.ndim == 2:
+            encoded['shape'] = list(obj.shape)
+        return encoded
+    elif isinstance(obj, dict):
+        return {k: encode_arrays(v) for k, v in obj.items()}
+    elif isinstance(obj, (list, tuple)):
+        return [encode_arrays(v) for v in obj]
+    return obj
+
+
+def figure_state(figure):
+    """
+    Returns the traces and layout of a figure, copying the containers
+    so the state may be compared against later versions of the figure.
+    """
+    return ([dict(trace) for trace in figure.get('data', [])],
+            dict(figure.get('layout', {})))
+
+
+def values_equal(a, b):
+    """
+    Compares two figure values which may be nested dictionaries,
+    lists or arrays, treating NaNs in the same position as equal.
+    """
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        a, b = np.asarray(a), np.asarray(b)
+        if a.shape != b.shape or a.dtype.kind != b.dtype.kind:
+            return False
+        elif a.dtype.kind in 'fc':
+            return bool(((a == b) | (np.isnan(a) & np.isnan(b))).all())
+        return np.array_equal(a, b)
+    elif isinstance(a, dict) and isinstance(b, dict):
+        return (set(a) == set(b) and
+                all(values_equal(v, b[k]) for k, v in a.items()))
+    elif isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return (len(a) == len(b) and
+                all(values_equal(va, vb) for va, vb in zip(a, b)))
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
+def figure_patch(state, figure):
+    """
+    Computes the changes to the traces and layout of a figure since
+    the supplied state, as returned by figure_state. Each trace is
+    mapped to the keys which changed, in the form expected by
+    Plotly.restyle and Plotly.relayout, with removed keys set to
+    None. Returns None if the number of traces changed, in which
+    case the figure has to be replaced.
+    """
+    traces, layout = figure.get('data', []), figure.get('layout', {})
+    previous_traces, previous_layout = state
+    if len(traces) != len(previous_traces):
+        return None
+    def changes(previous, current):
+        changed = {k: v for k, v in current.items()
+                   if k not in previous or not values_equal(previous[k], v)}
+        changed.update({k: None for k in previous if k not in current})
+        return changed
+    return {'data': [changes(previous, trace) for previous, trace
+                     in zip(previous_traces, traces)],
+            'layout': changes(previous_layout, layout)}
@@ -8,6 +8,12 @@ class PlotlyWidget(NdWidget):
     extensionjs = param.String(default='plotlywidgets.js', doc="""
         Optional javascript extension file for a particular backend.""")
 
+    def __init__(self, plot, renderer=None, **params):
+        super(PlotlyWidget, self).__init__(plot, renderer, **params)
+        # Cached frames are replayed in any order so each one has to
+        # contain the full figure
+        self.plot._incremental = False
+
     def _get_data(self):
         # Get initial frame to draw immediately
         msg, metadata = self.renderer.components(self.plot, divuuid=self.id, comm=False)
@@ -3,7 +3,6 @@ from __future__ import unicode_literals, absolute_import, division
 from collections import defaultdict, namedtuple
 
 import traceback
-import warnings
 import bisect
 
 import numpy as np
@@ -930,32 +929,85 @@ def traverse_setter(obj, attribute, value):
     obj.traverse(lambda x: setattr(x, attribute, value))
 
 
-def _get_min_distance_numpy(element):
+def _min_distance_points(element):
     """
-    NumPy based implementation of get_min_distance
+    Returns the finite x- and y-coordinates of an element as an Nx2
+    float array, dropping duplicate points.
     """
     xys = element.array([0, 1])
-    with warnings.catch_warnings():
-        warnings.filterwarnings('ignore', r'invalid value encountered in')
-        xys = xys.astype('float32').view(np.complex64)
-        distances = np.abs(xys.T-xys)
-        np.fill_diagonal(distances, np.inf)
-        distances = distances[distances>0]
-        if len(distances):
-            return distances.min()
-    return 0
+    if xys.dtype.kind not in 'f':
+        xys = xys.astype('float64')
+    xys = xys[np.isfinite(xys).all(axis=1)]
+    if len(xys) < 2:
+        return xys
+    return np.unique(xys, axis=0)
 
 
-def get_min_distance(element):
+def _get_min_distance_numpy(element, max_samples=None):
     """
-    Gets the minimum sampling distance of the x- and y-coordinates
-    in a grid.
+    NumPy based implementation of get_min_distance using a sweep over
+    the points sorted along the axis with the larger spread. At each
+    step the distance between each queried point and its k-th
+    neighbours along that axis is computed, dropping points whose
+    k-th neighbours are further apart along the axis than the closest
+    pair found so far. If max_samples is set only the nearest
+    neighbours of a random subset of the points are queried.
+    """
+    xys = _min_distance_points(element)
+    if len(xys) < 2:
+        return 0
+    queried = np.arange(len(xys))
+    if max_samples is not None and len(xys) > max_samples:
+        prng = np.random.RandomState(42)
+        queried = prng.choice(len(xys), max_samples, False)
+    axis = np.argmax(np.ptp(xys, axis=0))
+    order = np.argsort(xys[:, axis], kind='mergesort')
+    ranks = np.empty_like(order)
+    ranks[order] = np.arange(len(order))
+    xys, queried = xys[order], ranks[queried]
+    coords = xys[:, axis]
+    min_dist = np.inf
+    lower, upper = queried, queried
+    for k in range(1, len(xys)):
+        lower = lower[lower >= k]
+        lower = lower[coords[lower]-coords[lower-k] < min_dist]
+        upper = upper[upper+k < len(xys)]
+        upper = upper[coords[upper+k]-coords[upper] < min_dist]
+        if not len(lower) and not len(upper):
+            break
+        for idx, offset in ((lower, -k), (upper, k)):
+            if len(idx):
+                dists = np.hypot(*(xys[idx+offset]-xys[idx]).T)
+                min_dist = min(min_dist, dists.min())
+    return min_dist
+
+
+def get_min_distance(element, max_samples=100000):
+    """
+    Gets the minimum distance between any two distinct points of an
+    element (e.g. the sampling distance of the x- and y-coordinates in
+    a grid), ignoring duplicate and non-finite points. Uses a KD-tree
+    if scipy is available and falls back to a sweep over the sorted
+    points otherwise.
+
+    If the element has more than max_samples points the distance is
+    estimated from the nearest neighbours of a random subset of the
+    points, set max_samples to None to always compute the exact
+    distance.
     """
     try:
-        from scipy.spatial.distance import pdist
-        return pdist(element.array([0, 1])).min()
-    except:
-        return _get_min_distance_numpy(element)
+        from scipy.spatial import cKDTree
+    except ImportError:
+        return _get_min_distance_numpy(element, max_samples)
+    xys = _min_distance_points(element)
+    if len(xys) < 2:
+        return 0
+    queried = xys
+    if max_samples is not None and len(xys) > max_samples:
+        prng = np.random.RandomState(42)
+        queried = xys[prng.choice(len(xys), max_samples, False)]
+    distances, _ = cKDTree(xys).query(queried, k=2)
+    return distances[:, 1].min()
 
 
 def rgb2hex(rgb):
@@ -424,6 +424,8 @@ class Pipe(Stream):
     def __init__(self, data=None, memoize=False, **params):
         super(Pipe, self).__init__(data=data, **params)
         self._memoize = memoize
+        self._version = 0
+        self._data_hash = None
 
     def send(self, data):
         """
@@ -432,11 +434,30 @@ class Pipe(Stream):
         """
         self.event(data=data)
 
+    def update(self, **kwargs):
+        if 'data' in kwargs:
+            from .core.data.interface import DataStatistics
+            DataStatistics.invalidate(kwargs['data'])
+            self._version += 1
+        super(Pipe, self).update(**kwargs)
+
     @property
     def hashkey(self):
-        if self._memoize:
-            return self.contents
-        return {'hash': uuid.uuid4().hex}
+        if not self._memoize:
+            return {'hash': uuid.uuid4().hex}
+        contents = self.contents
+        data_key = self._rename.get('data', 'data')
+        if data_key not in contents:
+            return contents
+
+        # Cache the content hash of the data keyed on its identity and
+        # the number of updates to avoid rehashing it on every call
+        data_id = (id(self.data), self._version)
+        if self._data_hash is None or self._data_hash[0] != data_id:
+            self._data_hash = (data_id, util.deephash(self.data))
+        if self._data_hash[1] is not None:
+            contents[data_key] = self._data_hash[1]
+        return contents
 
 
 class Buffer(Pipe):
@@ -455,9 +476,20 @@ class Buffer(Pipe):
     When streaming a DataFrame will reset the DataFrame index by
     default making it available to HoloViews elements as dimensions,
     this may be disabled by setting index=False.
+
+    By default each update concatenates the previous rows with the
+    incoming chunk, copying the whole buffer. If ring=True the rows
+    are instead written into preallocated column arrays holding twice
+    the buffer length, so an update only copies the incoming chunk
+    (and periodically moves the retained rows to the start of the
+    arrays), while the data is exposed as a view onto the arrays.
+    Since the arrays are reused, the data of earlier updates may be
+    overwritten and should be copied if it has to be retained.
+    DataFrames with extension dtypes or a MultiIndex are always
+    concatenated.
     """
 
-    def __init__(self, data, length=1000, index=True, **params):
+    def __init__(self, data, length=1000, index=True, ring=False, **params):
         if (util.pd and isinstance(data, util.pd.DataFrame)):
             example = data
         elif isinstance(data, np.ndarray):
@@ -494,9 +526,11 @@ class Buffer(Pipe):
         params['data'] = example
         super(Buffer, self).__init__(**params)
         self.length = length
+        self.ring = ring
         self._chunk_length = 0
         self._count = 0
         self._index = index
+        self._ring = None
 
 
     def verify(self, x):
@@ -532,14 +566,120 @@ class Buffer(Pipe):
             data = {k: v[:0] for k, v in self.data.items()}
         with util.disable_constant(self):
             self.data = data
+        self._ring = None
         self.send(data)
 
 
+    def _ring_columns(self, data):
+        """
+        Returns the columns of the accepted data types as a list of
+        arrays, where 2D arrays are treated as a single column and the
+        index of a DataFrame is appended as the last column. Returns
+        None if the data cannot be held in a ring buffer.
+        """
+        if isinstance(data, np.ndarray):
+            return [data]
+        elif isinstance(data, dict):
+            return [np.asarray(data[k]) for k in self.data]
+        columns = list(data.columns)
+        if (len(set(columns)) != len(columns) or
+            isinstance(data.index, util.pd.MultiIndex) or
+            not all(isinstance(dt, np.dtype) for dt in
+                    list(data.dtypes)+[data.index.dtype])):
+            return None
+        return [data[c].values for c in columns] + [np.asarray(data.index)]
+
+
+    def _allocate_ring(self, prev, chunk):
+        """
+        Allocates the ring buffer arrays with space for twice the
+        buffer length, using dtypes able to hold both the current and
+        the incoming data, and copies the current rows into them.
+        """
+        capacity = 2*self.length
+        dtypes = [np.result_type(p, c) for p, c in zip(prev, chunk)]
+        if isinstance(self.data, np.ndarray):
+            ring = np.empty((capacity,)+chunk[0].shape[1:], dtype=dtypes[0])
+            arrays = [ring]
+        elif isinstance(self.data, dict):
+            ring = util.OrderedDict((k, np.empty(capacity, dtype=dt))
+                                    for k, dt in zip(self.data, dtypes))
+            arrays = list(ring.values())
+        else:
+            columns = list(self.data.columns)
+            ring = util.pd.DataFrame(util.OrderedDict(
+                (c, np.empty(capacity, dtype=dt)) for c, dt in zip(columns, dtypes)),
+                                     columns=columns)
+            # Rows are written into the column arrays of the DataFrame
+            # directly, which requires them to be views on its blocks
+            arrays = [ring[c].values for c in columns]
+            if any(not a.flags.writeable or
+                   a.ctypes.data != ring[c].values.ctypes.data
+                   for a, c in zip(arrays, columns)):
+                return False
+            arrays.append(np.empty(capacity, dtype=dtypes[-1]))
+        rows = min(len(prev[0]), self.length)
+        for arr, values in zip(arrays, prev):
+            arr[:rows] = values[len(values)-rows:]
+        self._ring = (ring, arrays, 0, rows)
+        return True
+
+
+    def _ring_concat(self, data):
+        """
+        Writes the data into the ring buffer and returns the window of
+        the last rows up to the defined length. Returns None if the data
+        cannot be held in a ring buffer.
+        """
+        chunk = self._ring_columns(data)
+        if chunk is None:
+            self._ring = None
+            return None
+        elif (self._ring is None or len(self._ring[1][0]) != 2*self.length or
+              any(np.result_type(a, c) != a.dtype for a, c in zip(self._ring[1], chunk))):
+            prev = self._ring_columns(self.data)
+            if prev is None or not self._allocate_ring(prev, chunk):
+                self._ring = None
+                return None
+
+        ring, arrays, start, end = self._ring
+        data_length = len(chunk[0])
+        if data_length >= self.length:
+            start, end = 0, self.length
+            for arr, values in zip(arrays, chunk):
+                arr[:end] = values[data_length-end:]
+        else:
+            if end + data_length > len(arrays[0]):
+                # Move the retained rows to the start of the arrays
+                retained = min(end-start, self.length-data_length)
+                for arr in arrays:
+                    arr[:retained] = arr[end-retained:end]
+                start, end = 0, retained
+            for arr, values in zip(arrays, chunk):
+                arr[end:end+data_length] = values
+            end += data_length
+            start = max(start, end-self.length)
+        self._ring = (ring, arrays, start, end)
+        self._chunk_length = data_length
+
+        if isinstance(self.data, np.ndarray):
+            return ring[start:end]
+        elif isinstance(self.data, dict):
+            return {k: v[start:end] for k, v in ring.items()}
+        window = ring.iloc[start:end]
+        window.index = util.pd.Index(arrays[-1][start:end], name=self.data.index.name)
+        return window
+
+
     def _concat(self, data):
         """
         Concatenate and slice the accepted data types to the defined
         length.
         """
+        if self.ring:
+            window = self._ring_concat(data)
+            if window is not None:
+                return window
         if isinstance(data, np.ndarray):
             data_length = len(data)
             if data_length < self.length:
@@ -570,6 +710,26 @@ class Buffer(Pipe):
         return data
 
 
+    def _extend_statistics(self, chunk, data):
+        """
+        If the chunk was appended without dropping any rows, extends
+        the statistics (e.g. ranges) cached on the previous data to
+        avoid rescanning the full buffer.
+        """
+        from .core.data.interface import DataStatistics
+        prev = self.data
+        if isinstance(data, dict):
+            columns = [(prev.get(k), data[k], (), chunk[k]) for k in data]
+        elif isinstance(data, np.ndarray):
+            columns = [(prev, data, (i,), chunk[:, i]) for i in range(data.shape[1])]
+        else:
+            columns = [(prev, data, (c,), chunk[c].values) for c in data.columns]
+        for old, new, column, values in columns:
+            if old is None or new is old or len(new) != len(old) + len(values):
+                continue
+            DataStatistics.extend(old, new, column, values)
+
+
     def update(self, **kwargs):
         """
         Overrides update to concatenate streamed data up to defined length.
@@ -581,6 +741,7 @@ class Buffer(Pipe):
                 data = data.reset_index()
             self.verify(data)
             kwargs['data'] = self._concat(data)
+            self._extend_statistics(data, kwargs['data'])
             self._count += 1
         super(Buffer, self).update(**kwargs)
 
@@ -896,6 +1057,25 @@ class PlotReset(LinkedStream):
         super(PlotReset, self).__init__(self, *args, **dict(params, transient=True))
 
 
+class TableWindow(LinkedStream):
+    """
+    A stream representing the window of rows held by a paginated
+    table, the dimension the rows are sorted by and the filters
+    applied to the rows before they are sorted.
+    """
+
+    start = param.Integer(default=0, bounds=(0, None), constant=True, doc="""
+        Index of the first row in the window.""")
+
+    sort = param.String(default=None, allow_None=True, constant=True, doc="""
+        Name of the dimension the rows are sorted by, prefixed with
+        a '-' to sort in descending order.""")
+
+    filters = param.Dict(default={}, constant=True, doc="""
+        Selection applied to the rows, specified as the keyword
+        arguments to the select method of the table.""")
+
+
 
 class PositionX(PointerX):
     def __init__(self, **params):
@@ -10,7 +10,7 @@ import numpy as np
 
 from holoviews import Dataset, HoloMap, Dimension
 from holoviews.core.data import concat
-from holoviews.core.data.interface import DataError
+from holoviews.core.data.interface import DataError, DataStatistics
 from holoviews.element import Scatter, Curve
 from holoviews.element.comparison import ComparisonTestCase 
 
@@ -280,6 +280,21 @@ class HomogeneousColumnTests(object):
         self.assertEqual(dataset.aggregate(['x'], np.mean),
                          Dataset({'x':self.xs, 'z':z_ints}, kdims=['x'], vdims=['z']))
 
+    def test_dataset_groupby_multiple_dims_interleaved_hm(self):
+        dataset = Dataset({'x': [1, 0, 1, 0, 1], 'y': [5, 6, 5, 5, 5],
+                           'z': [0, 1, 2, 3, 4]}, kdims=['x', 'y'], vdims=['z'])
+        grouped = HoloMap([((1, 5), Dataset({'z': [0, 2, 4]}, kdims=[], vdims=['z'])),
+                           ((0, 6), Dataset({'z': [1]}, kdims=[], vdims=['z'])),
+                           ((0, 5), Dataset({'z': [3]}, kdims=[], vdims=['z']))],
+                          kdims=['x', 'y'], sort=False)
+        self.assertEqual(dataset.groupby(['x', 'y']), grouped)
+
+    def test_dataset_2D_aggregate_interleaved_hm(self):
+        dataset = Dataset({'x': [1, 0, 1, 0, 1], 'y': [5, 6, 5, 5, 5],
+                           'z': [0, 1, 2, 3, 4]}, kdims=['x', 'y'], vdims=['z'])
+        self.assertEqual(dataset.aggregate(['x'], np.sum),
+                         Dataset({'x': [1, 0], 'z': [6, 4]}, kdims=['x'], vdims=['z']))
+
     # Indexing
 
     def test_dataset_index_column_idx_hm(self):
@@ -399,6 +414,30 @@ class HeterogeneousColumnTests(HomogeneousColumnTests):
     Tests for data formats that allow dataset to have varied types
     """
 
+    def test_dataset_range_cached_on_clone(self):
+        self.table.range('Age')
+        cached = DataStatistics.cached(self.table.clone(), 'Age', 'range')
+        self.assertEqual(cached, (10, 16))
+
+    def test_dataset_range_not_shared_on_new_data(self):
+        self.table.range('Age')
+        selected = self.table.select(Age=(11, None))
+        self.assertEqual(selected.range('Age'), (12, 16))
+
+    def test_dataset_range_inplace_modification(self):
+        data = {'x': np.array([0, 1]), 'y': np.array([2, 3])}
+        Dataset(data, kdims=['x'], vdims=['y']).range('y')
+        data['y'] *= 10
+        ds = Dataset(data, kdims=['x'], vdims=['y'])
+        self.assertEqual(ds.range('y'), (20, 30))
+
+    def test_dataset_statistics_nan_count(self):
+        ds = Dataset({'x': [0, 1, 2], 'y': [np.NaN, 1, np.NaN]}, kdims=['x'], vdims=['y'])
+        self.assertEqual(DataStatistics.nan_count(ds, 'y'), 2)
+
+    def test_dataset_statistics_unique_count(self):
+        self.assertEqual(DataStatistics.unique_count(self.table, 'Gender'), 2)
+
     def init_column_data(self):
         self.kdims = ['Gender', 'Age']
         self.vdims = ['Weight', 'Height']
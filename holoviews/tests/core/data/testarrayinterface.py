@@ -1,6 +1,7 @@
 import numpy as np
 
 from holoviews.core.data import Dataset
+from holoviews.core.data.interface import DataStatistics
 
 from .base import HomogeneousColumnTests, InterfaceTests
 
@@ -36,3 +37,16 @@ class ArrayDatasetTest(HomogeneousColumnTests, InterfaceTests):
         ds_sorted = Dataset(([2, 2, 1, 1], [2, 1, 2, 1], [0, 2, 1, 3]),
                             kdims=['x', 'y'], vdims=['z'])
         self.assertEqual(ds.sort(reverse=True), ds_sorted)
+
+    def test_dataset_range_cached_per_column(self):
+        ds = Dataset(np.array([[0, 3], [1, 2]]), kdims=['x'], vdims=['y'])
+        swapped = Dataset(ds.data, kdims=['y'], vdims=['x'])
+        ds.range('y')
+        self.assertEqual(DataStatistics.cached(ds.clone(), 'y', 'range'), (2, 3))
+        self.assertEqual(swapped.range('y'), (0, 1))
+
+    def test_dataset_range_inplace_modification(self):
+        arr = np.array([[0, 3], [1, 2]])
+        Dataset(arr, kdims=['x'], vdims=['y']).range('y')
+        arr[:, 1] *= 10
+        self.assertEqual(Dataset(arr, kdims=['x'], vdims=['y']).range('y'), (20, 30))
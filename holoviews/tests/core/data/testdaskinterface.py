@@ -10,6 +10,7 @@ except:
     raise SkipTest("Could not import dask, skipping DaskInterface tests.")
 
 from holoviews.core.data import Dataset
+from holoviews.core.data.interface import DataStatistics
 
 from .testpandasinterface import PandasInterfaceTests
 
@@ -77,3 +78,33 @@ class DaskDatasetTest(PandasInterfaceTests):
         ds_range = ds.range(0)
         self.assertTrue(np.isnan(ds_range[0]))
         self.assertTrue(np.isnan(ds_range[1]))
+
+    def test_dataset_prefetch_caches_statistics(self):
+        df = pd.DataFrame({'x': np.arange(10), 'y': np.arange(10)[::-1], 'z': list('ab')*5})
+        ds = Dataset(dd.from_pandas(df, 2), ['x', 'y'], 'z')
+        ds.interface.prefetch(ds, statistics=('range', 'unique'))
+        self.assertEqual(DataStatistics.cached(ds, None, 'length'), 10)
+        self.assertEqual(DataStatistics.cached(ds, 'y', 'range'), (0, 9))
+        self.assertEqual(DataStatistics.cached(ds.clone(), 'z', 'range'), ('a', 'b'))
+        self.assertEqual(DataStatistics.cached(ds, 'z', 'unique'), np.array(['a', 'b']))
+
+    def test_dataset_groupby_preserves_order(self):
+        df = pd.DataFrame({'x': np.arange(10)[::-1], 'y': np.arange(10), 'z': list('ab')*5})
+        ds = Dataset(dd.from_pandas(df, 3), ['z', 'x'], 'y')
+        grouped = ds.groupby('z')
+        self.assertEqual(grouped.keys(), ['a', 'b'])
+        self.assertEqual(grouped['a'].dimension_values('x'), np.array([9, 7, 5, 3, 1]))
+        self.assertEqual(grouped['b'].dimension_values('y'), np.array([1, 3, 5, 7, 9]))
+
+    def test_dataset_groupby_shuffles_once(self):
+        df = pd.DataFrame({'x': np.arange(10), 'y': np.arange(10), 'z': list('abcde')*2})
+        calls = []
+        def count(partition):
+            calls.append(len(partition))
+            return partition
+        ddf = dd.from_pandas(df, 3).map_partitions(count, meta=df.iloc[:0])
+        grouped = Dataset(ddf, ['z', 'x'], 'y').groupby('z')
+        executed = len(calls)
+        for group in grouped:
+            group.dimension_values('y')
+        self.assertEqual(len(calls), executed)
@@ -269,6 +269,27 @@ class Image_ImageInterfaceTests(InterfaceTests):
         table = Table((xs[xidx], ys[yidx], arr[yidx, xidx]), kdims=['x', 'y'], vdims=['z'])
         self.assertEqual(sampled, table)
 
+    def test_interpolate_nearest(self):
+        arr = np.arange(10)*np.arange(5)[np.newaxis].T
+        img = Image((np.arange(10), np.arange(5), arr), datatype=[self.datatype])
+        sampled = img.interpolate(x=[0.2, 3.6, 8.9], y=[0.4, 3.2, 1.7])
+        self.assertIsInstance(sampled, Table)
+        self.assertEqual(sampled.dimension_values('z'), np.array([0, 12, 18]))
+
+    def test_interpolate_linear(self):
+        arr = np.arange(10)*np.arange(5)[np.newaxis].T
+        img = Image((np.arange(10), np.arange(5), arr), datatype=[self.datatype])
+        sampled = img.interpolate([(0.5, 1), (2.5, 3.5), (9, 4)], method='bilinear')
+        self.assertEqual(sampled.dimension_values('z'), np.array([0.5, 8.75, 36]))
+
+    def test_interpolate_out_of_bounds(self):
+        img = Image((np.arange(10), np.arange(5), np.ones((5, 10))),
+                    datatype=[self.datatype])
+        with self.assertRaises(IndexError):
+            img.interpolate(x=[1, 11], y=[1, 1])
+        sampled = img.interpolate(x=[1, 11], y=[1, 1], mask=True)
+        self.assertEqual(sampled.dimension_values('z'), np.array([1, np.NaN]))
+
     def test_reduce_to_scalar(self):
         self.assertEqual(self.image.reduce(['x', 'y'], function=np.mean),
                          20.25)
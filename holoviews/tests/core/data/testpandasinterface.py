@@ -10,7 +10,7 @@ except:
 
 from holoviews.core.dimension import Dimension
 from holoviews.core.data import Dataset
-from holoviews.core.data.interface import DataError
+from holoviews.core.data.interface import DataError, Interface
 from holoviews.core.spaces import HoloMap
 from holoviews.element import Scatter, Points, Distribution
 
@@ -137,6 +137,32 @@ class PandasInterfaceTests(HeterogeneousColumnTests, InterfaceTests):
         group = Dataset({'z': [5, 11, 17]}, vdims=['z'])
         self.assertEqual(grouped.last, group)
 
+    def test_groupby_skips_dispatch(self):
+        ds = Dataset((list('AB'*10), np.arange(20)), kdims=['x'], vdims=['z'],
+                     datatype=[self.datatype])
+        counts = dict(Interface.dispatch_counts)
+        grouped = ds.groupby('x')
+        self.assertEqual(Interface.dispatch_counts['trusted'], counts.get('trusted', 0)+2)
+        self.assertEqual(Interface.dispatch_counts['init'], counts.get('init', 0))
+        self.assertEqual(grouped['B'], Dataset({'z': np.arange(1, 20, 2)}, vdims=['z']))
+
+    def test_clone_dimension_override_is_validated(self):
+        ds = Dataset(pd.DataFrame({'x': [0, 1], 'y': [1, 2]}), kdims=['x'], vdims=['y'])
+        with self.assertRaises(DataError):
+            ds.clone(vdims=['z'])
+
+    def test_clone_with_data_is_initialized(self):
+        ds = Dataset(pd.DataFrame({'x': [0, 1], 'y': [1, 2]}), kdims=['x'], vdims=['y'])
+        clone = ds.clone({'x': [2, 3], 'y': [3, 4]})
+        self.assertIsInstance(clone.data, self.data_type)
+        self.assertEqual(clone.dimension_values('y'), np.array([3, 4]))
+
+    def test_dataset_range_dataframe_inplace_modification(self):
+        df = pd.DataFrame({'x': [0, 1], 'y': [2, 3]})
+        Dataset(df, kdims=['x'], vdims=['y']).range('y')
+        df['y'] *= 10
+        self.assertEqual(Dataset(df, kdims=['x'], vdims=['y']).range('y'), (20, 30))
+
     def test_dataset_simple_dict_sorted(self):
         dataset = Dataset({2: 2, 1: 1, 3: 3}, kdims=['x'], vdims=['y'])
         self.assertEqual(dataset, Dataset([(i, i) for i in range(1, 4)],
@@ -0,0 +1,171 @@
+"""
+Tests for the RaggedInterface.
+"""
+
+from unittest import SkipTest
+
+import numpy as np
+from holoviews.core.data import Dataset, RaggedData
+from holoviews.core.data.interface import DataError
+from holoviews.element import Path, Polygons
+from holoviews.element.comparison import ComparisonTestCase
+
+try:
+    import pandas as pd
+except:
+    pd = None
+
+
+class RaggedInterfaceTest(ComparisonTestCase):
+    """
+    Test of the RaggedInterface.
+    """
+
+    def setUp(self):
+        self.arrays = [np.column_stack([np.arange(i, i+2), np.arange(i, i+2)])
+                       for i in range(2)]
+
+    def test_ragged_array_dataset(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        self.assertIsInstance(rds.data, RaggedData)
+        self.assertEqual(rds.data.offsets, np.array([0, 2, 4]))
+        for i, ds in enumerate(rds.split()):
+            self.assertEqual(ds, Path(self.arrays[i], kdims=['x', 'y'], datatype=['array']))
+
+    def test_ragged_dict_dataset(self):
+        arrays = [{'x': np.arange(i, i+2), 'y': np.arange(i, i+2)} for i in range(2)]
+        rds = Path(arrays, kdims=['x', 'y'], datatype=['ragged'])
+        for i, ds in enumerate(rds.split()):
+            self.assertEqual(ds, Path(arrays[i], kdims=['x', 'y'], datatype=['dictionary']))
+
+    def test_ragged_df_dataset(self):
+        if not pd:
+            raise SkipTest('Pandas not available')
+        arrays = [pd.DataFrame(arr, columns=['x', 'y']) for arr in self.arrays]
+        rds = Path(arrays, kdims=['x', 'y'], datatype=['ragged'])
+        for i, ds in enumerate(rds.split()):
+            self.assertEqual(ds, Path(arrays[i], kdims=['x', 'y'], datatype=['dataframe']))
+
+    def test_ragged_data_applies(self):
+        data = RaggedData({'x': np.arange(4), 'y': np.arange(4)}, [0, 2, 4])
+        rds = Path(data)
+        self.assertEqual(rds.interface.datatype, 'ragged')
+        self.assertEqual(rds.dimension_values(0), np.array([0., 1, np.NaN, 2, 3]))
+
+    def test_ragged_data_mismatched_offsets_raises(self):
+        data = RaggedData({'x': np.arange(4), 'y': np.arange(4)}, [0, 2, 5])
+        with self.assertRaises(DataError):
+            Path(data)
+
+    def test_ragged_array_dataset_add_dimension_scalar(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged']).add_dimension('A', 0, 'Scalar', True)
+        for i, ds in enumerate(rds.split()):
+            self.assertEqual(ds, Path({('x', 'y'): self.arrays[i], 'A': 'Scalar'}, ['x', 'y'],
+                                      'A', datatype=['dictionary']))
+
+    def test_ragged_dict_dataset_add_dimension_values(self):
+        arrays = [{'x': np.arange(i, i+2), 'y': np.arange(i, i+2)} for i in range(2)]
+        rds = Path(arrays, kdims=['x', 'y'], datatype=['ragged']).add_dimension('A', 0, [0,1], True)
+        for i, ds in enumerate(rds.split()):
+            self.assertEqual(ds, Path(dict(arrays[i], A=i), ['x', 'y'],
+                                      'A', datatype=['dictionary']))
+
+    def test_ragged_array_length(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(len(rds), 5)
+
+    def test_ragged_empty_length(self):
+        rds = Path([], kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(len(rds), 0)
+
+    def test_ragged_array_range(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(rds.range(0), (0, 2))
+
+    def test_ragged_array_shape(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(rds.shape, (5, 2))
+
+    def test_ragged_empty_shape(self):
+        rds = Path([], kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(rds.shape, (0, 2))
+
+    def test_ragged_array_values(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(rds.dimension_values(0), np.array([0., 1, np.NaN, 1, 2]))
+
+    def test_ragged_empty_array_values(self):
+        rds = Path([], kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(rds.dimension_values(0), np.array([]))
+
+    def test_ragged_array_values_coordinates_nonexpanded(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(rds.dimension_values(0, expanded=False), np.array([0., 1, 1, 2]))
+
+    def test_ragged_array_values_coordinates_nonexpanded_constant_kdim(self):
+        arrays = [np.column_stack([np.arange(i, i+2), np.arange(i, i+2), np.ones(2)*i]) for i in range(2)]
+        rds = Path(arrays, kdims=['x', 'y'], vdims=['z'], datatype=['ragged'])
+        self.assertTrue(rds.interface.isscalar(rds, 'z'))
+        self.assertEqual(rds.dimension_values(2, expanded=False), np.array([0, 1]))
+
+    def test_ragged_array_redim(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged']).redim(x='x2')
+        for i, ds in enumerate(rds.split()):
+            self.assertEqual(ds, Path(self.arrays[i], kdims=['x2', 'y'], datatype=['array']))
+
+    def test_ragged_split(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        for arr1, arr2 in zip(rds.split(datatype='array'), self.arrays):
+            self.assertEqual(arr1, arr2)
+
+    def test_ragged_split_start_end(self):
+        rds = Path(self.arrays*2, kdims=['x', 'y'], datatype=['ragged'])
+        split = rds.split(1, 3, datatype='array')
+        self.assertEqual(len(split), 2)
+        self.assertEqual(split[0], self.arrays[1])
+        self.assertEqual(split[1], self.arrays[0])
+
+    def test_ragged_split_empty(self):
+        rds = Path([], kdims=['x', 'y'], datatype=['ragged'])
+        self.assertEqual(len(rds.split()), 0)
+
+    def test_ragged_select(self):
+        ds = Dataset(Path(self.arrays, kdims=['x', 'y'], datatype=['ragged']))
+        selected = ds.select(x=(0.5, 1.5))
+        self.assertEqual(selected.data.offsets, np.array([0, 1, 2]))
+        self.assertEqual(selected.dimension_values('x'), np.array([1., np.NaN, 1]))
+
+    def test_ragged_select_paths(self):
+        rds = Path(self.arrays, kdims=['x', 'y'], datatype=['ragged'])
+        selected = rds.clone(rds.interface.select_paths(rds, np.array([False, True])))
+        self.assertEqual(selected.split(datatype='array'), [self.arrays[1]])
+
+    def test_ragged_dict_groupby(self):
+        arrays = [{'x': np.arange(i, i+2), 'y': i} for i in range(2)]
+        rds = Dataset(arrays, kdims=['x', 'y'], datatype=['ragged'])
+        for i, (k, ds) in enumerate(rds.groupby('y').items()):
+            self.assertEqual(k, arrays[i]['y'])
+            self.assertEqual(ds.dimension_values('x'), arrays[i]['x'])
+
+    def test_ragged_dict_groupby_non_scalar(self):
+        arrays = [{'x': np.arange(i, i+2), 'y': i} for i in range(2)]
+        rds = Dataset(arrays, kdims=['x', 'y'], datatype=['ragged'])
+        with self.assertRaises(ValueError):
+            rds.groupby('x')
+
+    def test_ragged_polygon_holes(self):
+        hole = np.array([[1, 1], [2, 1], [2, 2]])
+        polys = [{'x': [0, 10, 10, 0], 'y': [0, 0, 10, 10], 'holes': [[hole]], 'z': 1},
+                 {'x': [20, 30, 30, np.NaN, 40, 50, 50], 'y': [0, 0, 10, np.NaN, 0, 0, 10], 'z': 2}]
+        rpolys = Polygons(polys, vdims='z', datatype=['ragged'])
+        mpolys = Polygons(polys, vdims='z', datatype=['multitabular'])
+        self.assertTrue(rpolys.has_holes)
+        self.assertEqual(rpolys.holes(), mpolys.holes())
+        self.assertEqual(rpolys.dimension_values('z', expanded=False), np.array([1, 2]))
+
+    def test_ragged_polygon_holes_mismatch_raises(self):
+        hole = np.array([[1, 1], [2, 1], [2, 2]])
+        polys = [{'x': [0, 10, 10, np.NaN, 0, 1, 1], 'y': [0, 0, 10, np.NaN, 10, 10, 11],
+                  'holes': [[hole]]}]
+        with self.assertRaises(DataError):
+            Polygons(polys, datatype=['ragged'])
@@ -230,6 +230,9 @@ class XArrayInterfaceTests(GridInterfaceTests):
     def test_dataset_sample_hm_alias(self):
         raise SkipTest("Not supported")
 
+    def test_sample_points_skips_unmatched(self):
+        raise SkipTest("Not supported")
+
 
 
 @attr(optional=1)
@@ -4,6 +4,7 @@ Unit tests of the Callable object that wraps user callbacks. Also test
 how DynamicMap validates and invokes Callable based on its signature.
 """
 import param
+import numpy as np
 import sys
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.element import Scatter
@@ -366,3 +367,60 @@ class TestDynamicMapInvocation(ComparisonTestCase):
         self.assertEqual(dmap['Test'], Scatter([(1, 2)], label='Test'))
 
 
+
+
+class TestCallableMemoization(ComparisonTestCase):
+
+    def setUp(self):
+        self.calls = []
+        def callback(x):
+            self.calls.append(x)
+            return Scatter([(x, x)])
+        self.callback = callback
+
+    def test_callable_memoize_single_entry(self):
+        callable_obj = Callable(self.callback)
+        callable_obj(1)
+        callable_obj(2)
+        callable_obj(1)
+        self.assertEqual(self.calls, [1, 2, 1])
+        self.assertEqual(callable_obj.cache_info['evictions'], 2)
+
+    def test_callable_memoize_multiple_entries(self):
+        callable_obj = Callable(self.callback, memoize_size=2)
+        callable_obj(1)
+        callable_obj(2)
+        self.assertIs(callable_obj(1), callable_obj(1))
+        self.assertEqual(self.calls, [1, 2])
+        info = callable_obj.cache_info
+        self.assertEqual((info['hits'], info['misses'], info['entries']), (2, 2, 2))
+
+    def test_callable_memoize_lru_eviction(self):
+        callable_obj = Callable(self.callback, memoize_size=2)
+        callable_obj(1)
+        callable_obj(2)
+        callable_obj(1)
+        callable_obj(3)
+        callable_obj(1)
+        callable_obj(2)
+        self.assertEqual(self.calls, [1, 2, 3, 2])
+
+    def test_callable_memoize_nbytes_eviction(self):
+        def callback(x):
+            self.calls.append(x)
+            return Scatter(np.random.rand(100, 2))
+        callable_obj = Callable(callback, memoize_size=10, memoize_nbytes=2000)
+        callable_obj(1)
+        callable_obj(2)
+        callable_obj(3)
+        info = callable_obj.cache_info
+        self.assertEqual(info['entries'], 1)
+        self.assertEqual(info['nbytes'], 1600)
+        self.assertEqual(info['evictions'], 2)
+
+    def test_callable_clear_cache(self):
+        callable_obj = Callable(self.callback, memoize_size=2)
+        callable_obj(1)
+        callable_obj.clear_cache()
+        callable_obj(1)
+        self.assertEqual(self.calls, [1, 1])
@@ -1,6 +1,7 @@
 """
 Test cases for Dimension and Dimensioned object behaviour.
 """
+import pickle
 from unittest import SkipTest
 from holoviews.core import Dimensioned, Dimension
 from holoviews.element.comparison import ComparisonTestCase
@@ -44,6 +45,10 @@ class DimensionNameLabelTest(LoggingComparisonTestCase):
         self.log_handler.assertEndsWith('WARNING', substr)
         self.assertEqual(dim.label, 'Another test')
 
+    def test_dimension_pickle_retains_label(self):
+        dim = pickle.loads(pickle.dumps(Dimension(('test', 'A test'))))
+        self.assertEqual(dim.label, 'A test')
+
     def test_dimension_invalid_name(self):
         regexp = 'Dimension name must only be passed as the positional argument'
         with self.assertRaisesRegexp(KeyError, regexp):
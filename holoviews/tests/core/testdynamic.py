@@ -583,6 +583,79 @@ class DynamicCallableMemoize(ComparisonTestCase):
         self.assertEqual(dmap[()], Curve([1, 1, 1, 2, 2, 2]))
 
 
+class DynamicMapCache(ComparisonTestCase):
+
+    def setUp(self):
+        self.calls = []
+        def callback(x):
+            self.calls.append(x)
+            return Curve(np.arange(100))
+        self.callback = callback
+
+    def test_dynamic_cache_lru_eviction(self):
+        dmap = DynamicMap(self.callback, kdims=['x'], cache_size=2)
+        dmap[0]
+        dmap[1]
+        dmap[0]
+        dmap[2]
+        self.assertEqual(list(dmap.keys()), [0, 2])
+        self.assertEqual(self.calls, [0, 1, 2])
+
+    def test_dynamic_cache_nbytes_eviction(self):
+        dmap = DynamicMap(self.callback, kdims=['x'], cache_nbytes=3500)
+        for i in range(4):
+            dmap[i]
+        self.assertEqual(list(dmap.keys()), [2, 3])
+        info = dmap.cache_info
+        self.assertEqual(info['evictions'], 2)
+        self.assertEqual(info['nbytes'], 3200)
+
+    def test_dynamic_cache_info_hits(self):
+        dmap = DynamicMap(self.callback, kdims=['x'])
+        dmap[0]
+        dmap[0]
+        dmap[1]
+        info = dmap.cache_info
+        self.assertEqual((info['hits'], info['misses'], info['entries']), (1, 2, 2))
+
+    def test_dynamic_cache_spill(self):
+        dmap = DynamicMap(self.callback, kdims=['x'], cache_size=1, cache_spill=True)
+        dmap[0]
+        dmap[1]
+        self.assertEqual(dmap.cache_info['spilled'], 1)
+        self.assertEqual(dmap[0], Curve(np.arange(100)))
+        self.assertEqual(self.calls, [0, 1])
+        info = dmap.cache_info
+        self.assertEqual((info['spill_hits'], info['spilled'], info['hits']), (1, 1, 0))
+
+    def test_dynamic_cache_reset_clears_spill(self):
+        dmap = DynamicMap(self.callback, kdims=['x'], cache_size=1, cache_spill=True)
+        dmap[0]
+        dmap[1]
+        dmap.reset()
+        dmap[0]
+        self.assertEqual(self.calls, [0, 1, 0])
+        self.assertEqual(dmap.cache_info['spilled'], 0)
+
+    def test_dynamic_cache_spill_compacted(self):
+        dmap = DynamicMap(self.callback, kdims=['x'], cache_size=1, cache_spill=True)
+        for _ in range(10):
+            for i in range(3):
+                dmap[i]
+        spill = dmap._spill
+        spill._file.seek(0, 2)
+        self.assertLessEqual(spill._file.tell(), 2*spill.nbytes)
+        self.assertEqual(self.calls, [0, 1, 2])
+
+    def test_dynamic_cache_no_spill(self):
+        dmap = DynamicMap(self.callback, kdims=['x'], cache_size=1)
+        dmap[0]
+        dmap[1]
+        dmap[0]
+        self.assertEqual(self.calls, [0, 1, 0])
+        self.assertEqual(dmap.cache_info['spilled'], 0)
+
+
 class StreamSubscribersAddandClear(ComparisonTestCase):
 
     def setUp(self):
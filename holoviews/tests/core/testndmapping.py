@@ -120,6 +120,65 @@ class NdIndexableMappingTest(ComparisonTestCase):
         ndmap = NdMapping(self.init_item_odict, kdims=[self.dim1, self.dim2])
         self.assertEqual(ndmap[:, 0.0:3.0].keys(), [(1, 2.0)])
 
+    def test_ndmapping_slice_values_list(self):
+        ndmap = NdMapping([(i, i) for i in range(10)], kdims=['x'])
+        self.assertEqual(ndmap[[7, 2, 11]].keys(), [2, 7])
+
+    def test_ndmapping_slice_value_and_range(self):
+        ndmap = NdMapping([((i % 3, i), i) for i in range(12)], kdims=['x', 'y'])
+        self.assertEqual(ndmap[1, 2:8].keys(), [(1, 4), (1, 7)])
+
+    def test_ndmapping_slice_nan_keys_excluded(self):
+        ndmap = NdMapping([(np.nan, 'a'), (1., 'b'), (2., 'c')], kdims=['x'])
+        self.assertEqual(ndmap[1:].keys(), [1., 2.])
+
+    def test_ndmapping_slice_mixed_type_keys(self):
+        ndmap = NdMapping([(1, 'a'), ('B', 'b')], kdims=['x'], sort=False)
+        self.assertEqual(ndmap[['B']].keys(), ['B'])
+
+    def test_ndmapping_slice_after_setitem(self):
+        ndmap = NdMapping([(i, i) for i in range(5)], kdims=['x'])
+        self.assertEqual(ndmap[2:].keys(), [2, 3, 4])
+        ndmap[10] = 10
+        ndmap[-1] = -1
+        self.assertEqual(ndmap[2:].keys(), [2, 3, 4, 10])
+        self.assertEqual(ndmap.keys(), [-1, 0, 1, 2, 3, 4, 10])
+
+    def test_ndmapping_slice_after_pop(self):
+        ndmap = NdMapping([(i, i) for i in range(5)], kdims=['x'])
+        self.assertEqual(ndmap[2:].keys(), [2, 3, 4])
+        ndmap.pop(3)
+        self.assertEqual(ndmap[2:].keys(), [2, 4])
+
+    def test_ndmapping_index_updated_on_append(self):
+        ndmap = NdMapping([(i, i) for i in range(5)], kdims=['x'])
+        index = ndmap._index
+        ndmap[2:]
+        ndmap[5] = 5
+        self.assertIs(ndmap._index, index)
+        self.assertEqual(ndmap[4:].keys(), [4, 5])
+
+    def test_ndmapping_index_updated_on_pop(self):
+        ndmap = NdMapping([((i, i % 2), i) for i in range(6)], kdims=['x', 'y'])
+        index = ndmap._index
+        self.assertEqual(ndmap[:, 1].keys(), [(1, 1), (3, 1), (5, 1)])
+        ndmap.pop((3, 1))
+        self.assertIs(ndmap._index, index)
+        self.assertEqual(ndmap[:, 1].keys(), [(1, 1), (5, 1)])
+        self.assertEqual(ndmap[2:].keys(), [(2, 0), (4, 0), (5, 1)])
+
+    def test_ndmapping_index_append_changes_dtype(self):
+        ndmap = NdMapping([('a', 0), ('b', 1)], kdims=['x'])
+        self.assertEqual(ndmap['b':].keys(), ['b'])
+        ndmap['cde'] = 2
+        self.assertEqual(ndmap['c':].keys(), ['cde'])
+
+    def test_ndmapping_index_append_unsorted(self):
+        ndmap = NdMapping([(2, 'a'), (0, 'b')], kdims=['x'], sort=False)
+        self.assertEqual(ndmap[1:].keys(), [2])
+        ndmap[1] = 'c'
+        self.assertEqual(ndmap[1:].keys(), [2, 1])
+
     def test_idxmapping_unsorted(self):
         data = [('B', 1), ('C', 2), ('A', 3)]
         ndmap = MultiDimensionalMapping(data, sort=False)
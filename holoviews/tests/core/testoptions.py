@@ -525,6 +525,19 @@ class TestStoreInheritance(ComparisonTestCase):
         opts = Store.lookup_options('matplotlib', hist2, 'style').kwargs
         self.assertEqual(opts, {'style1': 'style_child', 'style2': 'style2'})
 
+    def test_lookup_options_cached(self):
+        self.lookup_options(self.hist, 'style')
+        hits = Store.lookup_stats()['hits']
+        self.assertEqual(self.lookup_options(self.hist, 'style').options,
+                         self.default_style)
+        self.assertEqual(Store.lookup_stats()['hits'], hits+1)
+
+    def test_lookup_options_invalidated_on_tree_update(self):
+        self.lookup_options(self.hist, 'style')
+        Store.options().Histogram = Options('style', style1='updated')
+        self.assertEqual(self.lookup_options(self.hist, 'style').options,
+                         dict(style1='updated', style2='style2'))
+
 
 @attr(optional=1) # Needs matplotlib
 class TestOptionTreeFind(ComparisonTestCase):
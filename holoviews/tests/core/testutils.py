@@ -17,9 +17,9 @@ except:
 
 from holoviews.core.util import (
     sanitize_identifier_fn, find_range, max_range, wrap_tuple_streams,
-    deephash, merge_dimensions, get_path, make_path_unique, compute_density,
+    deephash, hash_array, config, estimate_nbytes, merge_dimensions, get_path, make_path_unique, compute_density,
     date_range, dt_to_int, compute_edges, isfinite, cross_index, closest_match,
-    dimension_range
+    dimension_range, factorize, group_indices
 )
 from holoviews import Dimension, Element
 from holoviews.streams import PointerXY
@@ -138,6 +138,78 @@ class TestDeepHash(ComparisonTestCase):
                 OrderedDict([(1,'a'),(2,'b')]), np.int64(34)]
         self.assertNotEqual(deephash(obj1), deephash(obj2))
 
+    def test_deephash_numpy_dtype_inequality(self):
+        arr1 = np.array([1,2,3], dtype='int32')
+        arr2 = np.array([1,2,3], dtype='int64')
+        self.assertNotEqual(deephash(arr1), deephash(arr2))
+
+    def test_deephash_numpy_shape_inequality(self):
+        arr = np.arange(6)
+        self.assertNotEqual(deephash(arr.reshape(2, 3)), deephash(arr.reshape(3, 2)))
+
+    def test_deephash_numpy_noncontiguous_equality(self):
+        arr = np.arange(20).reshape(4, 5)
+        self.assertEqual(deephash(arr[:, ::2]), deephash(arr[:, ::2].copy()))
+
+    def test_deephash_numpy_datetime_inequality(self):
+        arr1 = np.array(['2017-01-01', '2017-01-02'], dtype='datetime64[ns]')
+        arr2 = np.array(['2017-01-01', '2017-01-03'], dtype='datetime64[ns]')
+        self.assertNotEqual(deephash(arr1), deephash(arr2))
+
+    def test_deephash_numpy_object_inequality(self):
+        arr1 = np.array(['A', 1], dtype=object)
+        arr2 = np.array(['B', 1], dtype=object)
+        self.assertNotEqual(deephash(arr1), deephash(arr2))
+
+    def test_deephash_dataframe_column_inequality(self):
+        if pd is None: raise SkipTest
+        self.assertNotEqual(deephash(pd.DataFrame({'a':[1,2,3],'b':[4,5,6]})),
+                            deephash(pd.DataFrame({'a':[1,2,3],'c':[4,5,6]})))
+
+    def test_deephash_dataframe_index_inequality(self):
+        if pd is None: raise SkipTest
+        self.assertNotEqual(deephash(pd.DataFrame({'a':[1,2,3]}, index=[0, 1, 2])),
+                            deephash(pd.DataFrame({'a':[1,2,3]}, index=[1, 2, 3])))
+
+    def test_hash_array_fingerprint(self):
+        arr1 = np.arange(100000)
+        arr2 = arr1.copy()
+        arr2[1] = -1
+        fingerprint, samples = config.hash_fingerprint_size, config.hash_fingerprint_samples
+        try:
+            config.hash_fingerprint_size = 1000
+            config.hash_fingerprint_samples = 10
+            self.assertEqual(hash_array(arr1), hash_array(arr2))
+            arr2[-1] = -1
+            self.assertNotEqual(hash_array(arr1), hash_array(arr2))
+        finally:
+            config.hash_fingerprint_size = fingerprint
+            config.hash_fingerprint_samples = samples
+
+
+class TestEstimateNbytes(ComparisonTestCase):
+
+    def test_estimate_nbytes_array(self):
+        self.assertEqual(estimate_nbytes(np.zeros(10)), 80)
+
+    def test_estimate_nbytes_dict_of_arrays(self):
+        self.assertEqual(estimate_nbytes({'x': np.zeros(10), 'y': np.zeros(5, dtype='int32')}), 100)
+
+    def test_estimate_nbytes_shared_arrays(self):
+        arr = np.zeros(10)
+        self.assertEqual(estimate_nbytes([arr, arr]), 80)
+
+    def test_estimate_nbytes_dataframe(self):
+        if pd is None: raise SkipTest
+        df = pd.DataFrame({'x': np.zeros(10)})
+        self.assertEqual(estimate_nbytes(df), 80 + df.index.nbytes)
+
+    def test_estimate_nbytes_element(self):
+        self.assertEqual(estimate_nbytes(Element(np.zeros(10))), 80)
+
+    def test_estimate_nbytes_unknown(self):
+        self.assertEqual(estimate_nbytes('string'), 0)
+
 
 class TestAllowablePrefix(ComparisonTestCase):
     """
@@ -734,6 +806,36 @@ class TestNumericUtilities(ComparisonTestCase):
 
 
 
+class TestGroupIndices(ComparisonTestCase):
+
+    def test_factorize_order_of_appearance(self):
+        codes, uniques = factorize(np.array([3, 1, 3, 2]))
+        self.assertEqual(codes, np.array([0, 1, 0, 2]))
+        self.assertEqual(uniques, np.array([3, 1, 2]))
+
+    def test_factorize_nan(self):
+        codes, uniques = factorize(np.array([3, np.NaN, 1, np.NaN]))
+        self.assertEqual(codes, np.array([0, 1, 2, 1]))
+        self.assertEqual(uniques, np.array([3, np.NaN, 1]))
+
+    def test_factorize_strings(self):
+        codes, uniques = factorize(np.array(['B', 'A', 'B'], dtype=object))
+        self.assertEqual(codes, np.array([0, 1, 0]))
+        self.assertEqual(list(uniques), ['B', 'A'])
+
+    def test_group_indices(self):
+        first, index, offsets = group_indices([np.array([1, 2, 1, 2, 3]),
+                                               np.array(['a', 'a', 'a', 'b', 'a'])])
+        self.assertEqual(first, np.array([0, 1, 3, 4]))
+        self.assertEqual(index, np.array([0, 2, 1, 3, 4]))
+        self.assertEqual(offsets, np.array([0, 2, 3, 4, 5]))
+
+    def test_group_indices_empty(self):
+        first, index, offsets = group_indices([np.array([])])
+        self.assertEqual(len(first), 0)
+        self.assertEqual(offsets, np.array([0]))
+
+
 class TestComputeEdges(ComparisonTestCase):
     """
     Tests for compute_edges function.
@@ -5,12 +5,13 @@ from unittest import SkipTest
 from nose.plugins.attrib import attr
 
 import numpy as np
-from holoviews.core.data import Dataset
+from holoviews.core.data import Dataset, RaggedData
 from holoviews.core import util
 from holoviews.element.chart import Points
 from holoviews.element.graphs import (
     Graph, Nodes, TriMesh, Chord, circular_layout, connect_edges,
     connect_edges_pd)
+from holoviews.element.util import quadratic_bezier
 from holoviews.element.comparison import ComparisonTestCase
 
 
@@ -74,6 +75,23 @@ class GraphTests(ComparisonTestCase):
             paths.append(np.array([start[:2], end[:2]]))
         self.assertEqual(segments, paths)
 
+    def test_graph_edge_segments_missing_node_raises(self):
+        graph = Graph(((self.source, self.target+10), self.nodes))
+        with self.assertRaises(ValueError):
+            connect_edges(graph)
+
+    def test_graph_edge_segments_pd_drops_missing_nodes(self):
+        nodes = Nodes(([0, 1, 2], [0, 1, 2], ['A', 'B', 'C']))
+        graph = Graph(((['A', 'B', 'C'], ['B', 'D', 'A']), nodes))
+        segments = connect_edges_pd(graph)
+        self.assertEqual(segments, [np.array([[0, 0], [1, 1]]),
+                                    np.array([[2, 2], [0, 0]])])
+
+    def test_graph_edgepaths_ragged(self):
+        edgepaths = self.graph.edgepaths
+        self.assertIsInstance(edgepaths.data, RaggedData)
+        self.assertEqual(edgepaths.split(datatype='array'), connect_edges(self.graph))
+
     def test_constructor_with_nodes_and_paths(self):
         paths = Graph(((self.source, self.target), self.nodes)).edgepaths
         graph = Graph(((self.source, self.target), self.nodes, paths.data))
@@ -214,6 +232,18 @@ class ChordTests(ComparisonTestCase):
         )
         self.assertEqual(chord.nodes, Nodes(nodes))
 
+    def test_chord_edgepaths(self):
+        chord = Chord([(0, 1, 1)], vdims=['z'])
+        start, end = (1, 0), (-1, np.sin(np.pi))
+        path = quadratic_bezier(start, end, (0.5, 0), (-0.5, end[1]/2.))
+        self.assertEqual(chord.edgepaths.split(datatype='array'), [path])
+
+    def test_chord_edgepaths_separate_chords(self):
+        chord = Chord([('A', 'B', 2), ('B', 'A', 3), ('A', 'A', 2)], vdims=['z'])
+        paths = chord.edgepaths.split(datatype='array')
+        self.assertEqual([len(p) for p in paths], [101, 152, 101])
+        self.assertEqual([np.isnan(p[:, 0]).sum() for p in paths], [1, 2, 1])
+
 
 
 class TriMeshTests(ComparisonTestCase):
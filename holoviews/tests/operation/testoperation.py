@@ -1,4 +1,6 @@
 import datetime as dt
+import gc
+import weakref
 
 import numpy as np
 from nose.plugins.attrib import attr
@@ -10,7 +12,10 @@ from holoviews.core.util import pd
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.operation.element import (operation, transform, threshold,
                                          gradient, contours, histogram,
-                                         interpolate_curve)
+                                         interpolate_curve, decimate,
+                                         downsample_image)
+from holoviews.element.util import (GridIndex, ImagePyramid, lttb_indices,
+                                    minmax_indices)
 
 class OperationTests(ComparisonTestCase):
     """
@@ -30,6 +35,35 @@ class OperationTests(ComparisonTestCase):
                                   for k, v in ndlayout.items()})
         self.assertEqual(op_ndlayout, doubled)
 
+    def test_operation_holomap_thread_executor(self):
+        hmap = HoloMap({i: Image(np.random.rand(10, 10)) for i in range(10)})
+        op_hmap = operation(hmap, op=lambda x, k: x.clone(x.data*2),
+                            executor='thread', chunksize=3)
+        self.assertEqual(op_hmap, hmap.clone([(k, v.clone(v.data*2, group='Operation'))
+                                              for k, v in hmap.items()]))
+
+    def test_operation_holomap_process_executor(self):
+        hmap = HoloMap({i: Image(np.random.rand(10, 10)) for i in range(4)})
+        self.assertEqual(histogram(hmap, executor='process'), histogram(hmap))
+
+    def test_operation_grid_thread_executor(self):
+        grid = GridSpace({i: Image(np.random.rand(10, 10)) for i in range(10)}, kdims=['X'])
+        op_grid = operation(grid, op=lambda x, k: x.clone(x.data*2), executor='thread')
+        doubled = grid.clone({k: v.clone(v.data*2, group='Operation')
+                              for k, v in grid.items()})
+        self.assertEqual(op_grid, doubled)
+
+    def test_operation_holomap_timings(self):
+        hmap = HoloMap({i: Image(np.random.rand(10, 10)) for i in range(3)})
+        op = operation.instance(op=lambda x, k: x)
+        op(hmap)
+        self.assertEqual(list(op.timings.keys()), [0, 1, 2])
+
+    def test_operation_invalid_executor(self):
+        hmap = HoloMap({i: Image(np.random.rand(10, 10)) for i in range(3)})
+        with self.assertRaisesRegexp(ValueError, 'executor must be one of'):
+            operation(hmap, op=lambda x, k: x, executor='gpu')
+
     def test_operation_grid(self):
         grid = GridSpace({i: Image(np.random.rand(10, 10)) for i in range(10)}, kdims=['X'])
         op_grid = operation(grid, op=lambda x, k: x.clone(x.data*2))
@@ -57,7 +91,6 @@ class OperationTests(ComparisonTestCase):
         op_img = gradient(img)
         self.assertEqual(op_img, img.clone(np.array([[3.162278, 3.162278], [3.162278, 3.162278]]), group='Gradient'))
 
-    @attr(optional=1) # Requires matplotlib
     def test_image_contours(self):
         img = Image(np.array([[0, 1, 0], [3, 4, 5.], [6, 7, 8]]))
         op_contours = contours(img, levels=[0.5])
@@ -67,14 +100,12 @@ class OperationTests(ComparisonTestCase):
                             vdims=img.vdims)
         self.assertEqual(op_contours, contour)
 
-    @attr(optional=1) # Requires matplotlib
     def test_image_contours_no_range(self):
         img = Image(np.zeros((2, 2)))
         op_contours = contours(img, levels=2)
         contour = Contours([], vdims=img.vdims)
         self.assertEqual(op_contours, contour)
 
-    @attr(optional=1) # Requires matplotlib
     def test_qmesh_contours(self):
         qmesh = QuadMesh(([0, 1, 2], [1, 2, 3], np.array([[0, 1, 0], [3, 4, 5.], [6, 7, 8]])))
         op_contours = contours(qmesh, levels=[0.5])
@@ -84,7 +115,6 @@ class OperationTests(ComparisonTestCase):
                             vdims=qmesh.vdims)
         self.assertEqual(op_contours, contour)
 
-    @attr(optional=1) # Requires matplotlib
     def test_qmesh_curvilinear_contours(self):
         x = y = np.arange(3)
         xs, ys = np.meshgrid(x, y)
@@ -97,15 +127,44 @@ class OperationTests(ComparisonTestCase):
                             vdims=qmesh.vdims)
         self.assertEqual(op_contours, contour)
 
-    @attr(optional=1) # Requires matplotlib
     def test_image_contours_filled(self):
         img = Image(np.array([[0, 1, 0], [3, 4, 5.], [6, 7, 8]]))
         op_contours = contours(img, filled=True, levels=[2, 2.5])
-        data = [[(0., 0.166667, 2.25), (0.333333, 0.166667, 2.25), (0.333333, 0.2, 2.25), (0., 0.222222, 2.25),
-                 (-0.333333, 0.111111, 2.25), (-0.333333, 0.055556, 2.25), (0., 0.166667, 2.25)]]
+        data = [[(-0.333333, 0.111111, 2.25), (-0.333333, 0.055556, 2.25), (0., 0.166667, 2.25),
+                 (0.333333, 0.166667, 2.25), (0.333333, 0.2, 2.25), (0., 0.222222, 2.25),
+                 (-0.333333, 0.111111, 2.25)]]
         polys = Polygons(data, vdims=img.vdims[0].clone(range=(2, 2.5)))
         self.assertEqual(op_contours, polys)
 
+    def test_image_contours_auto_levels(self):
+        img = Image(np.array([[0, 1, 0], [3, 4, 5.], [6, 7, 8]]))
+        op_contours = contours(img, levels=3)
+        self.assertEqual(op_contours.dimension_values(2, expanded=False),
+                         np.array([2., 4., 6.]))
+
+    def test_image_contours_drop_levels_outside_data_range(self):
+        xs = np.linspace(-3, 3, 7)
+        img = Image((xs, xs, np.tile(xs, (7, 1))))
+        op_contours = contours(img, levels=5)
+        self.assertEqual(op_contours.dimension_values(2, expanded=False),
+                         np.array([-2., -1., 0., 1., 2.]))
+        self.assertEqual(op_contours.range(0), (-2, 2))
+
+    def test_image_contours_filled_hole(self):
+        img = Image(np.array([[0, 0, 0, 0], [0, 2, 2, 0], [0, 2, 2, 0], [0, 0, 0, 0.]]),
+                    bounds=(0, 0, 4, 4))
+        op_contours = contours(img, filled=True, levels=[-1, 1, 3])
+        outer, inner = op_contours.split()
+        self.assertEqual(outer.dimension_values(2, expanded=False), np.array([0]))
+        self.assertEqual(len(outer.holes()[0][0]), 1)
+        self.assertEqual(inner.holes(), [[[]]])
+        self.assertEqual(inner.range(0), (1, 3))
+
+    def test_image_contours_nan(self):
+        arr = np.array([[0, 1, 0], [3, np.NaN, 5.], [6, 7, 8]])
+        op_contours = contours(Image(arr), levels=[0.5])
+        self.assertEqual(len(op_contours), 0)
+
     def test_points_histogram(self):
         points = Points([float(i) for i in range(10)])
         op_hist = histogram(points, num_bins=3)
@@ -299,6 +358,103 @@ class OperationTests(ComparisonTestCase):
         curve = Curve((dates_interp, [0, 0, 1, 1, 2, 2, 3]))
         self.assertEqual(interpolated, curve)
 
+    def test_decimate_index_matches_select(self):
+        xs, ys = np.random.rand(2, 1000)
+        points = Points((xs, ys))
+        decimated = decimate(points, dynamic=False, max_samples=1000,
+                             x_range=(0.2, 0.6), y_range=(0.1, 0.5))
+        self.assertEqual(decimated, points.select(x=(0.2, 0.6), y=(0.1, 0.5)))
+
+    def test_decimate_random_max_samples(self):
+        points = Points(np.random.rand(1000, 2))
+        decimated = decimate(points, dynamic=False, max_samples=100)
+        self.assertEqual(len(decimated), 100)
+
+    def test_decimate_lttb_curve(self):
+        xs = np.arange(1000)
+        curve = Curve((xs, np.sin(xs/50.)))
+        decimated = decimate(curve, dynamic=False, max_samples=50, mode='lttb',
+                             x_range=(0, 1000), y_range=(-1, 1.1))
+        self.assertEqual(len(decimated), 50)
+        self.assertEqual(decimated.range(0), (0, 999))
+
+    def test_decimate_minmax_curve(self):
+        curve = Curve(([0, 1, 2, 3, 4, 5, 6, 7], [0, 5, 1, 2, 7, 3, 4, 6]))
+        decimated = decimate(curve, dynamic=False, max_samples=4, mode='minmax',
+                             x_range=(0, 8), y_range=(0, 8))
+        self.assertEqual(decimated, curve.iloc[[0, 1, 4, 5]])
+
+    def test_grid_index_query(self):
+        index = GridIndex([0, 1, 2, np.nan, 3], [0, 1, 2, 1, 3], bins=2)
+        self.assertEqual(index.query((1, 3), (0, 3)), np.array([1, 2]))
+
+    def test_lttb_indices_keeps_endpoints_and_peak(self):
+        ys = np.zeros(100)
+        ys[37] = 10
+        indices = lttb_indices(np.arange(100), ys, 10)
+        self.assertEqual(indices[[0, -1]], np.array([0, 99]))
+        self.assertIn(37, indices)
+
+    def test_minmax_indices(self):
+        indices = minmax_indices(np.arange(6), [3, 1, 2, 0, 5, 4], 4)
+        self.assertEqual(indices, np.array([0, 1, 3, 4]))
+
+    def test_image_pyramid_mean_levels(self):
+        pyramid = ImagePyramid(np.arange(16.).reshape(4, 4))
+        self.assertEqual(len(pyramid.levels), 3)
+        self.assertEqual(pyramid.levels[1], np.array([[2.5, 4.5], [10.5, 12.5]]))
+        self.assertEqual(pyramid.levels[2], np.array([[7.5]]))
+
+    def test_image_pyramid_max_pads_odd_shape(self):
+        pyramid = ImagePyramid(np.arange(9).reshape(3, 3), aggregator='max')
+        self.assertEqual(pyramid.levels[1], np.array([[4., 5], [7, 8]]))
+
+    def test_image_pyramid_level_selection(self):
+        pyramid = ImagePyramid(np.zeros((16, 16)))
+        self.assertEqual(pyramid.level(1.5), 0)
+        self.assertEqual(pyramid.level(5), 2)
+        self.assertEqual(pyramid.level(1000), 4)
+
+    def test_downsample_image_full_view(self):
+        img = Image(np.arange(16.).reshape(4, 4), bounds=(0, 0, 4, 4))
+        downsampled = downsample_image(img, dynamic=False, width=2, height=2)
+        expected = Image(np.array([[2.5, 4.5], [10.5, 12.5]]), bounds=(0, 0, 4, 4))
+        self.assertEqual(downsampled, expected)
+
+    def test_downsample_image_zoomed_tile(self):
+        img = Image(np.arange(64.).reshape(8, 8), bounds=(0, 0, 8, 8))
+        downsampled = downsample_image(img, dynamic=False, width=2, height=2,
+                                       x_range=(0, 4), y_range=(4, 8))
+        expected = Image(np.array([[4.5, 6.5], [20.5, 22.5]]), bounds=(0, 4, 4, 8))
+        self.assertEqual(downsampled, expected)
+
+    def test_downsample_image_odd_size_drops_padding(self):
+        img = Image(np.arange(25.).reshape(5, 5), bounds=(0, 0, 5, 5))
+        downsampled = downsample_image(img, dynamic=False, width=2, height=2)
+        expected = Image(np.array([[8., 10.], [18., 20.]]), bounds=(0, 0, 4, 4))
+        self.assertEqual(downsampled, expected)
+
+    def test_downsample_image_odd_size_within_bounds(self):
+        img = Image(np.arange(9.).reshape(3, 3), bounds=(0, 0, 3, 3))
+        downsampled = downsample_image(img, dynamic=False, width=1, height=1)
+        l, b, r, t = downsampled.bounds.lbrt()
+        self.assertTrue(l >= 0 and b >= 0 and r <= 3 and t <= 3)
+
+    def test_downsample_image_small_image_unchanged(self):
+        img = Image(np.random.rand(10, 10))
+        self.assertIs(downsample_image(img, dynamic=False), img)
+
+    def test_downsample_image_pyramid_released_with_data(self):
+        op = downsample_image.instance(dynamic=False, width=2, height=2)
+        frames = [Image(np.random.rand(8, 8)) for _ in range(3)]
+        refs = []
+        for frame in frames:
+            op(frame)
+            refs.append(weakref.ref(op._pyramids['mean'][1]))
+        del frames, frame
+        gc.collect()
+        self.assertEqual([ref() is None for ref in refs], [True, True, False])
+
     def test_stack_area_overlay(self):
         areas = Area([1, 2, 3]) * Area([1, 2, 3])
         stacked = Area.stack(areas)
@@ -48,6 +48,28 @@ class KDEOperationTests(ComparisonTestCase):
         area = Area((xs, ys), 'Value', ('Value_density', 'Value Density'))
         self.assertEqual(kde, area)
 
+    def test_univariate_kde_fft(self):
+        np.random.seed(1)
+        dist = Distribution(np.random.randn(1000))
+        ys = univariate_kde(dist, method='scipy').dimension_values(1)
+        fft_ys = univariate_kde(dist, method='fft').dimension_values(1)
+        self.assertLess(np.abs(ys-fft_ys).max(), ys.max()*0.01)
+
+    def test_univariate_kde_fft_bandwidth_bin_range(self):
+        np.random.seed(1)
+        dist = Distribution(np.random.randn(1000))
+        kde = univariate_kde(dist, method='scipy', bandwidth=0.5, bin_range=(0, 1))
+        fft_kde = univariate_kde(dist, method='fft', bandwidth=0.5, bin_range=(0, 1))
+        self.assertEqual(kde.dimension_values(0), fft_kde.dimension_values(0))
+        ys, fft_ys = kde.dimension_values(1), fft_kde.dimension_values(1)
+        self.assertLess(np.abs(ys-fft_ys).max(), ys.max()*0.01)
+
+    def test_univariate_kde_fft_flat_distribution(self):
+        dist = Distribution([1, 1, 1])
+        kde = univariate_kde(dist, n_samples=5, bin_range=(0, 4), method='fft')
+        area = Area([], 'Value', ('Value_density', 'Value Density'))
+        self.assertEqual(kde, area)
+
     def test_bivariate_kde(self):
         kde = bivariate_kde(self.bivariate, n_samples=2, x_range=(0, 4),
                             y_range=(0, 4), contours=False)
@@ -55,6 +77,34 @@ class KDEOperationTests(ComparisonTestCase):
                     bounds=(-2, -2, 6, 6), vdims=['Density'])
         self.assertEqual(kde, img)
 
+    def test_bivariate_kde_fft(self):
+        np.random.seed(1)
+        bivariate = Bivariate(np.random.multivariate_normal([0, 0], [[1, 0.5], [0.5, 1]], 1000))
+        img = bivariate_kde(bivariate, contours=False, method='scipy')
+        fft_img = bivariate_kde(bivariate, contours=False, method='fft')
+        self.assertEqual(img.bounds.lbrt(), fft_img.bounds.lbrt())
+        zs, fft_zs = img.dimension_values(2), fft_img.dimension_values(2)
+        self.assertLess(np.abs(zs-fft_zs).max(), zs.max()*0.01)
+
+    def test_bivariate_kde_fft_correlated(self):
+        np.random.seed(1)
+        xs = np.random.randn(2000)
+        bivariate = Bivariate((xs, 2*xs+np.random.randn(2000)))
+        kwargs = dict(contours=False, x_range=(-4, 4), y_range=(-10, 10))
+        img = bivariate_kde(bivariate, method='scipy', **kwargs)
+        fft_img = bivariate_kde(bivariate, method='fft', **kwargs)
+        zs, fft_zs = img.dimension_values(2), fft_img.dimension_values(2)
+        self.assertLess(np.abs(zs-fft_zs).max(), zs.max()*0.002)
+
+    def test_bivariate_kde_fft_strongly_correlated(self):
+        np.random.seed(1)
+        xs = np.random.randn(2000)
+        bivariate = Bivariate((xs, 2*xs+np.random.randn(2000)*0.3))
+        img = bivariate_kde(bivariate, contours=False, method='scipy')
+        fft_img = bivariate_kde(bivariate, contours=False, method='fft')
+        zs, fft_zs = img.dimension_values(2), fft_img.dimension_values(2)
+        self.assertLess(np.abs(zs-fft_zs).max(), zs.max()*0.01)
+
     def test_bivariate_kde_contours(self):
         np.random.seed(1)
         bivariate = Bivariate(np.random.rand(100, 2))
@@ -1,18 +1,21 @@
 from datetime import datetime as dt
 from unittest import SkipTest
 
+import numpy as np
+
 from holoviews.core.options import Store
 from holoviews.core.spaces import DynamicMap
 from holoviews.element import Table
 from holoviews.element.comparison import ComparisonTestCase
-from holoviews.streams import CDSStream
+from holoviews.streams import CDSStream, TableWindow
 
 try:
+    from bokeh.document import Document
     from bokeh.models.widgets import (
          NumberEditor, NumberFormatter, DateFormatter,
         DateEditor, StringFormatter, StringEditor, IntEditor
     )
-    from holoviews.plotting.bokeh.callbacks import CDSCallback
+    from holoviews.plotting.bokeh.callbacks import CDSCallback, TableWindowCallback
     from holoviews.plotting.bokeh.renderer import BokehRenderer
     bokeh_renderer = BokehRenderer.instance(mode='server')
 except:
@@ -73,3 +76,29 @@ class TestBokehTablePlot(ComparisonTestCase):
         plot.update(('b',))
         self.assertEqual(sorted(plot.handles['source'].data.keys()), ['b'])
         self.assertEqual(plot.handles['plot'].columns[0].title, 'b')
+
+    def test_table_paginated(self):
+        table = Table((range(100), range(100, 0, -1)), 'x', 'y').options(page_size=10)
+        plot = bokeh_renderer.get_plot(table)
+        self.assertEqual(plot.handles['source'].data['x'], np.arange(10))
+        self.assertIsNot(plot.state, plot.handles['plot'])
+        self.assertFalse(plot.handles['plot'].sortable)
+        self.assertEqual(plot.handles['page_slider'].end, 99)
+        self.assertIsInstance(plot.callbacks[0], TableWindowCallback)
+
+    def test_table_paginated_window_stream(self):
+        table = Table((range(100), range(100, 0, -1)), 'x', 'y').options(page_size=10)
+        window = TableWindow(source=table)
+        plot = bokeh_renderer.get_plot(table, doc=Document())
+        window.event(start=20)
+        self.assertEqual(plot.handles['source'].data['x'], np.arange(20, 30))
+        self.assertEqual(plot.handles['page_slider'].value, 20)
+
+    def test_table_paginated_sort_and_filter(self):
+        table = Table((range(100), range(100, 0, -1)), 'x', 'y').options(page_size=10)
+        window = TableWindow(source=table)
+        plot = bokeh_renderer.get_plot(table, doc=Document())
+        window.event(sort='-x', filters={'x': (0, 25)}, start=90)
+        self.assertEqual(plot.handles['source'].data['x'], np.arange(9, -1, -1))
+        self.assertEqual(plot.handles['page_slider'].end, 24)
+        self.assertEqual(plot.handles['page_slider'].value, 15)
@@ -74,3 +74,12 @@ class MPLRendererTest(ComparisonTestCase):
     def test_render_mp4(self):
         data, metadata = self.renderer.components(self.map1, 'mp4')
         self.assertIn("<source src='data:video/mp4", data['text/html'])
+
+    def test_render_gif_parallel(self):
+        progress = []
+        renderer = MPLRenderer.instance(dpi=100, processes=2, chunksize=1,
+                                        progress_bar=progress.append)
+        data, _ = renderer(self.map1, 'gif')
+        expected, _ = MPLRenderer.instance(dpi=100)(self.map1, 'gif')
+        self.assertEqual(data, expected)
+        self.assertEqual(progress, [50., 100.])
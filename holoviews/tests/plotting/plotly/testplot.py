@@ -1,10 +1,13 @@
+import base64
+import json
+
 from collections import deque
 from unittest import SkipTest
 from nose.plugins.attrib import attr
 
 import numpy as np
 
-from holoviews.core import Store, DynamicMap, GridSpace
+from holoviews.core import Store, DynamicMap, GridSpace, HoloMap
 from holoviews.element import Curve, Scatter3D, Image
 from holoviews.element.comparison import ComparisonTestCase
 from holoviews.streams import PointerX
@@ -110,6 +113,30 @@ class TestPlotlyPlotInstantiation(ComparisonTestCase):
         self.assertEqual(state['data'][0]['x'], np.arange(10))
         self.assertEqual(state['data'][0]['y'], np.arange(10, 20))
 
+    def test_diff_encodes_arrays(self):
+        plot = plotly_renderer.get_plot(Curve([1, 2, 3]))
+        diff = json.loads(plotly_renderer.diff(plot))
+        y = diff['data'][0]['y']
+        self.assertEqual(y['dtype'], 'float64')
+        self.assertEqual(np.frombuffer(base64.b64decode(y['bdata']), '<f8'), np.array([1., 2, 3]))
+
+    def test_diff_incremental_patch(self):
+        hmap = HoloMap({i: Curve([1, 2, i]) for i in range(2)})
+        plot = plotly_renderer.get_plot(hmap)
+        plot.update((0,))
+        self.assertFalse(plotly_renderer.diff(plot, serialize=False)['patch'])
+        plot.update((1,))
+        diff = plotly_renderer.diff(plot, serialize=False, incremental=True)
+        self.assertTrue(diff['patch'])
+        self.assertEqual(diff['data'][0]['y'], np.array([1, 2, 1]))
+        self.assertNotIn('x', diff['data'][0])
+
+    def test_diff_incremental_unchanged(self):
+        plot = plotly_renderer.get_plot(Curve([1, 2, 3]))
+        plotly_renderer.diff(plot)
+        diff = plotly_renderer.diff(plot, serialize=False, incremental=True)
+        self.assertEqual(diff, {'data': [{}], 'layout': {}, 'patch': True})
+
     def test_layout_instantiate_subplots(self):
         layout = (Curve(range(10)) + Curve(range(10)) + Image(np.random.rand(10,10)) +
                   Curve(range(10)) + Curve(range(10)))
@@ -613,6 +613,38 @@ class TestPlotUtils(ComparisonTestCase):
         dist = _get_min_distance_numpy(Points((X.flatten(), Y.flatten())))
         self.assertEqual(dist, 1.0)
 
+    def test_get_min_distance_ignores_duplicates_and_nans(self):
+        points = Points(([0, 0, 3, np.nan, 1], [0, 0, 4, 1, 1]))
+        self.assertEqual(get_min_distance(points), np.sqrt(2))
+        self.assertEqual(_get_min_distance_numpy(points), np.sqrt(2))
+
+    def test_get_min_distance_numpy_matches_kdtree(self):
+        try:
+            import scipy # noqa
+        except:
+            raise SkipTest('Test requires scipy')
+        points = Points(np.random.rand(1000, 2))
+        self.assertEqual(_get_min_distance_numpy(points),
+                         get_min_distance(points, max_samples=None))
+
+    def test_get_min_distance_numpy_sampled_matches_kdtree(self):
+        try:
+            import scipy # noqa
+        except:
+            raise SkipTest('Test requires scipy')
+        points = Points(np.random.rand(1000, 2)*[1, 10])
+        self.assertEqual(_get_min_distance_numpy(points, max_samples=100),
+                         get_min_distance(points, max_samples=100))
+
+    def test_get_min_distance_numpy_vertical_line(self):
+        points = Points((np.zeros(5000), np.arange(5000)*0.5))
+        self.assertEqual(_get_min_distance_numpy(points), 0.5)
+
+    def test_get_min_distance_sampled_estimate(self):
+        points = Points(np.random.rand(1000, 2))
+        exact = get_min_distance(points, max_samples=None)
+        self.assertTrue(get_min_distance(points, max_samples=100) >= exact)
+
 
 class TestRangeUtilities(ComparisonTestCase):
 
@@ -0,0 +1,36 @@
+"""
+Tests that importing holoviews does not eagerly load optional
+dependencies or plotting extensions.
+"""
+import subprocess
+import sys
+from unittest import SkipTest
+
+from holoviews.element.comparison import ComparisonTestCase
+
+
+class TestLazyImports(ComparisonTestCase):
+
+    def _loaded_modules(self, modules, setup=''):
+        code = ("import sys; {setup}import holoviews; "
+                "print(','.join(m for m in {modules!r} if m in sys.modules))")
+        output = subprocess.check_output([sys.executable, '-c',
+                                          code.format(setup=setup, modules=modules)])
+        return [m for m in output.decode('utf-8').strip().split(',') if m]
+
+    def test_import_defers_plotting_and_ipython(self):
+        modules = ('IPython', 'holoviews.ipython', 'holoviews.plotting',
+                   'holoviews.plotting.bokeh', 'holoviews.plotting.mpl',
+                   'holoviews.plotting.plotly')
+        self.assertEqual(self._loaded_modules(modules), [])
+
+    def test_import_defers_optional_data_backends(self):
+        self.assertEqual(self._loaded_modules(('xarray', 'dask')), [])
+
+    def test_import_loads_notebook_extension_in_ipython(self):
+        try:
+            import IPython # noqa (availability check)
+        except ImportError:
+            raise SkipTest('IPython not available')
+        loaded = self._loaded_modules(('holoviews.ipython',), setup='import IPython; ')
+        self.assertEqual(loaded, ['holoviews.ipython'])
@@ -6,6 +6,8 @@ from distutils.version import LooseVersion
 from unittest import SkipTest
 
 import param
+from holoviews.core.data import Dataset
+from holoviews.core.data.interface import DataStatistics
 from holoviews.core.spaces import DynamicMap
 from holoviews.core.util import pd
 from holoviews.element import Points
@@ -610,10 +612,62 @@ class TestPipeStream(ComparisonTestCase):
         pipe.event(data='Test')
         self.assertEqual(pipe.data, 'Test')
 
+    def test_pipe_memoize_hashkey_equal_data(self):
+        pipe = Pipe(data=np.arange(10), memoize=True)
+        hashkey = pipe.hashkey
+        pipe.send(np.arange(10))
+        self.assertEqual(pipe.hashkey, hashkey)
+
+    def test_pipe_memoize_hashkey_inplace_update(self):
+        data = np.arange(10)
+        pipe = Pipe(data=data, memoize=True)
+        hashkey = pipe.hashkey
+        data[0] = 10
+        pipe.send(data)
+        self.assertNotEqual(pipe.hashkey, hashkey)
+
+    def test_pipe_send_invalidates_range_statistics(self):
+        data = np.array([[0, 2], [1, 3]])
+        ds = Dataset(data, kdims=['x'], vdims=['y'])
+        ds.range('y')
+        pipe = Pipe(data=data)
+        data[:, 1] *= 10
+        pipe.send(data)
+        self.assertEqual(DataStatistics.cached(ds, 'y', 'range'), None)
+        self.assertEqual(ds.range('y'), (20, 30))
+
+    def test_pipe_memoize_hashkey_renamed(self):
+        pipe = Pipe(data=np.arange(10), memoize=True, rename={'data': 'values'})
+        self.assertEqual(list(pipe.hashkey), ['values'])
+
 
 
 class TestBufferStream(ComparisonTestCase):
 
+    def test_buffer_dict_extends_range_statistics(self):
+        buff = Buffer({'x': np.array([0, 1]), 'y': np.array([2, 3])}, length=10)
+        Dataset(buff.data, kdims=['x'], vdims=['y']).range('y')
+        buff.send({'x': np.array([2]), 'y': np.array([-1])})
+        ds = Dataset(buff.data, kdims=['x'], vdims=['y'])
+        self.assertEqual(DataStatistics.cached(ds, 'y', 'range'), (-1, 3))
+
+    def test_buffer_dict_full_does_not_extend_range_statistics(self):
+        buff = Buffer({'x': np.array([0, 1]), 'y': np.array([2, 3])}, length=2)
+        Dataset(buff.data, kdims=['x'], vdims=['y']).range('y')
+        buff.send({'x': np.array([2]), 'y': np.array([-1])})
+        ds = Dataset(buff.data, kdims=['x'], vdims=['y'])
+        self.assertEqual(DataStatistics.cached(ds, 'y', 'range'), None)
+        self.assertEqual(ds.range('y'), (-1, 3))
+
+    def test_buffer_dataframe_extends_range_statistics(self):
+        if pd is None:
+            raise SkipTest('Pandas not available')
+        buff = Buffer(pd.DataFrame({'x': [0, 1], 'y': [2, 3]}), length=10, index=False)
+        Dataset(buff.data, kdims=['x'], vdims=['y']).range('y')
+        buff.send(pd.DataFrame({'x': [2], 'y': [-1]}))
+        ds = Dataset(buff.data, kdims=['x'], vdims=['y'])
+        self.assertEqual(DataStatistics.cached(ds, 'y', 'range'), (-1, 3))
+
     # Arrays
 
     def test_init_buffer_array(self):
@@ -753,3 +807,62 @@ class TestBufferStream(ComparisonTestCase):
         buff = Buffer(data)
         buff.clear()
         self.assertEqual(buff.data, data.iloc[:0, :].reset_index())
+
+    # Ring buffer
+
+    def test_buffer_ring_array_send(self):
+        buff = Buffer(np.array([[0, 1]]), length=2, ring=True)
+        for i in range(1, 4):
+            buff.send(np.array([[i, i+1]]))
+        self.assertEqual(buff.data, np.array([[2, 3], [3, 4]]))
+
+    def test_buffer_ring_array_patch_larger_than_length(self):
+        buff = Buffer(np.array([[0, 1]]), length=1, ring=True)
+        buff.send(np.array([[1, 2], [2, 3]]))
+        self.assertEqual(buff.data, np.array([[2, 3]]))
+
+    def test_buffer_ring_dict_send(self):
+        buff = Buffer({'x': np.array([0]), 'y': np.array([1])}, length=3, ring=True)
+        for i in range(1, 6):
+            buff.send({'x': np.array([i]), 'y': np.array([i+1])})
+        self.assertEqual(buff.data, {'x': np.array([3, 4, 5]), 'y': np.array([4, 5, 6])})
+
+    def test_buffer_ring_dict_send_is_view(self):
+        buff = Buffer({'x': np.array([0]), 'y': np.array([1])}, length=3, ring=True)
+        buff.send({'x': np.array([1]), 'y': np.array([2])})
+        prev = buff.data
+        buff.send({'x': np.array([2]), 'y': np.array([3])})
+        self.assertTrue(np.shares_memory(prev['x'], buff.data['x']))
+        self.assertEqual(buff._chunk_length, 1)
+
+    def test_buffer_ring_dict_promotes_dtype(self):
+        buff = Buffer({'x': np.array([0]), 'y': np.array([1])}, length=3, ring=True)
+        buff.send({'x': np.array([1]), 'y': np.array([2])})
+        buff.send({'x': np.array([2]), 'y': np.array([2.5])})
+        self.assertEqual(buff.data, {'x': np.array([0, 1, 2]), 'y': np.array([1, 2, 2.5])})
+
+    def test_buffer_ring_dframe_send_with_index(self):
+        if pd is None:
+            raise SkipTest('Pandas not available')
+        data = pd.DataFrame({'x': np.array([0]), 'y': np.array([1])})
+        buff = Buffer(data, length=2, ring=True)
+        for i in range(1, 4):
+            buff.send(pd.DataFrame({'x': np.array([i]), 'y': np.array([i+1])}))
+        dframe = pd.DataFrame({'x': np.array([2, 3]), 'y': np.array([3, 4])}, index=[0, 0])
+        self.assertEqual(buff.data, dframe.reset_index().set_index(dframe.index))
+
+    def test_buffer_ring_dframe_keeps_index(self):
+        if pd is None:
+            raise SkipTest('Pandas not available')
+        data = pd.DataFrame({'x': [0, 1]}, index=pd.Index([5, 6], name='i'))
+        buff = Buffer(data, length=3, index=False, ring=True)
+        buff.send(pd.DataFrame({'x': [2, 3]}, index=pd.Index([7, 8], name='i')))
+        self.assertEqual(buff.data, pd.DataFrame({'x': [1, 2, 3]},
+                                                 index=pd.Index([6, 7, 8], name='i')))
+
+    def test_clear_buffer_ring_dict(self):
+        buff = Buffer({'x': np.array([0]), 'y': np.array([1])}, length=3, ring=True)
+        buff.send({'x': np.array([1]), 'y': np.array([2])})
+        buff.clear()
+        buff.send({'x': np.array([2]), 'y': np.array([3])})
+        self.assertEqual(buff.data, {'x': np.array([2]), 'y': np.array([3])})